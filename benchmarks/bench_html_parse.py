@@ -0,0 +1,48 @@
+"""
+Compare full, strained and sliced parsing of a provider page
+
+    python -m benchmarks.bench_html_parse
+"""
+from benchmarks import fixtures
+from recleagueparser import soup as rs
+import tracemalloc
+import timeit
+
+TABLE = ('table', {'class': 'statTable sortable noSortImages'})
+MODES = [rs.PARSE_FULL, rs.PARSE_STRAINED, rs.PARSE_SLICED]
+FEATURES = [rs.DEFAULT_FEATURES, rs.FAST_FEATURES]
+
+
+def measure(html_doc, mode, features, number=10):
+    def run():
+        # Drop the kept trees so every run really parses
+        rs.cache_clear()
+        soup = rs.parse_elements(html_doc, *TABLE, mode=mode,
+                                 features=features)
+        return soup.find(*TABLE)
+    seconds = timeit.timeit(run, number=number) / number
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    html_doc = fixtures.sportsengine_schedule(games=30, noise=2000)
+    print("Page size: {:.0f} KB".format(len(html_doc) / 1024.0))
+    print("{:<12} {:<12} {:>10} {:>12}".format(
+        'parser', 'mode', 'ms', 'peak KB'))
+    for features in FEATURES:
+        resolved = rs.resolve_features(features)
+        if resolved != features:
+            print("{:<12} not installed, skipping".format(features))
+            continue
+        for mode in MODES:
+            seconds, peak = measure(html_doc, mode, features)
+            print("{:<12} {:<12} {:>10.2f} {:>12.0f}".format(
+                features, mode, seconds * 1000, peak / 1024.0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Measure what importing each of the package's entry points costs on a cold
+start, and which heavy dependencies it drags in
+
+    python -m benchmarks.bench_import
+"""
+import subprocess
+import statistics
+import json
+import sys
+
+RUNS = 5
+HEAVY = ['bs4', 'requests', 'parsedatetime', 'icalendar', 'googleapiclient']
+ENTRY_POINTS = [
+    'import recleagueparser.schedules',
+    'from recleagueparser.schedules import ScheduleFactory',
+    'from recleagueparser.schedules import ICSSchedule',
+    'from recleagueparser.schedules import PointstreakSchedule',
+    'from recleagueparser.player_stats import PlayerStatsFactory',
+    'from recleagueparser.player_stats import SportsEnginePlayerStats',
+    'from recleagueparser.team_stats import TeamStatsFactory',
+    'from recleagueparser.rsvp_tools import RsvpToolFactory',
+    'from recleagueparser.rsvp_tools import BenchApp',
+]
+
+# Run in a fresh interpreter, so nothing is imported yet
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+try:
+    exec({statement!r})
+    error = None
+except ImportError as e:
+    error = str(e)
+seconds = time.perf_counter() - start
+print(json.dumps(dict(seconds=seconds, error=error,
+                      loaded=[m for m in {heavy!r} if m in sys.modules])))
+'''
+
+
+def measure(statement, runs=RUNS):
+    """
+    Returns:
+        the median secs the import took, the heavy modules it loaded, and
+        the ImportError it hit (if any)
+    """
+    samples = list()
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', PROBE.format(
+            statement=statement, heavy=HEAVY)])
+        samples.append(json.loads(output.decode()))
+    seconds = statistics.median(sample['seconds'] for sample in samples)
+    return seconds, samples[-1]['loaded'], samples[-1]['error']
+
+
+def main():
+    print("{:<64} {:>8}  {}".format('entry point', 'ms', 'heavy imports'))
+    for statement in ENTRY_POINTS:
+        seconds, loaded, error = measure(statement)
+        note = ', '.join(loaded) or '-'
+        if error:
+            note = '{} (failed: {})'.format(note, error)
+        print("{:<64} {:>8.1f}  {}".format(statement, seconds * 1000, note))
+
+
+if __name__ == '__main__':
+    main()
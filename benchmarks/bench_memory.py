@@ -0,0 +1,88 @@
+"""
+Measure how much memory each parsed Game, Player and Team keeps alive once
+the page it came from has been dropped
+
+    python -m benchmarks.bench_memory
+"""
+from benchmarks import fixtures
+from recleagueparser.schedules import PointstreakSchedule
+from recleagueparser.schedules import SportsEngineSchedule
+from recleagueparser.player_stats.player import Player
+from recleagueparser.team_stats.team import Team
+from recleagueparser import response_cache as rc
+from recleagueparser import parsetime as pt
+from recleagueparser import soup as rs
+import tracemalloc
+import gc
+import mock
+
+GAMES = 500
+OBJECTS = 10000
+
+
+class MockResponse(object):
+    def __init__(self, text):
+        self.text = text
+        self.status_code = 200
+        self.headers = {}
+
+
+def clear_shared_caches():
+    """Drop what's kept for the next fetch/parse rather than by the objects"""
+    rc.DEFAULT_CACHE.clear()
+    rs.cache_clear()
+    pt.cache_clear()
+
+
+def retained_bytes(build, count):
+    """Bytes per object still allocated after :build: returns and the
+    rest of its garbage is collected"""
+    clear_shared_caches()
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    clear_shared_caches()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del kept
+    return used / float(count)
+
+
+def schedule_games(schedule_class, html_doc, **kwargs):
+    def build():
+        with mock.patch('recleagueparser.refreshable.get',
+                        return_value=MockResponse(html_doc)):
+            return schedule_class(**kwargs).games
+    return build
+
+
+def players():
+    return [Player('Player {}'.format(i), i % 99, 10, i % 7, i % 5)
+            for i in range(OBJECTS)]
+
+
+def teams():
+    return [Team('Team {}'.format(i), i % 30, 10, 5, 4, 1, 30, 25)
+            for i in range(OBJECTS)]
+
+
+def main():
+    cases = [
+        ('Game (pointstreak)', schedule_games(
+            PointstreakSchedule, fixtures.pointstreak_schedule(GAMES),
+            team_id=1, season_id=1), GAMES),
+        ('Game (sportsengine)', schedule_games(
+            SportsEngineSchedule, fixtures.sportsengine_schedule(GAMES, 0),
+            team_id=1, season_id=1), GAMES),
+        ('Player', players, OBJECTS),
+        ('Team', teams, OBJECTS),
+    ]
+    print("{:<22} {:>14}".format('object', 'bytes each'))
+    for name, build, count in cases:
+        print("{:<22} {:>14.0f}".format(name, retained_bytes(build, count)))
+
+
+if __name__ == '__main__':
+    main()
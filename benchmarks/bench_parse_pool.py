@@ -0,0 +1,92 @@
+"""
+Refresh a whole league's schedules (one page per team) with their parsing
+in-process, then in parse pools of more and more worker processes, to show
+how parsing scales across cores
+
+    python -m benchmarks.bench_parse_pool [--teams 50] [--games 100]
+"""
+from benchmarks import fixtures
+from benchmarks.bench_memory import MockResponse, clear_shared_caches
+from recleagueparser.schedules import ScheduleFactory
+from recleagueparser.parse_pool import ParsePool
+import argparse
+import time
+import mock
+import os
+import re
+
+TEAM_ID_REGEX = re.compile(r'team_instance/(\d+)')
+
+
+def refresh_league(pages, threads, pool=None):
+    """
+    Build every team's schedule at once, as a fresh deployment would
+
+    Returns:
+        the secs it took, and how many games were parsed
+    """
+    def get(url, **kwargs):
+        return MockResponse(pages[int(TEAM_ID_REGEX.search(url).group(1))])
+
+    specs = [dict(schedule_type='sportsengine', team_id=team, season_id=1,
+                  parse_pool=pool) for team in pages]
+    clear_shared_caches()
+    with mock.patch('recleagueparser.refreshable.get', get):
+        start = time.perf_counter()
+        results = ScheduleFactory.create_many(specs, max_workers=threads)
+        seconds = time.perf_counter() - start
+    for result in results:
+        if result.error is not None:
+            raise result.error
+    return seconds, sum(len(result.schedule.games) for result in results)
+
+
+def worker_counts(cores):
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--teams', type=int, default=50)
+    parser.add_argument('--games', type=int, default=100,
+                        help="Games on each team's page")
+    parser.add_argument('--threads', type=int, default=16,
+                        help="Schedules built at the same time")
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--workers', type=int, nargs='*',
+                        help="Pool sizes to try (default: 1, 2, 4... up to "
+                             "one per core)")
+    args = parser.parse_args()
+
+    # A separate string per team, so no two teams share a parsed tree
+    pages = dict((team, fixtures.sportsengine_schedule(args.games))
+                 for team in range(args.teams))
+    cores = os.cpu_count() or 1
+    print("{} teams x {} games, {} fetch threads, {} cores".format(
+        args.teams, args.games, args.threads, cores))
+    print("{:<14} {:>9} {:>10} {:>8}".format(
+        'parsing', 'secs', 'games/s', 'speedup'))
+    baseline = None
+    for workers in [None] + (args.workers or worker_counts(cores)):
+        pool = ParsePool(workers) if workers else None
+        try:
+            refresh_league(pages, args.threads, pool)  # Start the workers
+            seconds, games = min(
+                refresh_league(pages, args.threads, pool)
+                for _ in range(args.repeats))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        baseline = baseline or seconds
+        label = '{} workers'.format(workers) if workers else 'in-process'
+        print("{:<14} {:>9.3f} {:>10.0f} {:>7.2f}x".format(
+            label, seconds, games / seconds, baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,290 @@
+"""
+Run every provider's parser offline against small, typical and huge
+(league-wide) pages, and save the results so versions can be compared
+
+    python -m benchmarks.bench_providers [--cold] [--compare FILE]
+
+Pages are generated by benchmarks.fixtures. To use pages recorded from the
+real sites instead, save them as '<case>-<page>-<size>.html' (or '.ics') in
+a directory and pass it with --fixture-dir, ex: 'pointstreak-schedule-
+typical.html'. Results are saved to benchmarks/results/<label>.json
+"""
+from benchmarks import fixtures
+from benchmarks.bench_memory import MockResponse, clear_shared_caches
+from recleagueparser.schedules import PointstreakSchedule
+from recleagueparser.schedules import SportsEngineSchedule
+from recleagueparser.schedules import DashPlatformSchedule
+from recleagueparser.schedules.ics_schedule import ICSSchedule
+from recleagueparser.player_stats import SportsEnginePlayerStats
+from recleagueparser.player_stats.dashplatform_player_stats import (
+    DashPlatformPlayerStats)
+from recleagueparser.team_stats import SportsEngineTeamStats
+from recleagueparser.team_stats import DashPlatformTeamStats
+from recleagueparser import response_cache as rc
+from recleagueparser import parsetime as pt
+from recleagueparser import soup as rs
+from collections import namedtuple
+import subprocess
+import contextlib
+import tracemalloc
+import argparse
+import datetime
+import platform
+import tempfile
+import timeit
+import json
+import mock
+import gc
+import os
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+SIZES = ['small', 'typical', 'huge']
+REPEATS = {'small': 20, 'typical': 10, 'huge': 2}
+NOISE = {'small': 100, 'typical': 500, 'huge': 2000}
+SCHEDULE_GAMES = {'small': (10, 1), 'typical': (30, 1), 'huge': (2000, 10)}
+PLAYERS = {'small': 10, 'typical': 20, 'huge': 1000}
+TEAMS = {'small': 6, 'typical': 12, 'huge': 300}
+
+# A page a case fetches: its name (for recorded fixtures), a piece of the
+# URL it's served at, and a function making its synthetic text for a size
+Page = namedtuple('Page', ['name', 'url_part', 'make'])
+# A parser to benchmark: the pages it reads, and a function building its
+# result (a list of parsed items) from a dict of page name -> page text
+Case = namedtuple('Case', ['name', 'pages', 'build'])
+
+
+def schedule_page(make, noisy=True):
+    def page(size):
+        games, per_week = SCHEDULE_GAMES[size]
+        if noisy:
+            return make(games=games, per_week=per_week, noise=NOISE[size])
+        return make(games=games, per_week=per_week)
+    return page
+
+
+def sized_page(make, counts, **kwargs):
+    def page(size):
+        return make(counts[size], noise=NOISE[size], **kwargs)
+    return page
+
+
+def ics_games(pages):
+    # Calendars are read from disk, as they would be for a local file
+    with tempfile.NamedTemporaryFile('w', suffix='.ics', delete=False) as f:
+        f.write(pages['calendar'])
+    try:
+        return ICSSchedule(file=f.name).games
+    finally:
+        os.remove(f.name)
+
+
+def benchapp_players(pages):
+    from recleagueparser.rsvp_tools.benchapp import BenchApp
+    tool = BenchApp('user', 'password', finance=True)
+    players = list(tool.get_next_game_data().get('all', []))
+    tool.get_team_fee_stats()
+    return players
+
+
+CASES = [
+    Case('pointstreak', [Page('schedule', '', schedule_page(
+        fixtures.pointstreak_schedule, noisy=False))],
+        lambda pages: PointstreakSchedule(team_id=1, season_id=1).games),
+    Case('sportsengine', [Page('schedule', '', schedule_page(
+        fixtures.sportsengine_schedule))],
+        lambda pages: SportsEngineSchedule(team_id=1, season_id=1).games),
+    Case('dashplatform', [Page('schedule', '', schedule_page(
+        fixtures.dashplatform_schedule))],
+        lambda pages: DashPlatformSchedule(team_id=1, company_id='x').games),
+    Case('ics', [Page('calendar', '', schedule_page(
+        fixtures.ics_calendar, noisy=False))],
+         ics_games),
+    Case('sportsengine_players', [Page('stats', '', sized_page(
+        fixtures.sportsengine_player_stats, PLAYERS))],
+        lambda pages: SportsEnginePlayerStats(
+            team_id=1, season_id=1).roster_list),
+    Case('dashplatform_players', [Page('stats', '', sized_page(
+        fixtures.dashplatform_player_stats, PLAYERS))],
+        lambda pages: DashPlatformPlayerStats(
+            team_id=1, company_id='x', username='user',
+            password='password').roster_list),
+    Case('sportsengine_teams', [Page('stats', '', sized_page(
+        fixtures.sportsengine_team_stats, TEAMS))],
+        lambda pages: SportsEngineTeamStats(
+            league_id=1, season_id=1).standings),
+    Case('dashplatform_teams', [Page('stats', '', sized_page(
+        fixtures.dashplatform_team_stats, TEAMS))],
+        lambda pages: DashPlatformTeamStats(
+            team_id=1, company_id='x').standings),
+    Case('benchapp', [
+        Page('next_game', '/schedule/next-event', sized_page(
+            fixtures.benchapp_next_game, PLAYERS)),
+        Page('finances', '/team/finances/', sized_page(
+            fixtures.benchapp_finances, PLAYERS))],
+         benchapp_players),
+]
+
+
+class RecordedSession(object):
+    """Stands in for a requests Session, serving the recorded pages"""
+
+    def __init__(self, get):
+        self.get = get
+
+    def post(self, url, **kwargs):
+        return MockResponse('')
+
+    def send(self, request, **kwargs):
+        return MockResponse('')
+
+
+@contextlib.contextmanager
+def offline(case, pages):
+    """Serve a case's pages for every fetch made while it's built"""
+    def get(url, **kwargs):
+        for page in case.pages:
+            if page.url_part in url:
+                return MockResponse(pages[page.name])
+        raise ValueError("No recorded page for {}".format(url))
+    with mock.patch('recleagueparser.refreshable.get', get), \
+            mock.patch('recleagueparser.sessions.new_session',
+                       lambda url: RecordedSession(get)):
+        yield
+
+
+def load_pages(case, size, fixture_dir=None):
+    pages = dict()
+    for page in case.pages:
+        recorded = None
+        if fixture_dir:
+            for ext in ('html', 'ics'):
+                path = os.path.join(fixture_dir, '{0}-{1}-{2}.{3}'.format(
+                    case.name, page.name, size, ext))
+                if os.path.exists(path):
+                    recorded = path
+                    break
+        if recorded:
+            with open(recorded, encoding='utf-8') as f:
+                pages[page.name] = f.read()
+        else:
+            pages[page.name] = page.make(size)
+    return pages
+
+
+def forget_fetches(cold=False):
+    """Make the next build fetch and parse its pages from scratch"""
+    rc.DEFAULT_CACHE.clear()
+    rs.cache_clear()
+    if cold:
+        pt.cache_clear()
+
+
+def measure(case, pages, repeats, cold=False):
+    """
+    Returns:
+        a dict of the items parsed, time per build and per item, and the
+        peak and retained memory (and blocks) of one build
+    """
+    def run():
+        forget_fetches(cold)
+        return case.build(pages)
+
+    with offline(case, pages):
+        items = len(run())  # Warm up, and count what's parsed
+        seconds = timeit.timeit(run, number=repeats) / repeats
+
+        forget_fetches(cold)
+        gc.collect()
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        kept = case.build(pages)
+        peak = tracemalloc.get_traced_memory()[1] - base
+        clear_shared_caches()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - base
+        blocks = sum(stat.count for stat in
+                     tracemalloc.take_snapshot().statistics('filename'))
+        tracemalloc.stop()
+        del kept
+
+    page_bytes = sum(len(text.encode('utf-8')) for text in pages.values())
+    return dict(items=items, page_kb=page_bytes / 1024.0,
+                ms=seconds * 1000, us_per_item=seconds * 1e6 / max(items, 1),
+                peak_kb=peak / 1024.0, retained_kb=retained / 1024.0,
+                retained_blocks=blocks)
+
+
+def default_label():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'local'
+
+
+def change(new, old):
+    if not old:
+        return ''
+    return '{:+.0f}%'.format((new - old) * 100.0 / old)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--cases', nargs='*', help="Only run these cases")
+    parser.add_argument('--sizes', nargs='*', default=SIZES, choices=SIZES)
+    parser.add_argument('--cold', action='store_true',
+                        help="Forget parsed dates and times between runs")
+    parser.add_argument('--fixture-dir', help="Directory of recorded pages")
+    parser.add_argument('--label', default=None,
+                        help="Name to save results under (default: the "
+                             "current git commit)")
+    parser.add_argument('--compare', help="Earlier results file to compare")
+    parser.add_argument('--no-save', action='store_true')
+    args = parser.parse_args()
+
+    baseline = dict()
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+
+    label = args.label or default_label()
+    results = dict()
+    print("{:<22} {:<8} {:>6} {:>8} {:>9} {:>9} {:>9} {:>9} {:>8}".format(
+        'case', 'size', 'items', 'page KB', 'ms', 'us/item', 'peak KB',
+        'kept KB', 'vs base'))
+    for case in CASES:
+        if args.cases and case.name not in args.cases:
+            continue
+        for size in args.sizes:
+            pages = load_pages(case, size, args.fixture_dir)
+            key = '{0}/{1}'.format(case.name, size)
+            try:
+                result = results[key] = measure(case, pages, REPEATS[size],
+                                                args.cold)
+            except ImportError as e:
+                # ex: an optional dependency of the provider isn't installed
+                print("{:<22} skipped, {}".format(case.name, e))
+                break
+            print("{:<22} {:<8} {:>6} {:>8.0f} {:>9.2f} {:>9.1f} {:>9.0f} "
+                  "{:>9.0f} {:>8}".format(
+                      case.name, size, result['items'], result['page_kb'],
+                      result['ms'], result['us_per_item'], result['peak_kb'],
+                      result['retained_kb'],
+                      change(result['us_per_item'], baseline.get(
+                          key, {}).get('us_per_item'))))
+
+    if not args.no_save:
+        if not os.path.isdir(RESULTS_DIR):
+            os.makedirs(RESULTS_DIR)
+        path = os.path.join(RESULTS_DIR, '{}.json'.format(label))
+        with open(path, 'w') as f:
+            json.dump(dict(label=label, cold=args.cold,
+                           python=platform.python_version(),
+                           timestamp=datetime.datetime.now().isoformat(),
+                           results=results), f, indent=2, sort_keys=True)
+        print("Saved results to {}".format(path))
+
+
+if __name__ == '__main__':
+    main()
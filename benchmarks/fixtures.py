@@ -0,0 +1,197 @@
+"""
+Synthetic provider pages for the benchmarks, shaped like the markup each
+parser in recleagueparser expects
+"""
+import datetime
+
+SEASON_START = datetime.datetime(2019, 9, 7, 20, 45)
+TEAMS = ['Bruins', 'Rangers', 'Flyers', 'Devils', 'Islanders', 'Penguins',
+         'Capitals', 'Sabres', 'Senators', 'Canadiens']
+
+
+def page_noise(size):
+    """Navigation/sidebar markup that surrounds the data on a real page"""
+    item = ('<li class="nav-item"><a href="/page/{0}">Page {0}</a>'
+            '<div class="promo"><span>Sponsor {0}</span></div></li>')
+    return '<ul class="site-nav">{0}</ul>'.format(
+        ''.join(item.format(i) for i in range(size)))
+
+
+def season_dates(games, per_week=1):
+    """Game times for a season, with :per_week: games on each game night"""
+    for i in range(games):
+        week, slot = divmod(i, per_week)
+        yield SEASON_START + datetime.timedelta(days=7 * week,
+                                                minutes=75 * slot)
+
+
+def sportsengine_schedule(games=30, noise=500, per_week=1):
+    row = ('<tr><td>{date}</td>'
+           '<td><div><a href="/game/{i}">{hs} - {as_}</a></div>'
+           '<div>F</div></td>'
+           '<td><div>{at}<a href="/team/{i}">{opp}</a></div></td>'
+           '<td>Rink {rink}</td>'
+           '<td><a href="/game/{i}"><span>{time}</span></a></td></tr>')
+    rows = ''.join(row.format(
+        i=i, date=dt.strftime('%a %b %d'), time=dt.strftime('%I:%M %p EST'),
+        hs=i % 5, as_=(i + 2) % 5, at='@ ' if i % 2 else '',
+        opp=TEAMS[i % len(TEAMS)], rink=i % 3)
+        for i, dt in enumerate(season_dates(games, per_week)))
+    return ('<html><body>{noise}<h2><a href="/team">Whalers</a></h2>'
+            '<table class="statTable sortable noSortImages"><tbody>{rows}'
+            '</tbody></table>{noise}</body></html>').format(
+                noise=page_noise(noise), rows=rows)
+
+
+def pointstreak_schedule(games=30, per_week=1):
+    row = ('<tr><td><img src="/logos/{i}.gif"/></td>'
+           '<td class="text-left"><a href="/team/1">Whalers</a>'
+           '<b> {hs}</b></td>'
+           '<td><img src="/logos/{i}.gif"/></td>'
+           '<td class="text-left"><a href="/team/{i}">{opp}</a>'
+           '<b> {as_}</b></td>'
+           '<td class="text-center">{date} </td><td>{time}</td>'
+           '<td class="text-right"><a href="/boxscore/{i}">final</a>'
+           '</td></tr>')
+    rows = ''.join(row.format(
+        i=i, date=dt.strftime('%a, %b %d'), time=dt.strftime('%I:%M %p'),
+        hs=i % 5, as_=(i + 2) % 5, opp=TEAMS[i % len(TEAMS)])
+        for i, dt in enumerate(season_dates(games, per_week)))
+    return ('<html><body><table class="nova-stats-table"><tbody>{rows}'
+            '</tbody></table></body></html>').format(rows=rows)
+
+
+def dashplatform_schedule(games=30, noise=500, per_week=1):
+    row = ('<div class="list-group-item">'
+           '<div class="event__date"><div><div>{date}</div>'
+           '<div>{day} {time}</div></div></div>'
+           '<div class="event__details">'
+           '<div><div><a href="/team/{i}">{opp}</a></div>'
+           '<div>{as_}</div></div>'
+           '<div><div><a href="/team/1">Whalers</a></div>'
+           '<div>{hs}</div></div>'
+           '<div><div><small>Ice Center</small></div></div>'
+           '<div><div><small>Rink {rink}</small></div></div>'
+           '</div></div>')
+    rows = ''.join(row.format(
+        i=i, date=dt.strftime('%a %b %d'), day=dt.strftime('%a'),
+        time=dt.strftime('%I:%M %p'), opp=TEAMS[i % len(TEAMS)],
+        hs=i % 5, as_=(i + 2) % 5, rink=i % 3)
+        for i, dt in enumerate(season_dates(games, per_week)))
+    return ('<html><body>{noise}<h2>Team Whalers</h2>'
+            '<div class="list-group">{rows}</div>'
+            '{noise}</body></html>').format(noise=page_noise(noise),
+                                            rows=rows)
+
+
+def ics_calendar(games=30, per_week=1):
+    event = ('BEGIN:VEVENT\r\n'
+             'UID:{i}@recleagueparser\r\n'
+             'SUMMARY:Whalers vs. {opp}\r\n'
+             'DTSTART;TZID=America/New_York:{start}\r\n'
+             'DTEND;TZID=America/New_York:{end}\r\n'
+             'LOCATION:Ice Center - Rink {rink}\r\n'
+             'DESCRIPTION:Regular season game {i}\r\n'
+             'END:VEVENT\r\n')
+    events = ''.join(event.format(
+        i=i, opp=TEAMS[i % len(TEAMS)], rink=i % 3,
+        start=dt.strftime('%Y%m%dT%H%M%S'),
+        end=(dt + datetime.timedelta(hours=1)).strftime('%Y%m%dT%H%M%S'))
+        for i, dt in enumerate(season_dates(games, per_week)))
+    return ('BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:recleagueparser\r\n'
+            '{0}END:VCALENDAR\r\n').format(events)
+
+
+def _player_name(i):
+    return 'Player {0:04d}'.format(i)
+
+
+def sportsengine_player_stats(players=20, goalies=2, noise=500):
+    table = ('<table class="dataTable statTable theme-stat-table"><tbody>'
+             '{0}</tbody></table>')
+    player_row = ('<tr><td>{n}</td><td><a href="/player/{i}">{name}</a></td>'
+                  '<td>10</td><td>{g}</td><td>{a}</td><td>{p}</td>'
+                  '<td>{pen}</td><td>{pim}</td></tr>')
+    goalie_row = ('<tr><td>{n}</td><td><a href="/player/{i}">{name}</a></td>'
+                  '<td>10</td><td>{w}</td><td>{l}</td><td>{ga}</td></tr>')
+    player_rows = ''.join(player_row.format(
+        i=i, n=i % 99, name=_player_name(i), g=i % 7, a=i % 5,
+        p=i % 7 + i % 5, pen=i % 3, pim=2 * (i % 3))
+        for i in range(players))
+    goalie_rows = ''.join(goalie_row.format(
+        i=i, n=i % 99, name=_player_name(players + i), w=i % 6, l=i % 4,
+        ga=20 + i) for i in range(goalies))
+    return '<html><body>{noise}{0}{1}{noise}</body></html>'.format(
+        table.format(player_rows), table.format(goalie_rows),
+        noise=page_noise(noise))
+
+
+def dashplatform_player_stats(players=20, noise=500):
+    row = ('<tr><td>{name}</td><td>{g}</td><td>{a}</td><td>{pim}</td>'
+           '<td>0</td><td>0</td><td>0</td><td>10</td></tr>')
+    rows = ''.join(row.format(name=_player_name(i), g=i % 7, a=i % 5,
+                              pim=2 * (i % 3)) for i in range(players))
+    return ('<html><body>{noise}<div id="teamStats"><table>'
+            '<tr><th>Name</th><th>G</th></tr>{rows}</table></div>'
+            '{noise}</body></html>').format(noise=page_noise(noise),
+                                            rows=rows)
+
+
+def _team_name(i):
+    return '{0} {1}'.format(TEAMS[i % len(TEAMS)], i // len(TEAMS))
+
+
+def sportsengine_team_stats(teams=10, noise=500):
+    row = ('<tr><td><a href="/team/{i}">{name}</a></td><td></td>'
+           '<td>{pts}</td><td>10</td><td>{w}</td><td>{l}</td><td>{t}</td>'
+           '<td>{gf}</td><td>{ga}</td><td>{w}-{l}-{t}</td></tr>')
+    rows = ''.join(row.format(
+        i=i, name=_team_name(i), pts=2 * (i % 8) + i % 2, w=i % 8,
+        l=8 - i % 8, t=i % 2, gf=30 + i, ga=40 - i % 20)
+        for i in range(teams))
+    return ('<html><body>{noise}<table class="statTable"><tbody>{rows}'
+            '</tbody></table>{noise}</body></html>').format(
+                noise=page_noise(noise), rows=rows)
+
+
+def dashplatform_team_stats(teams=10, noise=500):
+    row = ('<tr><td>{name}</td><td>{w}</td><td>{t}</td><td>{l}</td>'
+           '<td></td><td>{pts}</td><td>{gf}</td><td>{ga}</td><td></td>'
+           '<td></td><td>10</td></tr>')
+    rows = ''.join(row.format(
+        name=_team_name(i), pts=2 * (i % 8) + i % 2, w=i % 8, l=8 - i % 8,
+        t=i % 2, gf=30 + i, ga=40 - i % 20) for i in range(teams))
+    return ('<html><body>{noise}<table class="table table-striped">'
+            '<tr><th>Team</th></tr>{rows}</table>{noise}</body></html>'
+            ).format(noise=page_noise(noise), rows=rows)
+
+
+def benchapp_next_game(players=20, noise=500):
+    item = ('<li class="playerItem" id="player-{i}">'
+            '<a href="#profile">{name}<small>Sep 1</small></a>'
+            '<span class="playerPosition">{pos}</span>{note}'
+            '<div class="contextualWrapper" onclick="setAttendance('
+            '1,2,3,\'key\',{i},0,1);"></div></li>')
+    lists = dict((status, []) for status in
+                 ['attending', 'notAttending', 'waitlist', 'unknown'])
+    statuses = sorted(lists)
+    for i in range(players):
+        lists[statuses[i % len(statuses)]].append(item.format(
+            i=i, name=_player_name(i), pos='GFDF'[i % 4],
+            note='<div class="attendanceNote">Late</div>' if i % 5 == 0
+            else ''))
+    return '<html><body>{noise}{0}{noise}</body></html>'.format(
+        ''.join('<ul id="{0}">{1}</ul>'.format(status, ''.join(items))
+                for status, items in sorted(lists.items())),
+        noise=page_noise(noise))
+
+
+def benchapp_finances(players=20, noise=500):
+    row = '<tr><td>{name}</td><td>$250.00</td><td>${paid}.00</td></tr>'
+    rows = ''.join(row.format(name=_player_name(i), paid=250 * (i % 2))
+                   for i in range(players))
+    return ('<html><body>{noise}<table id="rosterList"><tbody>{rows}</tbody>'
+            '<tfoot><tr><td>Total</td><td>${fee:,}.00</td>'
+            '<td>${paid:,}.00</td></tr></tfoot></table>{noise}</body></html>'
+            ).format(noise=page_noise(noise), rows=rows, fee=250 * players,
+                     paid=250 * (players // 2))
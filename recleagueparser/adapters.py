@@ -0,0 +1,93 @@
+"""
+The requests transport adapter behind the shared session pool. Kept apart
+from recleagueparser.sessions so requests is only imported once something
+is actually fetched
+"""
+from recleagueparser import rate_limit
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+import time
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Methods safe to send again (named DEFAULT_METHOD_WHITELIST before 1.26)
+RETRY_METHODS = getattr(Retry, 'DEFAULT_ALLOWED_METHODS', None) or \
+    Retry.DEFAULT_METHOD_WHITELIST
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter that applies a timeout to requests made without one, and
+    sends each request once its host's rate limiter lets it
+
+    With a limiter, retries on RETRY_STATUSES are made here rather than by
+    urllib3, so each attempt takes its own token and the limiter sees every
+    throttled response (and its Retry-After) before the next one is sent
+
+    Args:
+        timeout (float/tuple): Default timeout, as for requests
+        limiter (HostLimiter): The host's rate limiter, if it has one
+        status_retries (int): Times to retry a response with one of
+            RETRY_STATUSES, when there's a limiter
+        backoff (float): Base pause before a retry the response didn't give
+            a Retry-After for, in secs, doubled on each retry
+    """
+
+    def __init__(self, timeout, limiter=None, status_retries=0, backoff=0,
+                 **kwargs):
+        self.timeout = timeout
+        self.limiter = limiter
+        self.status_retries = status_retries
+        self.backoff = backoff
+        super(TimeoutHTTPAdapter, self).__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        if self.limiter is None:
+            return super(TimeoutHTTPAdapter, self).send(request, **kwargs)
+        retries = self.status_retries \
+            if getattr(request, 'method', None) in RETRY_METHODS else 0
+        attempt = 0
+        while True:
+            response = self._send_limited(request, attempt, **kwargs)
+            if response.status_code not in RETRY_STATUSES or \
+                    attempt >= retries:
+                return response
+            response.close()  # Hands the connection back to the pool
+            attempt += 1
+
+    def _send_limited(self, request, attempt, **kwargs):
+        """Send one attempt once the limiter lets it, and report on it"""
+        self.limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = super(TimeoutHTTPAdapter, self).send(request, **kwargs)
+        except RequestException:
+            self.limiter.record()
+            raise
+        status = response.status_code
+        pause = None
+        if rate_limit.is_throttled(status):
+            pause = rate_limit.retry_after(response)
+            if pause is None:
+                pause = self.backoff * (2 ** attempt)
+        self.limiter.record(status, time.monotonic() - start, pause)
+        return response
+
+
+def pooled_adapter(pool_size, retries, backoff, timeout, limiter=None):
+    """Get an adapter for one host's pool of kept-alive connections"""
+    # With a limiter, urllib3 only retries failed connections and reads;
+    # the adapter retries responses itself
+    return TimeoutHTTPAdapter(
+        timeout=timeout,
+        limiter=limiter,
+        status_retries=retries,
+        backoff=backoff,
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries,
+                          backoff_factor=backoff,
+                          status_forcelist=() if limiter else RETRY_STATUSES,
+                          raise_on_status=False))
@@ -0,0 +1,158 @@
+"""
+Stale-while-revalidate refreshing: a worker thread keeps schedules and
+stats revalidated in the background, so reading them never waits on a
+fetch and parse
+"""
+import threading
+import weakref
+import logging
+import random
+import heapq
+import time
+
+DEFAULT_JITTER = 0.25  # Most extra delay per refresh, as part of its interval
+MIN_JITTER = 0.01  # So a refresh is always due after its data goes stale
+
+_logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher(object):
+    """
+    Revalidates registered objects on a worker thread, each one again every
+    time its data goes stale. Every refresh is pushed back by a random bit
+    of its interval, so objects registered together (ex: hundreds of teams
+    built at once) spread out instead of refreshing in lockstep
+
+    Objects are held weakly: one that's no longer used elsewhere just stops
+    being refreshed
+
+    Args:
+        jitter (float): The most extra delay to add to a refresh, as a
+            fraction of its interval
+        seed: Seeds the jitter, ex: for repeatable tests
+    """
+
+    def __init__(self, jitter=DEFAULT_JITTER, seed=None):
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._queue = list()  # heap of (due time, sequence, entry key)
+        self._entries = dict()  # id(object) -> [ref, method, interval, due]
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def delay(self, interval):
+        """Get when a refresh is next due, in secs from now"""
+        return interval * (1 + self._random.uniform(
+            MIN_JITTER, max(self.jitter, MIN_JITTER)))
+
+    def add(self, obj, method, interval):
+        """
+        Start revalidating :obj: every :interval: secs (plus jitter)
+
+        Args:
+            obj: The object to keep refreshed
+            method (str): The name of the method that refreshes it
+            interval (float): How long its data stays fresh, in secs
+        """
+        key = id(obj)
+        ref = weakref.ref(obj, lambda ref: self._forget(key, ref))
+        with self._condition:
+            self._entries[key] = [ref, method, interval, None]
+            self._schedule(key, time.monotonic() + self.delay(interval))
+            self._start()
+
+    def remove(self, obj):
+        with self._condition:
+            self._entries.pop(id(obj), None)
+
+    def request(self, obj):
+        """Revalidate :obj: as soon as possible (ex: a read found it stale)"""
+        with self._condition:
+            entry = self._entries.get(id(obj))
+            if entry is not None and entry[3] > time.monotonic():
+                self._schedule(id(obj), time.monotonic())
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None and \
+                self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _forget(self, key, ref):
+        with self._condition:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+    def _schedule(self, key, due):
+        # Only the entry's latest due time counts, older heap items are
+        # skipped when they come up
+        self._entries[key][3] = due
+        self._sequence += 1
+        heapq.heappush(self._queue, (due, self._sequence, key))
+        self._condition.notify_all()
+
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name='recleagueparser-refresher',
+                daemon=True)
+            self._thread.start()
+
+    def _next(self):
+        """Wait for the next refresh to come due"""
+        with self._condition:
+            while not self._stopped:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                due, _, key = self._queue[0]
+                entry = self._entries.get(key)
+                if entry is None or entry[3] != due:
+                    heapq.heappop(self._queue)  # Removed or rescheduled
+                    continue
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                heapq.heappop(self._queue)
+                return key, entry
+            return None, None
+
+    def _run(self):
+        while True:
+            key, entry = self._next()
+            if entry is None:
+                return
+            ref, method, interval, _ = entry
+            obj = ref()
+            if obj is None:
+                continue
+            try:
+                getattr(obj, method)()
+            except Exception:
+                _logger.exception("Background refresh of {} failed".format(
+                    type(obj).__name__))
+            with self._condition:
+                if self._entries.get(key) is entry:
+                    self._schedule(key, time.monotonic() +
+                                   self.delay(interval))
+            del obj
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_refresher():
+    """Get the shared BackgroundRefresher"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = BackgroundRefresher()
+        return _default
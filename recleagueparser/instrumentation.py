@@ -0,0 +1,255 @@
+"""
+Optional timing and counting hooks for the fetch, parse, extract and
+construct phases of a refresh. Nothing is measured until an observer is
+added, so the hooks left in the hot paths only cost a check each
+"""
+from recleagueparser import response_cache as rc
+from collections import defaultdict
+import contextlib
+import functools
+import threading
+import bisect
+import time
+import sys
+
+# Phases of a refresh
+FETCH = 'fetch'  # Getting the page (ex: send_get_request)
+PARSE = 'parse'  # Building the bs tree for the page
+EXTRACT = 'extract'  # Pulling the rows out of the tree (ex: parse_table)
+CONSTRUCT = 'construct'  # Building one Game from its row
+PHASES = [FETCH, PARSE, EXTRACT, CONSTRUCT]
+
+# Counters
+BYTES_FETCHED = 'bytes_fetched'
+CACHE_HITS = 'cache_hits'  # Fetches that didn't need a full download
+ROWS_PARSED = 'rows_parsed'
+ROWS_REUSED = 'rows_reused'  # Rows whose Game was kept from the last parse
+GAMES_CONSTRUCTED = 'games_constructed'
+
+# Observers are kept in a tuple that's replaced, never changed, so the hot
+# paths can read it without taking a lock
+_observers = ()
+_lock = threading.Lock()
+
+
+class Observer(object):
+    """
+    Receives the instrumentation events. Override whichever of the
+    callbacks are needed; both may be called from any thread
+    """
+
+    def on_span(self, provider, phase, seconds):
+        pass
+
+    def on_count(self, provider, counter, amount):
+        pass
+
+
+def add_observer(observer):
+    global _observers
+    with _lock:
+        _observers = _observers + (observer,)
+    return observer
+
+
+def remove_observer(observer):
+    global _observers
+    with _lock:
+        _observers = tuple(o for o in _observers if o is not observer)
+
+
+@contextlib.contextmanager
+def observing(observer):
+    """Send events to :observer: for the duration of a with block"""
+    add_observer(observer)
+    try:
+        yield observer
+    finally:
+        remove_observer(observer)
+
+
+def enabled():
+    return bool(_observers)
+
+
+def provider_name(provider):
+    """Name events after a provider's class, or a given name"""
+    return provider if isinstance(provider, str) else type(provider).__name__
+
+
+class _NullSpan(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span(object):
+
+    __slots__ = ('provider', 'phase', 'start')
+
+    def __init__(self, provider, phase):
+        self.provider = provider_name(provider)
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        for observer in _observers:
+            observer.on_span(self.provider, self.phase, seconds)
+        return False
+
+
+def span(provider, phase):
+    """
+    Time a with block as :phase: of :provider:'s refresh. Returns a shared
+    do-nothing context when nothing is observing
+    """
+    if not _observers:
+        return _NULL_SPAN
+    return _Span(provider, phase)
+
+
+def timed(phase):
+    """Time every call of a provider method as :phase:"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not _observers:
+                return method(self, *args, **kwargs)
+            with _Span(self, phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(provider, counter, amount=1):
+    if not _observers or not amount:
+        return
+    provider = provider_name(provider)
+    for observer in _observers:
+        observer.on_count(provider, counter, amount)
+
+
+def count_fetch(provider, result):
+    """Count the bytes and cache hits of a response_cache fetch"""
+    if not _observers:
+        return
+    count(provider, BYTES_FETCHED, len(result.text.encode('utf-8')))
+    if result.status != rc.FETCH_FULL:
+        count(provider, CACHE_HITS)
+
+
+class Collector(Observer):
+    """
+    Keeps a latency histogram per provider and phase, and the totals of
+    every counter, in memory
+
+    Args:
+        buckets (iterable): The upper bounds of the histogram buckets, in
+            secs. Anything slower goes in a final, unbounded bucket
+    """
+
+    BUCKETS = (0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.histograms = dict()
+        self.durations = dict()
+        self.counters = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def on_span(self, provider, phase, seconds):
+        key = (provider, phase)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [0] * (len(self.buckets)
+                                                          + 1)
+                self.durations[key] = [0, 0.0, 0.0]  # count, total, max
+            histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+            durations = self.durations[key]
+            durations[0] += 1
+            durations[1] += seconds
+            durations[2] = max(durations[2], seconds)
+
+    def on_count(self, provider, counter, amount):
+        with self._lock:
+            self.counters[(provider, counter)] += amount
+
+    @property
+    def providers(self):
+        with self._lock:
+            return sorted(set([provider for provider, _ in self.histograms] +
+                              [provider for provider, _ in self.counters]))
+
+    def histogram(self, provider, phase):
+        """
+        Returns:
+            a list of (upper bound in secs, or None for the last bucket,
+            calls) for one provider's phase
+        """
+        with self._lock:
+            histogram = list(self.histograms.get(
+                (provider, phase), [0] * (len(self.buckets) + 1)))
+        return list(zip(self.buckets + (None,), histogram))
+
+    def counter(self, provider, counter):
+        with self._lock:
+            return self.counters.get((provider, counter), 0)
+
+    def clear(self):
+        with self._lock:
+            self.histograms.clear()
+            self.durations.clear()
+            self.counters.clear()
+
+    def report(self, width=30):
+        """Describe every provider's latency histograms and counters"""
+        lines = list()
+        for provider in self.providers:
+            lines.append(provider)
+            phases = [phase for phase in PHASES
+                      if (provider, phase) in self.durations]
+            phases += sorted(phase for p, phase in self.durations
+                             if p == provider and phase not in PHASES)
+            for phase in phases:
+                calls, total, slowest = self.durations[(provider, phase)]
+                lines.append("  {:<10} calls={} mean={} max={}".format(
+                    phase, calls, _format_secs(total / calls),
+                    _format_secs(slowest)))
+                histogram = self.histogram(provider, phase)
+                most = max(calls for _, calls in histogram)
+                for bound, calls in histogram:
+                    if not calls:
+                        continue
+                    label = '<=' + _format_secs(bound) if bound is not None \
+                        else '>' + _format_secs(self.buckets[-1])
+                    lines.append("    {:>9} {:<{width}} {}".format(
+                        label, '#' * max(1, calls * width // most), calls,
+                        width=width))
+            counters = sorted((counter, amount) for (p, counter), amount
+                              in self.counters.items() if p == provider)
+            if counters:
+                lines.append("  " + " ".join("{}={}".format(counter, amount)
+                                             for counter, amount in counters))
+        return '\n'.join(lines)
+
+    def print_report(self, file=None):
+        print(self.report(), file=file or sys.stdout)
+
+
+def _format_secs(seconds):
+    if seconds < 0.001:
+        return '{:.0f}us'.format(seconds * 1e6)
+    if seconds < 1:
+        return '{:.1f}ms'.format(seconds * 1000)
+    return '{:.2f}s'.format(seconds)
@@ -0,0 +1,40 @@
+"""
+Deferred imports, so importing a package (or a factory) doesn't import
+every provider, and every provider's dependencies, up front
+"""
+import importlib
+import sys
+
+
+def load(path):
+    """Import and get the object at a dotted 'package.module.Name' path"""
+    module, _, name = path.rpartition('.')
+    return getattr(importlib.import_module(module), name)
+
+
+def exports(module_name, names):
+    """
+    Build a module's __getattr__ and __dir__ (PEP 562) for names it only
+    imports the first time they're used
+
+    Args:
+        module_name (str): The module's __name__
+        names (dict): name -> the (relative) module it's imported from
+
+    Returns:
+        the module's (__getattr__, __dir__) functions
+    """
+    def __getattr__(name):
+        source = names.get(name)
+        if source is None:
+            raise AttributeError("module {!r} has no attribute {!r}".format(
+                module_name, name))
+        value = getattr(importlib.import_module(source, module_name), name)
+        # Later lookups find it directly, without coming back here
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(names))
+
+    return __getattr__, __dir__
@@ -0,0 +1,140 @@
+"""
+Parsing in worker processes. Building trees and Games is pure Python, so
+however many threads fetch a league's pages, parsing them only ever uses
+one core; a ParsePool ships each fetched document to another process
+instead, and only gets the parsed records back
+
+Objects parse in a pool when given one as their parse_pool. They still
+fetch (and revalidate) their pages themselves, but the trees are built in
+the workers, so an object parsed in a pool has no html_table(s)
+
+What an object can't ship is declared by its class and each of its bases:
+a _local_state tuple of the attributes that stay in the parent, and a
+_fresh_state dict of the ones a worker starts over with (and their values)
+"""
+import threading
+import datetime
+import logging
+
+_logger = logging.getLogger(__name__)
+_default_pool = None
+_default_lock = threading.Lock()
+
+
+def local_state(cls):
+    """Get the attributes :cls: and its bases keep out of the workers"""
+    names = set()
+    for klass in cls.__mro__:
+        names.update(vars(klass).get('_local_state', ()))
+    return frozenset(names)
+
+
+def fresh_state(cls):
+    """Get the attributes (and their values) a worker starts :cls: with"""
+    state = dict()
+    for klass in reversed(cls.__mro__):
+        state.update(vars(klass).get('_fresh_state', {}))
+    return state
+
+
+def shipped_state(obj):
+    """Get the attributes of :obj: a worker needs to parse its document"""
+    local = local_state(type(obj))
+    fresh = fresh_state(type(obj))
+    state = dict()
+    for name, value in vars(obj).items():
+        if name in fresh:
+            state[name] = fresh[name]
+        elif name not in local:
+            state[name] = value
+    return state
+
+
+def parse_shipped(cls, state):
+    """
+    Rebuild an object from its shipped state in a worker, and parse its
+    document there
+
+    Returns:
+        the parsed data, as the object's snapshot_data
+    """
+    obj = cls.__new__(cls)
+    obj.__dict__.update(state)
+    obj._logger = logging.getLogger(cls.__name__)
+    # Just fetched by the parent, so nothing is fetched again here
+    obj.last_refresh = datetime.datetime.now()
+    return obj.parse_snapshot()
+
+
+class ParsePool(object):
+    """
+    Parses documents in worker processes
+
+    Args:
+        max_workers (int): How many processes to parse in. Defaults to one
+            per core
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        # Deferred, multiprocessing is slow to import
+        from concurrent.futures import ProcessPoolExecutor
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.max_workers)
+            return self._executor
+
+    def submit(self, obj):
+        """
+        Start parsing :obj:'s fetched document in a worker
+
+        Returns:
+            a Future of its snapshot_data
+        """
+        return self.executor.submit(parse_shipped, type(obj),
+                                    shipped_state(obj))
+
+    def parse(self, obj):
+        """
+        Parse :obj:'s fetched document in a worker, or right here if the
+        workers have died
+
+        Returns:
+            the parsed data, as :obj:'s snapshot_data
+        """
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            return self.submit(obj).result()
+        except BrokenProcessPool as err:
+            _logger.warning("Parse pool broken ({}), parsing in-process"
+                            .format(err))
+            with self._lock:
+                self._executor = None
+            return obj.parse_snapshot()
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+def default_pool():
+    """Get the ParsePool shared by everything that doesn't bring its own"""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = ParsePool()
+        return _default_pool
+
+
+def parse_pool(pool):
+    """Get a ParsePool from a pool, True (for the shared one) or None"""
+    if pool is True:
+        return default_pool()
+    return pool or None
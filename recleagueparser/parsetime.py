@@ -1,5 +1,7 @@
-import parsedatetime as pdt
+from collections import OrderedDict, namedtuple
+import threading
 import datetime
+import re
 
 
 DATE_DESCRIPTOR = "%a, %b %d"
@@ -12,6 +14,295 @@ CANCELLED_DESCRIPTOR = "{0} (CANCELLED)".format(DATE_DESCRIPTOR)
 # TIME_DESCRIPTOR = "%a %b %d %H:%M"  # 24-hour
 # TIME_DESCRIPTOR = "%a %b %d %I:%M%p"  # 12-hour
 
+DEFAULT_CACHE_SIZE = 4096
+# Strings of a shape no candidate format could read before the shape is
+# left to parsedatetime for good
+LEARN_ATTEMPTS = 8
+# Stands in for the year of a date read before its season's year is known.
+# A leap year, so Feb 29 can be read
+PLACEHOLDER_YEAR = 2000
+
+# Which route a string took through the ParseEngine
+PATH_MEMO = 'memo'
+PATH_FORMAT = 'strptime'
+PATH_FALLBACK = 'parsedatetime'
+
+# Candidate shapes providers emit, tried against parsedatetime's answer
+# the first time a new input shape is seen. Ambiguous numeric dates
+# (05/08/2020) are left to parsedatetime on purpose.
+DATE_FORMATS = ['%b %d %Y', '%B %d %Y', '%Y-%m-%d']
+TIME_FORMATS = ['%I:%M %p', '%I:%M%p', '%I %p', '%I%p', '%H:%M']
+
+# parsedatetime ignores a trailing timezone like 'EST', strptime can't
+TIMEZONE_REGEX = re.compile(r'\s+(?:[A-Z][SD]T|UTC|GMT)$')
+DIGIT_REGEX = re.compile(r'\d+')
+WORD_REGEX = re.compile(r'[A-Za-z]+')
+
+MONTH_ABBRS = ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
+               'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
+MONTH_NAMES = ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+               'august', 'september', 'october', 'november', 'december']
+MONTHS = dict([(m, i + 1) for i, m in enumerate(MONTH_ABBRS)] +
+              [(m, i + 1) for i, m in enumerate(MONTH_NAMES)])
+
+# Regex equivalents of the strptime directives used by the candidates
+DIRECTIVES = {
+    '%b': r'(?P<month>[A-Za-z]{3})',
+    '%B': r'(?P<month>[A-Za-z]{3,9})',
+    '%d': r'(?P<day>\d{1,2})',
+    '%m': r'(?P<monthnum>\d{1,2})',
+    '%Y': r'(?P<year>\d{4})',
+    '%I': r'(?P<hour12>\d{1,2})',
+    '%H': r'(?P<hour>\d{1,2})',
+    '%M': r'(?P<minute>\d{2})',
+    '%p': r'(?P<ampm>[AaPp][Mm])',
+}
+DIRECTIVE_REGEX = re.compile('|'.join(DIRECTIVES))
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class CompiledFormat(object):
+    """A strptime-style format compiled down to a single anchored regex"""
+
+    def __init__(self, fmt, has_date, has_time):
+        self.fmt = fmt
+        self.has_date = has_date
+        self.has_time = has_time
+        pattern = DIRECTIVE_REGEX.sub(lambda m: DIRECTIVES[m.group(0)],
+                                      re.escape(fmt).replace('\\%', '%'))
+        self.regex = re.compile('^{0}$'.format(pattern))
+
+    def __repr__(self):
+        return self.fmt
+
+    def match(self, text):
+        """
+        Read :text: with this format
+
+        Returns:
+            a (datetime, has_date, has_time) entry, or None if :text: can't
+            be read with this format
+        """
+        found = self.regex.match(text)
+        if found is None:
+            return None
+        parts = found.groupdict()
+        try:
+            year, month, day = 1900, 1, 1
+            if self.has_date:
+                year = int(parts['year'])
+                if parts.get('month') is not None:
+                    month = MONTHS[parts['month'].lower()]
+                else:
+                    month = int(parts['monthnum'])
+                day = int(parts['day'])
+            hour, minute = 0, 0
+            if self.has_time:
+                minute = int(parts.get('minute') or 0)
+                if parts.get('hour12') is not None:
+                    hour = int(parts['hour12'])
+                    if not 1 <= hour <= 12:
+                        return None
+                    hour = hour % 12
+                    if parts['ampm'].lower() == 'pm':
+                        hour += 12
+                else:
+                    hour = int(parts['hour'])
+            parsed = datetime.datetime(year, month, day, hour, minute)
+        except (KeyError, ValueError):
+            return None
+        return (parsed, self.has_date, self.has_time)
+
+
+CANDIDATE_FORMATS = (
+    [CompiledFormat('{0} {1}'.format(d, t), True, True)
+     for d in DATE_FORMATS for t in TIME_FORMATS] +
+    [CompiledFormat(d, True, False) for d in DATE_FORMATS] +
+    [CompiledFormat(t, False, True) for t in TIME_FORMATS])
+
+
+def input_shape(text):
+    """
+    Reduce a date/time string to its shape, so that 'Aug 5 2020 8:45 PM'
+    and 'Sep 12 2020 7:15 PM' share the same learned format
+    """
+    return WORD_REGEX.sub('a', DIGIT_REGEX.sub('9', text))
+
+
+class ParseEngine(object):
+    """
+    Memoizing front-end to parsedatetime
+
+    Keeps one parsedatetime Calendar per thread and a bounded LRU memo of
+    previously parsed strings, so repeated inputs like '8:45 PM' or
+    'Aug 5 2020' are only ever run through parsedatetime once.
+
+    New strings are first tried against the compiled strptime-style format
+    learned for their shape. A format is only learned once it has produced
+    exactly what parsedatetime produced for that shape, and parsedatetime
+    remains the fallback for anything no learned format can read.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._memo = OrderedDict()
+        self._formats = dict()
+        self._attempts = dict()  # shape -> strings it failed to learn from
+        self.hits = 0
+        self.misses = 0
+        self.path_counts = {PATH_MEMO: 0, PATH_FORMAT: 0, PATH_FALLBACK: 0}
+
+    @property
+    def calendar(self):
+        """The parsedatetime Calendar owned by the calling thread"""
+        calendar = getattr(self._local, 'calendar', None)
+        if calendar is None:
+            # Only imported once a string needs it, as most are read by a
+            # learned format or the memo
+            import parsedatetime as pdt
+            calendar = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+            self._local.calendar = calendar
+        return calendar
+
+    def parse(self, text):
+        """
+        Parse a human-readable date/time string
+
+        Args:
+            text (str): The string to hand to parsedatetime
+
+        Returns:
+            a datetime, identical to what parseDT would return for :text:
+        """
+        return self.parse_with_path(text)[0]
+
+    def parse_with_path(self, text):
+        """
+        Parse a human-readable date/time string, reporting how it was done
+
+        Args:
+            text (str): The string to parse
+
+        Returns:
+            a (datetime, path) tuple, where path is one of PATH_MEMO,
+            PATH_FORMAT or PATH_FALLBACK
+        """
+        text = str(text)
+        now = datetime.datetime.now()
+        # Strings without a year are resolved relative to today, so today
+        # is part of the key alongside the input string
+        key = (text, now.date())
+        with self._lock:
+            entry = self._memo.get(key)
+            if entry is not None:
+                self._memo.move_to_end(key)
+                self.hits += 1
+                self.path_counts[PATH_MEMO] += 1
+        if entry is not None:
+            return self._resolve(entry, now), PATH_MEMO
+
+        stripped = TIMEZONE_REGEX.sub('', ' '.join(text.split()))
+        shape = input_shape(stripped)
+        entry = self._parse_known_format(stripped, shape)
+        path = PATH_FORMAT
+        if entry is None:
+            parsed, status = self.calendar.parseDT(text)
+            entry = (parsed, status.hasDate, status.hasTime)
+            path = PATH_FALLBACK
+            if shape not in self._formats:
+                self._learn_format(stripped, shape, entry, now)
+        self._store(key, entry, path)
+        return self._resolve(entry, now), path
+
+    def _parse_known_format(self, text, shape):
+        known = self._formats.get(shape)
+        if known is None:
+            return None
+        return known.match(text)
+
+    def _learn_format(self, text, shape, entry, now):
+        """Remember the first candidate format agreeing with parsedatetime"""
+        expected = self._resolve(entry, now)
+        for candidate in CANDIDATE_FORMATS:
+            found = candidate.match(text)
+            if found is not None and self._resolve(found, now) == expected:
+                self._formats[shape] = candidate
+                return
+        # One string of a shape may not be readable (ex: 'Sept 5' where the
+        # formats want 'Sep 5'), so a few more are tried before the shape
+        # goes straight to parsedatetime from then on
+        with self._lock:
+            attempts = self._attempts.get(shape, 0) + 1
+            self._attempts[shape] = attempts
+        if attempts >= LEARN_ATTEMPTS:
+            self._formats[shape] = None
+
+    def _store(self, key, entry, path):
+        with self._lock:
+            self.misses += 1
+            self.path_counts[path] += 1
+            self._memo[key] = entry
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.maxsize:
+                self._memo.popitem(last=False)
+
+    def _resolve(self, entry, now):
+        """Fill in whichever parts parsedatetime would take from 'now'"""
+        parsed, has_date, has_time = entry
+        if not has_date:
+            parsed = parsed.replace(year=now.year, month=now.month,
+                                    day=now.day)
+        if not has_time:
+            parsed = parsed.replace(hour=now.hour, minute=now.minute,
+                                    second=now.second, microsecond=0)
+        return parsed
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                             len(self._memo))
+
+    def path_info(self):
+        """Get how many parses took each of the memo/strptime/fallback paths"""
+        with self._lock:
+            return dict(self.path_counts)
+
+    def learned_formats(self):
+        """Get the strptime format learned for each input shape seen"""
+        return {shape: known.fmt for shape, known in self._formats.items()
+                if known is not None}
+
+    def cache_clear(self):
+        with self._lock:
+            self._memo.clear()
+            self._formats.clear()
+            self._attempts.clear()
+            self.hits = 0
+            self.misses = 0
+            for path in self.path_counts:
+                self.path_counts[path] = 0
+
+
+ENGINE = ParseEngine()
+
+
+def cache_info():
+    """Get the hit/miss counters of the shared parsing engine"""
+    return ENGINE.cache_info()
+
+
+def cache_clear():
+    """Empty the shared parsing engine's memo and reset its counters"""
+    ENGINE.cache_clear()
+
+
+def path_info():
+    """Get how many parses the shared engine did through each path"""
+    return ENGINE.path_info()
+
 
 def determine_year(year=None):
     if year is None:
@@ -25,16 +316,14 @@ def normalize_date(date, year=None, includes_day=False, return_type=str):
     listdate = date.split()[cut_item:]
     listdate.extend([year])
     strdate = '{} {} {}'.format(*listdate)  # TODO: handle len(listdate) != 3
-    parsed, status = pdt.Calendar(
-        version=pdt.VERSION_CONTEXT_STYLE).parseDT(str(strdate))
+    parsed = ENGINE.parse(strdate)
     if return_type == str:
         return parsed.strftime(DATE_DESCRIPTOR)
     return parsed
 
 
 def normalize_time(time, return_type=str):
-    parsed, status = pdt.Calendar(
-        version=pdt.VERSION_CONTEXT_STYLE).parseDT(str(time))
+    parsed = ENGINE.parse(time)
     if return_type == str:
         return parsed.strftime(TIME_DESCRIPTOR)
     return parsed
@@ -59,6 +348,4 @@ def assemble_full_datetime(date, time, year=None):
     fulltime = ' '.join(fulltime)
 
     # TODO: act on bad status from parseDT
-    parsed, status = pdt.Calendar(
-        version=pdt.VERSION_CONTEXT_STYLE).parseDT(str(fulltime))
-    return parsed
+    return ENGINE.parse(fulltime)
@@ -1,2 +1,10 @@
-from .sportsengine_player_stats import SportsEnginePlayerStats
-from .player_stats_factory import PlayerStatsFactory
+# Providers are only imported when they're first used, see recleagueparser.lazy
+from recleagueparser import lazy
+
+_EXPORTS = {
+    'SportsEnginePlayerStats': '.sportsengine_player_stats',
+    'DashPlatformPlayerStats': '.dashplatform_player_stats',
+    'PlayerStatsFactory': '.player_stats_factory',
+}
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy.exports(__name__, _EXPORTS)
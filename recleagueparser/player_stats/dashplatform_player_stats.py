@@ -4,9 +4,9 @@ off of DashPlatform/Daysmart Recreation, a team stats-tracking website
 """
 from recleagueparser.player_stats.player_stats import PlayerStats
 from recleagueparser.player_stats.player import Player
-from bs4 import BeautifulSoup
-import requests
-import datetime
+from recleagueparser import response_cache as rc
+from recleagueparser import soup as rs
+from recleagueparser import sessions
 
 
 DASH_URL = "https://apps.daysmartrecreation.com"
@@ -27,6 +27,8 @@ class DashPlatformPlayerStats(PlayerStats):
         'saves': 6,
         'games_played': 7
     }
+    PARSE_MODE = rs.PARSE_SLICED
+    _local_state = ('session',)  # Logged in, so it's never shipped
 
     def __init__(self, team_id, company_id, username, password,**kwargs):
         # Login required for PlayerStats in DashPlatform
@@ -41,13 +43,14 @@ class DashPlatformPlayerStats(PlayerStats):
         self.team_id = team_id
         self.company_id = company_id
         self.session = self._login(username, password)
+        # Pages fetched with a login are private to it, so they're cached
+        # (in memory) for this session alone rather than in the shared
+        # response cache, which any other fetch of the URL could be given
+        self.response_cache = rc.ResponseCache()
         super(DashPlatformPlayerStats, self).__init__(team_id=team_id, company_id=company_id, **kwargs)
 
     def _login(self, username, password):
-        session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter(max_retries=5)
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
+        session = sessions.new_session(DASH_URL)
 
         login_page=f"{DASH_URL}/dash/jsonapi/api/v1/customer/auth/token?company={self.company_id}"
         login_payload = {
@@ -61,10 +64,8 @@ class DashPlatformPlayerStats(PlayerStats):
         r = session.post(login_page, data=login_payload)
         return session
 
-    def send_get_request(self, url):
-        self._logger.info(f"Retreiving Player Stats from Webpage: {url}")
-        self.html_doc = self.session.get(url).text
-        self.last_refresh = datetime.datetime.now()
+    def get_page(self, url, **kwargs):
+        return self.session.get(url, **kwargs)
 
     def get_stats_url(self, *args, **kwargs):
         return f"{DASH_URL}{TEAM_STATS_EXT}&teamID={self.team_id}&company={self.company_id}"
@@ -91,7 +92,9 @@ class DashPlatformPlayerStats(PlayerStats):
         if self.is_stale:
             self._logger.info("Stats are stale, must be refreshed")
             self.send_get_request(url)
-        soup = BeautifulSoup(self.html_doc, 'html.parser')
+        if not self.document_changed:
+            return self.html_tables
+        soup = self.parse_html("div", {'id': 'teamStats'})
         div = soup.find("div", {'id': 'teamStats'})
         tables = div.find_all("table")
         return tables
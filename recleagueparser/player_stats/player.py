@@ -3,6 +3,10 @@ DEFAULT_THRESHOLD = 3
 
 class Player(object):
 
+    __slots__ = ('name', 'jersey_number', 'games_played', 'goals', 'assists',
+                 'penalties', 'penalties_in_minutes', 'wins', 'losses',
+                 'ties', 'goals_against')
+
     def __init__(self, name, jersey_number=0, games_played=0, goals=0,
                  assists=0, penalties=0, penalties_in_minutes=0,
                  wins=0, losses=0, ties=0, goals_against=0):
@@ -1,5 +1,9 @@
-from bs4 import BeautifulSoup
-from requests import get
+from recleagueparser.player_stats.player import Player
+from recleagueparser import instrumentation as ins
+from recleagueparser import background as bg
+from recleagueparser import parse_pool as pp
+from recleagueparser import snapshots as ss
+from recleagueparser.refreshable import Refreshable
 import datetime
 import logging
 
@@ -13,20 +17,35 @@ MAX_RESPONSES = FREE_REQUESTS if MAX_RESPONSES > FREE_REQUESTS else \
     MAX_RESPONSES
 
 
-class PlayerStats(object):
+class PlayerStats(Refreshable):
 
-    STALE_TIME = 60
+    PAGE_NAME = 'Player Stats'
+    _local_state = ('players',)
+    _fresh_state = dict(html_tables=None)
 
-    def __init__(self, team_id=None, season_id=None, company_id=None, **kwargs):
+    def __init__(self, team_id=None, season_id=None, company_id=None,
+                 parse_mode=None, parser=None, background=False,
+                 refresher=None, snapshots=None, parse_pool=None,
+                 **kwargs):
         self._logger = logging.getLogger(self.__class__.__name__)
+        self.parse_mode = parse_mode or self.PARSE_MODE
+        self.parser = parser or self.PARSER
         self.html_doc = None
+        self.html_tables = None
+        self.fetch_status = None
         self.team_id = team_id
         self.season_id = season_id
         self.company_id = company_id
         self.games = list()
         self.url = self.get_stats_url(team_id, season_id)
-        self.refresh_stats()
-        self.last_refresh = datetime.datetime.now()
+        self.parse_pool = pp.parse_pool(parse_pool)
+        self.snapshots = ss.snapshot_store(snapshots)
+        if self.snapshots is None or not self.snapshots.restore(self):
+            self.refresh_stats()
+            self.last_refresh = datetime.datetime.now()
+        if background or refresher is not None:
+            self.refresher = refresher or bg.default_refresher()
+            self.refresher.add(self, 'revalidate', self.STALE_TIME)
 
     def __repr__(self):
         """Prints the list of games in order to form a schedule"""
@@ -37,13 +56,6 @@ class PlayerStats(object):
             res += '{0}\r\n'.format(str(goalie))
         return res
 
-    @property
-    def is_stale(self):
-        if self.html_doc is None:
-            return True
-        now = datetime.datetime.now()
-        return (now - self.last_refresh).total_seconds() > self.STALE_TIME
-
     @property
     def roster_list(self):
         roster = list(self.players.get('players').values())
@@ -85,15 +97,44 @@ class PlayerStats(object):
         raise NotImplementedError
 
     def refresh_stats(self):
-        """Reload the stats"""
-        self._logger.info("Refreshing Player Stats")
-        self.html_tables = self.retrieve_html_tables(self.url)
+        """
+        Reload the stats. Stats restored from a snapshot aren't reloaded
+        until the snapshot expires. When refreshed in the background, the
+        stats already parsed are kept as they are, and stale stats are only
+        queued to be revalidated
+
+        Returns:
+            how the page was refreshed: FETCH_HIT, FETCH_REVALIDATED or
+            FETCH_FULL
+        """
+        return self.refresh()
+
+    def retrieve_tables(self):
+        return self.retrieve_html_tables(self.url)
+
+    def extract(self):
         self.players = self.parse_table()
 
-    def send_get_request(self, url):
-        self._logger.info("Retreiving Player Stats from Webpage")
-        self.html_doc = get(url).text
-        self.last_refresh = datetime.datetime.now()
+    def count_parsed(self):
+        if ins.enabled():
+            ins.count(self, ins.ROWS_PARSED, len(self.roster_list))
+
+    def snapshot_fields(self):
+        return list(Player.__slots__)
+
+    def snapshot_data(self):
+        return dict((kind, [ss.to_record(player)
+                            for player in self.players.get(kind).values()])
+                    for kind in ('players', 'goalies'))
+
+    def restore_snapshot(self, data):
+        players = dict()
+        for kind in ('players', 'goalies'):
+            players[kind] = dict()
+            for record in data[kind]:
+                player = ss.from_record(Player, record)
+                players[kind][player.name] = player
+        self.players = players
 
     def retrieve_html_tables(self, url):
         raise NotImplementedError
@@ -112,7 +153,9 @@ class PlayerStats(object):
         if self.is_stale:
             self._logger.info("Stats are stale, must be refreshed")
             self.send_get_request(url)
-        soup = BeautifulSoup(self.html_doc, 'html.parser')
+        if not self.document_changed:
+            return self.html_tables
+        soup = self.parse_html("table", {'class': table_class})
         tables = soup.find_all("table", {'class': table_class})
         processed = list()
         for table in tables:
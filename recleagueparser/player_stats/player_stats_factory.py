@@ -1,18 +1,22 @@
-from recleagueparser.player_stats.sportsengine_player_stats \
-    import SportsEnginePlayerStats
-from recleagueparser.player_stats.dashplatform_player_stats \
-    import DashPlatformPlayerStats
+from recleagueparser import lazy
+
+# Each stats type's class, only imported once stats of that type are created
+STATS_TYPES = {
+    'sportsengine': 'recleagueparser.player_stats.sportsengine_player_stats.'
+                    'SportsEnginePlayerStats',
+    'dash': 'recleagueparser.player_stats.dashplatform_player_stats.'
+            'DashPlatformPlayerStats',
+    'daysmart': 'recleagueparser.player_stats.dashplatform_player_stats.'
+                'DashPlatformPlayerStats',
+}
 
 
 class PlayerStatsFactory(object):
 
     def create(stats_type, **kwargs):
-        if stats_type == 'sportsengine':
-            return SportsEnginePlayerStats(**kwargs)
-        elif stats_type == 'dash' or stats_type == 'daysmart':
-            return DashPlatformPlayerStats(**kwargs)
-        else:
+        if stats_type not in STATS_TYPES:
             raise ValueError("Stats Tool Type '{0}' not found"
                              .format(stats_type))
+        return lazy.load(STATS_TYPES[stats_type])(**kwargs)
 
     create = staticmethod(create)
@@ -4,6 +4,7 @@ off of SportsEngine, a team stats-tracking website
 """
 from recleagueparser.player_stats.player_stats import PlayerStats
 from recleagueparser.player_stats.player import Player
+from recleagueparser import soup as rs
 
 
 SE_URL = 'http://www.pahl.org'
@@ -28,6 +29,7 @@ class SportsEnginePlayerStats(PlayerStats):
         'ties': -1,
         'goals_against': 5
     }
+    PARSE_MODE = rs.PARSE_SLICED
 
     def get_stats_url(self, team_id, season_id):
         tab = 'tab=team_instance_player_stats'
@@ -0,0 +1,159 @@
+"""
+Per-host rate limiting: every request to a host first takes a token from
+that host's bucket, so refreshing many teams at once doesn't send their
+requests all at the same time. A host that throttles (429s and 5xx) or
+slows right down is backed off from, and its rate is slowly given back as
+it recovers
+"""
+from collections import namedtuple
+import threading
+import time
+
+DEFAULT_RATE = 4.0  # Requests per sec to each host
+DEFAULT_BURST = 8  # Requests sent at once before the rate applies
+MIN_RATE = 0.2  # Requests per sec, however much a host is backed off from
+BACKOFF_FACTOR = 0.5  # Rate kept after a throttled response
+SLOWDOWN_FACTOR = 0.8  # Rate kept after a latency spike
+RECOVERY_REQUESTS = 10  # Good responses to get back a backed off rate
+LATENCY_SPIKE = 3.0  # Times the usual latency that counts as a spike
+MIN_SPIKE = 1.0  # secs, so fast hosts' jitter isn't taken for spikes
+LATENCY_WEIGHT = 0.2  # Weight of each response in the usual latency
+MAX_PAUSE = 60.0  # Most secs a Retry-After can hold a host's requests for
+
+LimiterStats = namedtuple('LimiterStats', [
+    'rate',  # Requests per sec currently let through
+    'requests',  # Requests sent
+    'waited',  # Requests that had to queue for a token
+    'wait_total',  # secs spent queued, over every request
+    'wait_max',  # Longest any request queued for, in secs
+    'waiting',  # Requests queued right now
+    'throttled',  # 429/5xx responses (and failed requests) backed off from
+    'slowed',  # Latency spikes backed off from
+])
+
+
+def is_throttled(status):
+    """Whether a response status means the host wants fewer requests"""
+    return status == 429 or (isinstance(status, int) and status >= 500)
+
+
+def retry_after(response):
+    """Get a response's Retry-After in secs, if it gives one in secs"""
+    headers = getattr(response, 'headers', None) or dict()
+    try:
+        return min(max(float(headers.get('Retry-After')), 0), MAX_PAUSE)
+    except (TypeError, ValueError):
+        return None
+
+
+class HostLimiter(object):
+    """
+    A token bucket for one host, whose rate adapts to how the host is
+    coping: it's cut on 429/5xx responses and on latency spikes, then
+    raised back a step on each good response up to the configured rate
+
+    Args:
+        rate (float): Most requests per sec
+        burst (int): Most requests let through at once, after a quiet spell
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.max_rate = rate
+        self.burst = burst
+        self.rate = rate
+        self.latency = None  # Usual secs per response, as a moving average
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._requests = 0
+        self._waited = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._waiting = 0
+        self._throttled = 0
+        self._slowed = 0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Take a token, even one that's not there yet
+
+        Returns:
+            how long to wait before sending, in secs
+        """
+        with self._lock:
+            now = self._refill()
+            # Tokens go negative while requests are queued, so each one
+            # waits its turn behind those taken before it
+            self._tokens -= 1
+            wait = max(-self._tokens / self.rate, self._paused_until - now, 0)
+            self._requests += 1
+            if wait > 0:
+                self._waited += 1
+                self._wait_total += wait
+                self._wait_max = max(self._wait_max, wait)
+                self._waiting += 1
+            return wait
+
+    def acquire(self):
+        """
+        Wait for a token before sending a request
+
+        Returns:
+            the secs waited
+        """
+        wait = self.reserve()
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+        return wait
+
+    def record(self, status=None, seconds=None, pause=None):
+        """
+        Adapt the rate to how a request went
+
+        Args:
+            status (int): The response's status, or None if it failed
+            seconds (float): How long the response took
+            pause (float): secs the host asked for no requests (Retry-After)
+        """
+        with self._lock:
+            if status is None or is_throttled(status):
+                self._throttled += 1
+                self._set_rate(self.rate * BACKOFF_FACTOR)
+                if pause:
+                    self._paused_until = max(self._paused_until,
+                                             time.monotonic() + pause)
+                return
+            if seconds is not None:
+                usual = self.latency
+                self.latency = seconds if usual is None else \
+                    usual + (seconds - usual) * LATENCY_WEIGHT
+                if usual is not None and seconds > MIN_SPIKE and \
+                        seconds > usual * LATENCY_SPIKE:
+                    self._slowed += 1
+                    self._set_rate(self.rate * SLOWDOWN_FACTOR)
+                    return
+            self._set_rate(self.rate + self.max_rate / RECOVERY_REQUESTS)
+
+    def _refill(self):
+        # Add the tokens earned since the last refill, at the current rate
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens +
+                           (now - self._updated) * self.rate)
+        self._updated = now
+        return now
+
+    def _set_rate(self, rate):
+        # Tokens earned at the old rate are counted before it changes
+        self._refill()
+        self.rate = min(self.max_rate, max(min(MIN_RATE, self.max_rate), rate))
+
+    def stats(self):
+        with self._lock:
+            return LimiterStats(self.rate, self._requests, self._waited,
+                                self._wait_total, self._wait_max,
+                                self._waiting, self._throttled, self._slowed)
@@ -0,0 +1,198 @@
+"""
+What schedules and stats have in common: fetching a page through the
+response cache, revalidating it when it goes stale, parsing it (here or in
+a parse pool) only when it changed, and keeping it in snapshots
+"""
+from recleagueparser import instrumentation as ins
+from recleagueparser import response_cache as rc
+from recleagueparser import soup as rs
+from recleagueparser.sessions import get
+import threading
+import datetime
+
+_locks_lock = threading.Lock()
+
+
+class Refreshable(object):
+    """
+    A page that's fetched and parsed into a provider's data (ex: games)
+
+    Subclasses fill in retrieve_tables and extract, and the snapshot
+    methods for their data. PAGE_NAME is what the page is called in logs,
+    and TABLES_ATTR is the attribute its parsed tables are kept in
+    """
+
+    STALE_TIME = 60
+    PARSE_MODE = rs.PARSE_FULL
+    PARSER = rs.DEFAULT_FEATURES
+    PAGE_NAME = 'Page'
+    TABLES_ATTR = 'html_tables'
+    refresher = None
+    snapshots = None
+    snapshot_expires = None
+    parse_pool = None
+    response_cache = None  # Defaults to the shared one
+    _pool_parsed = False
+    # Kept out of what's shipped to a parse pool's workers, since they
+    # can't be pickled or are only of use here (see parse_pool)
+    _local_state = ('_logger', 'refresher', 'snapshots', 'parse_pool',
+                    'response_cache', '_refresh_lock')
+
+    @property
+    def refresh_lock(self):
+        """
+        Held while the page is revalidated, so a background revalidation
+        and a foreground refresh never swap the document and its data in
+        at the same time
+        """
+        lock = self.__dict__.get('_refresh_lock')
+        if lock is None:
+            # Made on first use, since not every subclass calls up to an
+            # __init__ here (and parse pool workers build theirs bare)
+            with _locks_lock:
+                lock = self.__dict__.setdefault('_refresh_lock',
+                                                threading.RLock())
+        return lock
+
+    @property
+    def is_stale(self):
+        if self.html_doc is None:
+            return True
+        now = datetime.datetime.now()
+        return (now - self.last_refresh).total_seconds() > self.STALE_TIME
+
+    @property
+    def document_changed(self):
+        """Whether the document needs (re-)parsing after the last fetch"""
+        return getattr(self, self.TABLES_ATTR) is None or \
+            self.fetch_status == rc.FETCH_FULL
+
+    def retrieve_tables(self):
+        """Get the page's tables to parse, fetching it first if it's stale"""
+        raise NotImplementedError
+
+    def extract(self):
+        """Parse the tables into this provider's data"""
+        raise NotImplementedError
+
+    def count_parsed(self):
+        """Count what the last parse found, for instrumentation"""
+        pass
+
+    def refresh(self):
+        """
+        Reload the page. One restored from a snapshot isn't reloaded until
+        the snapshot expires. When refreshed in the background, the data
+        already parsed is kept as it is, and a stale page is only queued to
+        be revalidated
+
+        Returns:
+            how the page was refreshed: FETCH_HIT, FETCH_REVALIDATED or
+            FETCH_FULL
+        """
+        restored = self.snapshot_expires is not None
+        if restored and datetime.datetime.now() < self.snapshot_expires:
+            return rc.FETCH_HIT
+        if self.refresher is not None and \
+                (getattr(self, self.TABLES_ATTR) is not None or restored):
+            if self.is_stale:
+                self.refresher.request(self)
+            return rc.FETCH_HIT
+        return self.revalidate()
+
+    def revalidate(self):
+        """Reload the page now, if it's stale"""
+        with self.refresh_lock:
+            self.snapshot_expires = None
+            self._logger.info("Refreshing {}".format(self.PAGE_NAME))
+            self.fetch_status = rc.FETCH_HIT
+            if self.parse_pool is not None:
+                parsed = self._pool_parsed
+                self.fetch_document()
+            else:
+                parsed = getattr(self, self.TABLES_ATTR) is not None
+                setattr(self, self.TABLES_ATTR, self.retrieve_tables())
+            self._logger.info("{} refresh: {}".format(self.PAGE_NAME,
+                                                      self.fetch_status))
+            if parsed and self.fetch_status != rc.FETCH_FULL:
+                self._logger.info("{} unchanged, skipping parse".format(
+                    self.PAGE_NAME))
+                self.save_snapshot()
+                return self.fetch_status
+            if self.parse_pool is not None:
+                with ins.span(self, ins.EXTRACT):
+                    self.restore_snapshot(self.parse_pool.parse(self))
+                self._pool_parsed = True
+            else:
+                with ins.span(self, ins.EXTRACT):
+                    self.extract()
+            self.count_parsed()
+            self.save_snapshot()
+            return self.fetch_status
+
+    def fetch_document(self):
+        """Fetch the page if it's stale, without parsing any of it"""
+        if self.is_stale:
+            self._logger.info("{} is stale, refreshing".format(
+                self.PAGE_NAME))
+            self.send_get_request(self.url)
+
+    def parse_snapshot(self):
+        """
+        Parse the fetched page. This is what a parse pool runs in its
+        workers
+
+        Returns:
+            the parsed data, as snapshot_data
+        """
+        setattr(self, self.TABLES_ATTR, self.retrieve_tables())
+        with ins.span(self, ins.EXTRACT):
+            self.extract()
+        return self.snapshot_data()
+
+    def snapshot_key(self):
+        """What a snapshot must have been taken of to be restored here"""
+        return self.url
+
+    def snapshot_fields(self):
+        raise NotImplementedError
+
+    def snapshot_data(self):
+        raise NotImplementedError
+
+    def restore_snapshot(self, data):
+        raise NotImplementedError
+
+    def save_snapshot(self):
+        """Snapshot the page's data, if it's kept in snapshots and was
+        fetched"""
+        if self.snapshots is not None and self.fetch_status != rc.FETCH_HIT:
+            self.snapshots.save(self)
+
+    @ins.timed(ins.PARSE)
+    def parse_html(self, name, attrs=None):
+        """
+        Parse as much of the current document as this provider's parse mode
+        needs to find the :name:/:attrs: elements
+
+        Returns:
+            a bs tree to find the target elements in
+        """
+        return rs.parse_elements(self.html_doc, name, attrs,
+                                 mode=self.parse_mode, features=self.parser)
+
+    def get_page(self, url, **kwargs):
+        """Send a GET for :url:, as the response cache asks for it"""
+        return get(url, **kwargs)
+
+    @ins.timed(ins.FETCH)
+    def send_get_request(self, url):
+        self._logger.info("Retrieving {}".format(self.PAGE_NAME))
+        cache = self.response_cache
+        if cache is None:
+            cache = rc.DEFAULT_CACHE
+        result = cache.fetch(url, self.get_page, previous=self.html_doc)
+        ins.count_fetch(self, result)
+        self.html_doc = result.text
+        self.fetch_status = result.status
+        self.last_refresh = datetime.datetime.now()
@@ -0,0 +1,228 @@
+"""
+Conditional HTTP fetching backed by an (optionally on-disk) response cache,
+shared by Schedules, PlayerStats and TeamStats
+
+Fetches of the same URL are coalesced: objects asking for a page while it's
+being downloaded, or just after, get that download instead of making their
+own, and each one then parses and filters it for itself
+"""
+from recleagueparser.single_flight import SingleFlight
+from collections import namedtuple, OrderedDict
+import threading
+import hashlib
+import logging
+import json
+import time
+import os
+
+# Outcomes of a refresh
+FETCH_HIT = 'hit'  # Data was still fresh, nothing was requested
+FETCH_REVALIDATED = 'revalidated'  # 304, or the same body came back
+FETCH_FULL = 'fetched'  # A new body was downloaded
+
+CACHE_DIR_ENV = 'RECLEAGUEPARSER_CACHE_DIR'
+NOT_MODIFIED = 304
+SHARE_WINDOW = 1.0  # How long a finished download is handed out, in secs
+ENTRIES_KEPT = 256  # How many pages' entries are kept in memory
+
+FetchResult = namedtuple('FetchResult', ['text', 'status'])
+
+
+def digest(text):
+    """Get a stable hash of a response body"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def is_success(response):
+    """Whether a response is a 2xx (responses without a status count)"""
+    status = getattr(response, 'status_code', None)
+    return status is None or 200 <= status < 300
+
+
+class ResponseCache(object):
+    """
+    Remembers the ETag, Last-Modified and body hash of every page fetched,
+    so that later fetches can be made conditional and unchanged pages
+    don't need to be parsed again
+
+    Args:
+        path (str): Directory to persist entries in. When None, entries
+            only live as long as the process
+        share_window (float): How long after a download finishes it's
+            handed to other fetches of the same URL, in secs. By default
+            only fetches running at the same time share a download
+        max_entries (int): How many pages' entries to keep in memory. The
+            least recently used are dropped first (and re-read from :path:
+            when it's set)
+    """
+
+    def __init__(self, path=None, share_window=0, max_entries=ENTRIES_KEPT):
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.path = path
+        self.share_window = share_window
+        self.max_entries = max_entries
+        # url -> entry, least recently used first
+        self._entries = OrderedDict()
+        self._recent = dict()  # url -> (monotonic time, FetchResult)
+        self._flights = SingleFlight()
+        self._lock = threading.Lock()
+        if self.path:
+            os.makedirs(self.path, exist_ok=True)
+
+    def _entry_file(self, url):
+        name = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.path, '{0}.json'.format(name))
+
+    def load(self, url):
+        """Get the cached entry for :url:, or None if there isn't one"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+        if entry is not None or not self.path:
+            return entry
+        try:
+            with open(self._entry_file(url), 'r') as f:
+                entry = json.load(f)
+        except (IOError, ValueError):
+            return None
+        self._keep(url, entry)
+        return entry
+
+    def store(self, url, entry):
+        self._keep(url, entry)
+        if self.path:
+            tmp_file = '{0}.tmp'.format(self._entry_file(url))
+            with open(tmp_file, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_file, self._entry_file(url))
+
+    def _keep(self, url, entry):
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._recent.clear()
+
+    def conditional_headers(self, entry):
+        headers = dict()
+        if entry is None:
+            return headers
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def fetch(self, url, get, previous=None, **kwargs):
+        """
+        Fetch a page, revalidating against whatever is cached for it. A
+        download of :url: that's running, or finished within the share
+        window, is shared instead of fetching it again
+
+        Args:
+            url (str): The URL to fetch
+            get (callable): A requests-style get function to fetch with
+            previous (str): The text the caller already has for :url:, if
+                any. A caller asking again for the text it has always gets
+                a new fetch rather than a shared one
+
+        Returns:
+            a FetchResult with the page text and either FETCH_REVALIDATED
+            (the page is unchanged) or FETCH_FULL (the page is new). With
+            :previous:, these are relative to it rather than to the cache
+        """
+        result = self.shared(url, previous)
+        if result is None:
+            result, shared = self._flights.run(
+                url, lambda: self._fetch(url, get, **kwargs))
+        else:
+            shared = True
+        if shared:
+            self._logger.debug("Shared fetch: {}".format(url))
+        if previous is None:
+            return result
+        if result.text == previous:
+            return FetchResult(result.text, FETCH_REVALIDATED)
+        return FetchResult(result.text, FETCH_FULL)
+
+    def shared(self, url, previous=None):
+        """Get the download of :url: that just finished, if it can still
+        be shared and isn't :previous:"""
+        now = time.monotonic()
+        with self._lock:
+            recent = self._recent.get(url)
+        if recent is None or now - recent[0] > self.share_window or \
+                recent[1].text is previous:
+            return None
+        return recent[1]
+
+    def _fetch(self, url, get, **kwargs):
+        result = self._download(url, get, **kwargs)
+        now = time.monotonic()
+        with self._lock:
+            self._recent = dict(
+                (key, recent) for key, recent in self._recent.items()
+                if now - recent[0] <= self.share_window)
+            self._recent[url] = (now, result)
+        return result
+
+    def _download(self, url, get, **kwargs):
+        entry = self.load(url)
+        headers = dict(kwargs.pop('headers', None) or {})
+        headers.update(self.conditional_headers(entry))
+        response = get(url, headers=headers, **kwargs)
+        if entry is not None and \
+                getattr(response, 'status_code', None) == NOT_MODIFIED:
+            self._logger.debug("Not modified: {}".format(url))
+            return FetchResult(entry['body'], FETCH_REVALIDATED)
+
+        text = response.text
+        if not is_success(response):
+            # Not worth revalidating against, and it mustn't replace the
+            # last good entry
+            self._logger.debug("Not cached ({}): {}".format(
+                response.status_code, url))
+            return FetchResult(text, FETCH_FULL)
+        body_hash = digest(text)
+        unchanged = entry is not None and entry.get('body_hash') == body_hash
+        if unchanged:
+            self._logger.debug("Body unchanged: {}".format(url))
+            # Handing back the text that's already out there lets callers
+            # tell it's unchanged by identity
+            text = entry['body']
+        response_headers = getattr(response, 'headers', None) or {}
+        self.store(url, dict(etag=response_headers.get('ETag'),
+                             last_modified=response_headers.get(
+                                 'Last-Modified'),
+                             body_hash=body_hash,
+                             body=text))
+        return FetchResult(text, FETCH_REVALIDATED if unchanged else
+                           FETCH_FULL)
+
+
+DEFAULT_CACHE = ResponseCache(os.environ.get(CACHE_DIR_ENV), SHARE_WINDOW)
+
+
+def configure(path=None, share_window=SHARE_WINDOW):
+    """
+    Replace the shared response cache
+
+    Args:
+        path (str): Directory to persist responses in, or None to only
+            keep them in memory
+        share_window (float): How long a download is shared for, in secs
+    """
+    global DEFAULT_CACHE
+    DEFAULT_CACHE = ResponseCache(path, share_window)
+    return DEFAULT_CACHE
+
+
+def fetch(url, get, previous=None, **kwargs):
+    """Fetch :url: through the shared response cache"""
+    return DEFAULT_CACHE.fetch(url, get, previous=previous, **kwargs)
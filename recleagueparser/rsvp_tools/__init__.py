@@ -1,3 +1,12 @@
-from .team_locker_room import TeamLockerRoom
-from .benchapp import BenchApp
-from .rsvp_tool_factory import RsvpToolFactory
+# Tools are only imported when they're first used (GoogleDriveSignupSheet
+# needs the Google API client), see recleagueparser.lazy
+from recleagueparser import lazy
+
+_EXPORTS = {
+    'TeamLockerRoom': '.team_locker_room',
+    'BenchApp': '.benchapp',
+    'GoogleDriveSignupSheet': '.google_drive',
+    'RsvpToolFactory': '.rsvp_tool_factory',
+}
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy.exports(__name__, _EXPORTS)
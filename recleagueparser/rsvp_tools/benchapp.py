@@ -1,5 +1,6 @@
 from recleagueparser.rsvp_tools import exceptions as rsvptoolexceptions
 from recleagueparser.rsvp_tools.rsvp_tool import RsvpTool
+from recleagueparser import instrumentation as ins
 from bs4 import BeautifulSoup
 from re import sub
 from decimal import Decimal
@@ -67,7 +68,7 @@ class BenchApp(RsvpTool):
     @property
     def has_upcoming_game(self):
         page = self.get_next_game_page().text
-        soup = BeautifulSoup(page, 'html.parser')
+        soup = self.parse_page(page)
         no_results_div = soup.find_all("div", {"class": "noResults"})
         return len(no_results_div) == 0
 
@@ -77,15 +78,15 @@ class BenchApp(RsvpTool):
     def retrieve_next_game_page(self):
         self.login()
         self._logger.info("Retrieving Next Game Page from BenchApp")
-        self.next_game = self.session.get('{0}{1}'.format(self.baseurl,
-                                                          NEXT_GAME_URL))
+        self.next_game = self.fetch_page('{0}{1}'.format(self.baseurl,
+                                                         NEXT_GAME_URL))
 
     def retrieve_finances_page(self):
         if self.finance:
             self.login()
             self._logger.info("Retrieving Finances Page from BenchApp")
-            self.finance_page = self.session.get('{0}{1}'.format(self.baseurl,
-                                                                 FINANCES_URL))
+            self.finance_page = self.fetch_page('{0}{1}'.format(self.baseurl,
+                                                                FINANCES_URL))
 
     def get_finances_page(self):
         return self.finance_page
@@ -101,23 +102,27 @@ class BenchApp(RsvpTool):
         if self.has_upcoming_game is False:
             return dict()
         page = self.get_next_game_page().text
-        soup = BeautifulSoup(page, 'html.parser')
+        soup = self.parse_page(page)
         # These don't work anymore
         # in_count = soup.find("div", {"class": "inCount"}).text
         # out_count = soup.find("div", {"class": "outCount"}).text
         # data = dict(in_count=in_count, out_count=out_count)
         data = dict()
         data['all'] = list()
-        for checkin_type in ['attending', 'notAttending',
-                             'waitlist', 'unknown']:
-            players = soup.find("ul", {"id": checkin_type})
-            playeritems = players.findAll("li", {"class": "playerItem"})
-            player_list = list()
-            for playeritem in playeritems:
-                player, date, position, note = self.parse_playeritem(playeritem)
-                player_list.append(dict(player=player, date=date, position=position, note=note))
-            data.update({checkin_type: player_list})
-            data['all'].extend(player_list)
+        with ins.span(self, ins.EXTRACT):
+            for checkin_type in ['attending', 'notAttending',
+                                 'waitlist', 'unknown']:
+                players = soup.find("ul", {"id": checkin_type})
+                playeritems = players.findAll("li", {"class": "playerItem"})
+                player_list = list()
+                for playeritem in playeritems:
+                    player, date, position, note = \
+                        self.parse_playeritem(playeritem)
+                    player_list.append(dict(player=player, date=date,
+                                            position=position, note=note))
+                data.update({checkin_type: player_list})
+                data['all'].extend(player_list)
+        ins.count(self, ins.ROWS_PARSED, len(data['all']))
         self.next_game_data = data
         return data
 
@@ -128,7 +133,7 @@ class BenchApp(RsvpTool):
         if self.finance:
             self._logger.info("Parsing TeamFee Stats from BenchApp")
             page = self.get_finances_page().text
-            soup = BeautifulSoup(page, 'html.parser')
+            soup = self.parse_page(page)
             rosterlist = soup.find("table", {"id": "rosterList"})
             footer = rosterlist.find("tfoot")
             items = footer.find_all("td")
@@ -1,4 +1,5 @@
-import requests
+from recleagueparser import instrumentation as ins
+from recleagueparser import sessions
 import logging
 import sys
 
@@ -11,7 +12,7 @@ class RsvpTool(object):
                  finance=False, name_mapping={}, **kwargs):
         self._logger = logging.getLogger(self.__class__.__name__)
         self.baseurl = url
-        self.session = requests.session()
+        self.session = sessions.new_session(url)
         self.username = username
         self.password = password
         self.finance = finance
@@ -22,6 +23,21 @@ class RsvpTool(object):
     def login(self):
         pass
 
+    def fetch_page(self, url):
+        """GET :url: with this tool's (logged in) session"""
+        with ins.span(self, ins.FETCH):
+            response = self.session.get(url)
+        if ins.enabled():
+            ins.count(self, ins.BYTES_FETCHED,
+                      len(response.text.encode('utf-8')))
+        return response
+
+    def parse_page(self, page):
+        """Parse a page's html into a bs tree"""
+        from bs4 import BeautifulSoup  # Deferred, it's slow to import
+        with ins.span(self, ins.PARSE):
+            return BeautifulSoup(page, 'html.parser')
+
     # TODO: Refactor to get_next_game_attendance_str
     def get_next_game_attendance(self):
         return 'NextGameAttendanceStr'
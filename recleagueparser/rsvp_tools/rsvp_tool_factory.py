@@ -1,19 +1,23 @@
-from recleagueparser.rsvp_tools.team_locker_room import TeamLockerRoom
-from recleagueparser.rsvp_tools.google_drive import GoogleDriveSignupSheet
-from recleagueparser.rsvp_tools.benchapp import BenchApp
+from recleagueparser import lazy
+
+# Each tool's class, only imported once that tool is created (so the Google
+# API client is only needed for Google Drive sheets)
+RSVP_TOOL_TYPES = {
+    'teamlockerroom': 'recleagueparser.rsvp_tools.team_locker_room.'
+                      'TeamLockerRoom',
+    'tlr': 'recleagueparser.rsvp_tools.team_locker_room.TeamLockerRoom',
+    'benchapp': 'recleagueparser.rsvp_tools.benchapp.BenchApp',
+    'gdoc': 'recleagueparser.rsvp_tools.google_drive.GoogleDriveSignupSheet',
+    'gdrive': 'recleagueparser.rsvp_tools.google_drive.GoogleDriveSignupSheet',
+}
 
 
 class RsvpToolFactory(object):
 
     def create(rsvp_tool_type, **kwargs):
-        if rsvp_tool_type == 'teamlockerroom' or rsvp_tool_type == 'tlr':
-            return TeamLockerRoom(**kwargs)
-        if rsvp_tool_type == 'benchapp':
-            return BenchApp(**kwargs)
-        if rsvp_tool_type == 'gdoc' or rsvp_tool_type == 'gdrive':
-            return GoogleDriveSignupSheet(**kwargs)
-        else:
+        if rsvp_tool_type not in RSVP_TOOL_TYPES:
             raise ValueError("RSVP Tool Type '{0}' not found"
                              .format(rsvp_tool_type))
+        return lazy.load(RSVP_TOOL_TYPES[rsvp_tool_type])(**kwargs)
 
     create = staticmethod(create)
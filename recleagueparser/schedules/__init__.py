@@ -1,7 +1,21 @@
-from .pointstreak_schedule import PointstreakSchedule
-from .sportsengine_schedule import SportsEngineSchedule
-from .dashplatform_schedule import DashPlatformSchedule
-from .debug_schedule import DebugSchedule, ScoreUpdateDebugSchedule
-from .debug_schedule import TimeUpdateDebugSchedule, GameAddDebugSchedule
-from .debug_schedule import GameRemoveDebugSchedule, GameFinalizedDebugSchedule
-from .schedule_factory import ScheduleFactory
+# Providers are only imported when they're first used, see recleagueparser.lazy
+from recleagueparser import lazy
+
+_EXPORTS = {
+    'PointstreakSchedule': '.pointstreak_schedule',
+    'SportsEngineSchedule': '.sportsengine_schedule',
+    'DashPlatformSchedule': '.dashplatform_schedule',
+    'ICSSchedule': '.ics_schedule',
+    'DebugSchedule': '.debug_schedule',
+    'ScoreUpdateDebugSchedule': '.debug_schedule',
+    'TimeUpdateDebugSchedule': '.debug_schedule',
+    'GameAddDebugSchedule': '.debug_schedule',
+    'GameRemoveDebugSchedule': '.debug_schedule',
+    'GameFinalizedDebugSchedule': '.debug_schedule',
+    'LeagueSchedule': '.league',
+    'TeamSchedule': '.league',
+    'ScheduleFactory': '.schedule_factory',
+    'ScheduleResult': '.schedule_factory',
+}
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy.exports(__name__, _EXPORTS)
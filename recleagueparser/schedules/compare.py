@@ -1,44 +1,46 @@
 from recleagueparser.schedules.schedule_factory import ScheduleFactory
-import difflib
+from recleagueparser.schedules import diff
 import logging
 import sys
 
 class ScheduleComparer(object):
 
-    DIFF_PREFIXES = ["- ", "? ", "+ "]
-
-    def __init__(self, schedule1, schedule2):
+    def __init__(self, schedule1, schedule2,
+                 tolerance=diff.RESCHEDULE_TOLERANCE):
         self._logger = logging.getLogger(self.__class__.__name__)
         self.schedule1 = schedule1
         self.schedule2 = schedule2
-        self.differ = difflib.Differ()
+        self.tolerance = tolerance
 
-    def sched_diff(self, only_future_games=True, long_diff=False, include_keywords=None, exclude_keywords=None):
+    def _refreshed_games(self, only_future_games):
         self.schedule1.refresh_schedule()
         self.schedule2.refresh_schedule()
         s1 = self.schedule1.future_games if only_future_games else self.schedule1
         s2 = self.schedule2.future_games if only_future_games else self.schedule2
-        s1 = str(s1).splitlines(keepends=True)
-        s2 = str(s2).splitlines(keepends=True)
-        res = list(self.differ.compare(s1, s2))
-        included = []
-        for l in res:
-            exclude = False
-            if exclude_keywords and len(exclude_keywords) > 0:
-                for kw in exclude_keywords:
-                    if kw in l:
-                        exclude = True
-            if not exclude:
-                if include_keywords and len(include_keywords) > 0:
-                    for kw in include_keywords:
-                        if kw in l:
-                            included.append(l)
-                else:
-                    included.append(l)
-                    
-        res = included
-        if not long_diff:
-            res = [x for x in res if x[0:2] in self.DIFF_PREFIXES]
+        return s1.games, s2.games
+
+    def changes(self, only_future_games=True):
+        """
+        Get how the second schedule differs from the first
+
+        Returns:
+            a list of GameChanges in order from first to last game
+        """
+        games1, games2 = self._refreshed_games(only_future_games)
+        return diff.diff_games(games1, games2, self.tolerance)
+
+    def sched_diff(self, only_future_games=True, long_diff=False,
+                   include_keywords=None, exclude_keywords=None):
+        games1, games2 = self._refreshed_games(only_future_games)
+        pairs = diff.match_games(games1, games2, self.tolerance)
+        res = []
+        for line in diff.render_diff(pairs, long_diff):
+            if exclude_keywords and any(kw in line for kw in exclude_keywords):
+                continue
+            if include_keywords and \
+                    not any(kw in line for kw in include_keywords):
+                continue
+            res.append(line)
         return ''.join(res)
 
 
@@ -3,14 +3,18 @@ Quick and Dirty table parser to read a team schedule
 off of DashPlatform, a team stats-tracking website
 """
 import recleagueparser.parsetime as pt
-from bs4 import BeautifulSoup
 from recleagueparser.schedules.schedule import Schedule
-from recleagueparser.schedules.game import Game
-import datetime
+from recleagueparser.schedules import keyword_filter as kf
+from recleagueparser import soup as rs
 import logging
 import sys
 
 
+def child_tags(tag):
+    """Get the elements directly under :tag:, without searching deeper"""
+    return tag.find_all(True, recursive=False)
+
+
 class DashPlatformSchedule(Schedule):
 
     DASH_URL = 'https://apps.dashplatform.com/'
@@ -22,20 +26,19 @@ class DashPlatformSchedule(Schedule):
         'awayscore': 4,
         'awayteam': 5,
     }
+    PARSE_MODE = rs.PARSE_SLICED
 
     def __init__(self, team_id, company_id, columns=None, default_game_final=False, **kwargs):
-        super(DashPlatformSchedule, self).__init__(team_id=team_id,
-                                                   company_id=company_id,
-                                                   columns=columns, **kwargs)
-        self.html_doc = None
-        self.team_id = team_id
+        # Needed by the first refresh, which happens in Schedule.__init__
         self.company_id = company_id
         self.default_game_final = default_game_final
-        self.url = self.get_schedule_url(self.team_id, self.company_id)
-        self.refresh_schedule()
+        super(DashPlatformSchedule, self).__init__(team_id=team_id,
+                                                   company=company_id,
+                                                   columns=columns, **kwargs)
 
-    def get_schedule_url(self, team_id, company):
-        sched_params = 'teamid={0}&company={1}'.format(team_id, company)
+    def get_schedule_url(self, team_id, season_id=None):
+        sched_params = 'teamid={0}&company={1}'.format(team_id,
+                                                       self.company_id)
         return "{0}{1}&{2}".format(self.DASH_URL, self.SCHEDULE_URL,
                                    sched_params)
 
@@ -44,8 +47,10 @@ class DashPlatformSchedule(Schedule):
         if self.schedule_is_stale:
             self._logger.info("Schedule is stale, refreshing")
             self.send_get_request(url)
-        soup = BeautifulSoup(self.html_doc, 'html.parser')
-        self.team_name = self.retrieve_team_name(soup)
+        if not self.document_changed:
+            return self.html_table
+        self.team_name = self.retrieve_team_name(self.parse_html('h2'))
+        soup = self.parse_html("div", {'class': table_class})
         return soup.find("div", {'class': table_class})
 
     def retrieve_team_name(self, soup):
@@ -63,86 +68,84 @@ class DashPlatformSchedule(Schedule):
             a list of PoinstreakGames in order from first to last
         """
         self._logger.info("Parsing games from DashPlatform Data Table")
-        games = []
-        now = datetime.datetime.now()
+        game_rows = []
         if self.html_table:
-            prevgame = None
             game_rows = self.html_table.find_all('div',
                                                  {'class': 'list-group-item'})
-            for game_row in game_rows:
-                # Parse Date
-                gamedate_cell = game_row.find(
-                    'div', {'class': 'event__date'}).div.find_all('div')
-                cell_date = gamedate_cell[0].text
-                cell_time = gamedate_cell[1].text.split(' ', 1)[1]
-                structured = '{} {}'.format(cell_date, cell_time)
-                parsed_date = pt.normalize_date(structured, now.year,
-                                           return_type=datetime.datetime)
-                gamedate = parsed_date.strftime(pt.DATE_DESCRIPTOR)
-
-                parsed_time = pt.normalize_time(
-                    structured, return_type=datetime.datetime
-                )
-                gametime = parsed_time.strftime(pt.TIME_DESCRIPTOR)
-
-                # Parse Score
-                event_cells = game_row.find('div', {'class': 'event__details'})
-                score_cells = event_cells.find_all('div', recursive=False)
-                away_cells = score_cells[0].find_all('div')
-                home_cells = score_cells[1].find_all('div')
-
-                # Default Team/Score values
-                ateam = "AWAY"
-                hteam = "HOME"
-                ascore = None
-                hscore = None
-
-                # Track if Game has started
-                game_started = False
-
-                # Set Away Team and Score
-                try:
-                    ateam = away_cells[0].a.text
-                    ascore = away_cells[1].text
-                    if ascore == "-":
-                        ascore = None
-                    else:
-                        game_started = True
-
-                except (AttributeError, IndexError) as err:
-                    self._logger.debug("Could not parse away cell team or score, using defaults")
-
-                # Set Home Team and Score
-                try:
-                    hteam = home_cells[0].a.text
-                    hscore = home_cells[1].text
-                    if hscore == "-":
-                        hscore = None
-                    else:
-                        game_started = True
-                except (AttributeError, IndexError) as err:
-                    self._logger.debug("Could not parse home cell team or score, using defaults")
-
-                # Game Location
-                location = None
-                field = None
-                try:
-                    location_cells = score_cells[2].find_all('div')
-                    field_cells = score_cells[3].find_all('div')
-                    location = location_cells[0].small.text
-                    field = field_cells[0].small.text
-                except:
-                    self._logger.debug("Could not find game Location, skipping.")
-                    
-                final = self.is_score_final(None, game_started)
-                game = Game(gamedate, gametime, hteam, hscore,
-                            ateam, ascore, prevgame=prevgame, final=final,
-                            location=location, field=field)
-                games.append(game)
-                prevgame = game
+        games = self.build_games(game_rows, self.parse_row)
         self._logger.info("Parsed {} Games from Data Table".format(len(games)))
         return games
 
+    def row_text(self, raw):
+        # Teams that can't be read fall back to placeholder names
+        return '{0}{1}HOME{1}AWAY'.format(
+            super(DashPlatformSchedule, self).row_text(raw),
+            kf.FIELD_SEPARATOR)
+
+    def parse_row(self, game_row):
+        """
+        Get the Game keyword arguments for a single schedule row, in one
+        walk down the row's tree. The date and time are read together into
+        the row's 'gametime', which is parsed once and never again
+        """
+        date_cells = []
+        detail_cells = []
+        for cell in child_tags(game_row):
+            classes = cell.get('class') or []
+            if 'event__date' in classes:
+                # <div class="event__date"><div><div>date</div><div>...
+                date_cells = [div for outer in child_tags(cell)
+                              for div in child_tags(outer)]
+            elif 'event__details' in classes:
+                detail_cells = child_tags(cell)
+
+        # Parse Date
+        cell_date = date_cells[0].text
+        cell_time = date_cells[1].text.split(' ', 1)[1]
+        gametime = pt.assemble_full_datetime(cell_date, cell_time,
+                                             pt.PLACEHOLDER_YEAR)
+
+        # Parse Teams and Scores, defaulting what can't be read
+        ateam, ascore = self.parse_side(detail_cells[0], "AWAY")
+        hteam, hscore = self.parse_side(detail_cells[1], "HOME")
+        game_started = ascore is not None or hscore is not None
+
+        # Game Location
+        location = None
+        field = None
+        try:
+            location = child_tags(detail_cells[2])[0].small.text
+            field = child_tags(detail_cells[3])[0].small.text
+        except (AttributeError, IndexError):
+            self._logger.debug("Could not find game Location, skipping.")
+
+        final = self.is_score_final(None, game_started)
+        return dict(gametime=gametime,
+                    hometeam=hteam, homescore=hscore,
+                    awayteam=ateam, awayscore=ascore,
+                    final=final, location=location, field=field)
+
+    def parse_side(self, side_cell, default_team):
+        """
+        Get one side's team and score from its cell. A '-' score means the
+        game hasn't started
+
+        Returns:
+            a (team, score) tuple
+        """
+        cells = child_tags(side_cell)
+        team = default_team
+        score = None
+        try:
+            team = cells[0].a.text
+            score = cells[1].text
+        except (AttributeError, IndexError):
+            self._logger.debug("Could not parse {} cell team or score, "
+                               "using defaults".format(default_team.lower()))
+        if score == "-":
+            score = None
+        return team, score
+
     def is_score_final(self, score, game_started=False):
         if game_started:
             return self.default_game_final  # TODO: Implement
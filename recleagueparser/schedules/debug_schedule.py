@@ -1,6 +1,8 @@
 from recleagueparser.schedules.schedule import Schedule
 from recleagueparser.schedules.game import Game
+from recleagueparser.schedules import diff
 import datetime
+import copy
 
 
 class DebugSchedule(Schedule):
@@ -13,7 +15,19 @@ class DebugSchedule(Schedule):
         self.refresh_count = 0
 
     def refresh_schedule(self):
+        """Every 5th refresh, update the games as this schedule does"""
         self.refresh_count += 1
+        changes = []
+        if self.refresh_count % 5 == 0:
+            changes = self.update()
+        self.emit_changes(changes)
+
+    def update(self):
+        """
+        Returns:
+            a list of GameChanges for what was updated
+        """
+        return []
 
     def parse_table(self):
         games = list()
@@ -44,58 +58,58 @@ class DebugSchedule(Schedule):
 
 class ScoreUpdateDebugSchedule(DebugSchedule):
 
-    def refresh_schedule(self):
-        self.refresh_count += 1
-        if self.refresh_count % 5 != 0:
-            return
+    def update(self):
         first = self.games[0]
         last = self.games[len(self.games) - 1]
+        old_first, old_last = copy.copy(first), copy.copy(last)
         first.homescore = 10 - first.homescore if first.homescore else None
         first.awayscore = 7 - first.awayscore if first.awayscore else None
         last.homescore = 10 - last.homescore if last.homescore else None
         last.awayscore = 7 - last.awayscore if last.awayscore else None
+        return diff.pair_changes(old_first, first) + \
+            diff.pair_changes(old_last, last)
 
 
 class GameFinalizedDebugSchedule(DebugSchedule):
 
-    def refresh_schedule(self):
-        self.refresh_count += 1
-        if self.refresh_count % 5 != 0:
-            return
+    def update(self):
         game = self.games[0]
+        old = copy.copy(game)
         game.final = True
+        return diff.pair_changes(old, game)
 
 
 class TimeUpdateDebugSchedule(DebugSchedule):
 
-    def refresh_schedule(self):
-        self.refresh_count += 1
-        if self.refresh_count % 5 != 0:
-            return
+    def update(self):
         first = self.games[0]
         last = self.games[len(self.games) - 1]
+        old_first, old_last = copy.copy(first), copy.copy(last)
         new = first.full_gametime - datetime.timedelta(days=1)
         first.parse_date(new.strftime("%a %b %d"), new.strftime("%I:%M %p"),
                          first.year, first.prevgame)
         new = last.full_gametime + datetime.timedelta(hours=1)
         last.parse_date(new.strftime("%a %b %d"), new.strftime("%I:%M %p"),
                         last.year, last.prevgame)
+        self.reindex()
+        return diff.pair_changes(old_first, first) + \
+            diff.pair_changes(old_last, last)
 
 
 class GameAddDebugSchedule(DebugSchedule):
 
-    def refresh_schedule(self):
-        self.refresh_count += 1
-        if self.refresh_count % 5 != 0:
-            return
+    def update(self):
         last = self.games[len(self.games) - 1]
         new = last.full_gametime + datetime.timedelta(hours=1)
-        self.games.append(Game(new.strftime("%a %b %d"),
-                               new.strftime("%I:%M %p EST"),
-                               'home', None,
-                               'away', None,
-                               year=new.strftime("%Y"),
-                               prevgame=None))
+        game = Game(new.strftime("%a %b %d"),
+                    new.strftime("%I:%M %p EST"),
+                    'home', None,
+                    'away', None,
+                    year=new.strftime("%Y"),
+                    prevgame=None)
+        self.games.append(game)
+        self.reindex()
+        return [diff.GameChange(diff.ADDED, None, game)]
 
 
 class GameRemoveDebugSchedule(DebugSchedule):
@@ -113,14 +127,13 @@ class GameRemoveDebugSchedule(DebugSchedule):
             games.append(game)
         return games
 
-    def refresh_schedule(self):
-        self.refresh_count += 1
-        if self.refresh_count % 5 != 0:
-            return
+    def update(self):
         if len(self.games) > 0:
+            removed = self.games[-1]
             self.games = self.games[:-1]
-        else:
-            self.parse_table()
+            return [diff.GameChange(diff.REMOVED, removed, None)]
+        self.parse_table()
+        return []
 
 
 if __name__ == '__main__':
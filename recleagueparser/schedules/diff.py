@@ -0,0 +1,141 @@
+"""
+Key-based diffing of two lists of Games, matching games up by who is
+playing and when rather than by how they print
+"""
+from collections import namedtuple, defaultdict, deque
+import functools
+import datetime
+
+# Kinds of change between two versions of a schedule
+ADDED = 'added'
+REMOVED = 'removed'
+RESCHEDULED = 'rescheduled'  # Moved to a different time or place
+SCORE_CHANGED = 'score_changed'
+FINALIZED = 'finalized'
+CANCELLED = 'cancelled'
+
+# How far a game can move and still be considered the same game
+RESCHEDULE_TOLERANCE = datetime.timedelta(days=7)
+
+GameChange = namedtuple('GameChange', ['kind', 'old', 'new'])
+
+
+def game_key(game):
+    """Get the identity of a game: who is playing, and on what day"""
+    return (game.hometeam, game.awayteam, game.full_gametime.date())
+
+
+def _unmatched(games, matched):
+    return [game for game in games if id(game) not in matched]
+
+
+def _distance(old, game):
+    return abs(game.full_gametime - old.full_gametime)
+
+
+def match_games(old_games, new_games, tolerance=RESCHEDULE_TOLERANCE):
+    """
+    Pair up the games of two versions of a schedule
+
+    Games are first matched on their teams and day, so a game that only
+    moved within its day keeps its match. Whatever's left is then matched
+    on teams alone, to the closest game no more than :tolerance: away
+
+    Returns:
+        a list of (old, new) pairs in order from first to last, where old
+        is None for an added game and new is None for a removed one
+    """
+    buckets = defaultdict(deque)
+    for game in new_games:
+        buckets[game_key(game)].append(game)
+    pairs = []
+    matched = set()
+    for old in old_games:
+        bucket = buckets.get(game_key(old))
+        if bucket:
+            new = bucket.popleft()
+            pairs.append((old, new))
+            matched.update((id(old), id(new)))
+
+    teams = defaultdict(list)
+    for game in _unmatched(new_games, matched):
+        teams[(game.hometeam, game.awayteam)].append(game)
+    for old in _unmatched(old_games, matched):
+        candidates = teams.get((old.hometeam, old.awayteam), [])
+        distance = functools.partial(_distance, old)
+        candidates = [game for game in candidates
+                      if distance(game) <= tolerance]
+        if candidates:
+            new = min(candidates, key=distance)
+            teams[(old.hometeam, old.awayteam)].remove(new)
+            pairs.append((old, new))
+            matched.update((id(old), id(new)))
+        else:
+            pairs.append((old, None))
+    pairs.extend((None, new) for new in _unmatched(new_games, matched))
+    pairs.sort(key=lambda pair: (pair[1] or pair[0]).full_gametime)
+    return pairs
+
+
+def pair_changes(old, new):
+    """Get the GameChanges between two versions of the same game"""
+    if old is None:
+        return [GameChange(ADDED, None, new)]
+    if new is None:
+        return [GameChange(REMOVED, old, None)]
+    changes = []
+    # Final and cancelled games all get a placeholder time, so only the day
+    # can be compared for them
+    if old.final or old.cancelled or new.final or new.cancelled:
+        moved = old.full_gametime.date() != new.full_gametime.date()
+    else:
+        moved = old.full_gametime != new.full_gametime
+    if moved or old.full_location != new.full_location:
+        changes.append(GameChange(RESCHEDULED, old, new))
+    if (old.homescore, old.awayscore) != (new.homescore, new.awayscore):
+        changes.append(GameChange(SCORE_CHANGED, old, new))
+    if new.final and not old.final:
+        changes.append(GameChange(FINALIZED, old, new))
+    if new.cancelled and not old.cancelled:
+        changes.append(GameChange(CANCELLED, old, new))
+    return changes
+
+
+def diff_games(old_games, new_games, tolerance=RESCHEDULE_TOLERANCE):
+    """
+    Get everything that changed between two versions of a schedule
+
+    Returns:
+        a list of GameChanges in order from first to last game. A game
+        that changed in more than one way has one GameChange per change
+    """
+    changes = []
+    for old, new in match_games(old_games, new_games, tolerance):
+        changes.extend(pair_changes(old, new))
+    return changes
+
+
+def render_diff(pairs, long_diff=False):
+    """
+    Render matched games as difflib.Differ-style lines
+
+    Args:
+        pairs (list): (old, new) pairs, as from match_games
+        long_diff (bool): Whether to include unchanged games too
+
+    Returns:
+        a list of lines, each ending in a newline
+    """
+    lines = []
+    for old, new in pairs:
+        old_line = '{0}\n'.format(old) if old is not None else None
+        new_line = '{0}\n'.format(new) if new is not None else None
+        if old_line == new_line:
+            if long_diff:
+                lines.append('  ' + old_line)
+            continue
+        if old_line is not None:
+            lines.append('- ' + old_line)
+        if new_line is not None:
+            lines.append('+ ' + new_line)
+    return lines
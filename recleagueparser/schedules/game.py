@@ -1,27 +1,53 @@
 from recleagueparser import parsetime as pt
 import datetime
+import sys
 
 DEFAULT_COMPLETED_GAME_TIME = "12:01 AM EST"
 LOCATION_JOINER = " - "
 
+
+def compact_text(value):
+    """
+    Get a plain, interned copy of a parsed string, so that text repeated
+    across games (team names, rinks, scores) is only stored once, and a bs4
+    NavigableString doesn't keep the whole page it came from alive
+    """
+    if isinstance(value, str):
+        return sys.intern(str(value))
+    return value
+
+
 class Game(object):
     """Represents a game parsed from a Pointstreak schedule"""
 
+    __slots__ = ('final', 'cancelled', 'year', 'prevgame', 'hometeam',
+                 'homescore', 'awayteam', 'awayscore', 'location', 'field',
+                 'full_gametime', '_date_text', '_time_text', '_date',
+                 '_time')
+    # What's kept of a game in a snapshot (see to_record)
+    RECORD_FIELDS = ('date', 'time', 'hometeam', 'homescore', 'awayteam',
+                     'awayscore', 'year', 'final', 'cancelled', 'location',
+                     'field', 'full_gametime', 'normalized_date',
+                     'normalized_time')
+    # How to_record writes full_gametime (as isoformat, but always with
+    # microseconds), so from_record can read it back with strptime
+    RECORD_GAMETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+
     def __init__(self, date, time, hometeam, homescore, awayteam, awayscore,
                  year=None, prevgame=None, final=False, cancelled=False,
                  location=None, field=None):
         """ Store this game's relevant data """
         self.final = final
         self.cancelled = cancelled
-        self.year = pt.determine_year(year)
+        self.year = compact_text(pt.determine_year(year))
         self.prevgame = prevgame
         self.parse_date(date, time, self.year, prevgame)
-        self.hometeam = hometeam
-        self.homescore = homescore
-        self.awayteam = awayteam
-        self.awayscore = awayscore
-        self.location = location
-        self.field = field
+        self.hometeam = compact_text(hometeam)
+        self.homescore = compact_text(homescore)
+        self.awayteam = compact_text(awayteam)
+        self.awayscore = compact_text(awayscore)
+        self.location = compact_text(location)
+        self.field = compact_text(field)
 
     @property
     def data(self):
@@ -73,13 +99,46 @@ class Game(object):
             return 'tie'
         return 'loss'
 
+    @property
+    def date(self):
+        """
+        The game's date, normalized the first time it's needed. It's taken
+        from the full gametime, so its weekday is that of the game's own
+        (season resolved) year, whenever it's read
+        """
+        if self._date is None:
+            self._date = compact_text(
+                self.full_gametime.strftime(pt.DATE_DESCRIPTOR))
+        return self._date
+
+    @date.setter
+    def date(self, date):
+        self._date = date
+
+    @property
+    def time(self):
+        """The game's time, normalized the first time it's needed"""
+        if self._time is None:
+            self._time = pt.normalize_time(self._time_text)
+        return self._time
+
+    @time.setter
+    def time(self, time):
+        self._time = time
+
     def parse_date(self, date, time, year, prevgame=None):
-        # TODO: Determine if we should actually set includes_day
+        """
+        Work out when the game is. Only the full gametime is parsed right
+        away, since ordering the schedule needs it; the date and time shown
+        for the game are kept raw until they're first used
+        """
         if self.cancelled or self.final:
             time = DEFAULT_COMPLETED_GAME_TIME
 
-        self.date = pt.normalize_date(date.strip(), includes_day=True)
-        self.time = pt.normalize_time(time.strip())
+        self._date_text = compact_text(date.strip())
+        self._time_text = compact_text(time.strip())
+        self._date = None
+        self._time = None
         self.full_gametime = pt.assemble_full_datetime(date, time, year)
 
         if prevgame is not None:
@@ -87,6 +146,75 @@ class Game(object):
                 next_year = str(int(self.year) + 1)
                 self.parse_date(date, time, next_year, prevgame)
 
+    def to_record(self):
+        """
+        Get this game as a list of its RECORD_FIELDS, for a snapshot. The
+        date and time are kept normalized when they already are, since a
+        game built from a gametime (ex: with its season's weekday) can't
+        have them normalized again from its text
+        """
+        return [self._date_text, self._time_text, self.hometeam,
+                self.homescore, self.awayteam, self.awayscore, self.year,
+                self.final, self.cancelled, self.location, self.field,
+                self.full_gametime.strftime(self.RECORD_GAMETIME_FORMAT),
+                self._date, self._time]
+
+    @classmethod
+    def from_gametime(cls, gametime, hometeam, homescore, awayteam, awayscore,
+                      final=False, cancelled=False, location=None,
+                      field=None):
+        """
+        Build a game from an already parsed gametime, without parsing any
+        date or time strings (ex: for rows read straight into a datetime)
+
+        Args:
+            gametime (datetime): When the game is, year included
+        """
+        game = cls.__new__(cls)
+        game.final = final
+        game.cancelled = cancelled
+        game.year = compact_text(str(gametime.year))
+        game.prevgame = None
+        if cancelled or final:
+            # As parse_date does with DEFAULT_COMPLETED_GAME_TIME
+            gametime = gametime.replace(hour=0, minute=1, second=0,
+                                        microsecond=0)
+        game._date = game._date_text = compact_text(
+            gametime.strftime(pt.DATE_DESCRIPTOR))
+        game._time = game._time_text = compact_text(
+            gametime.strftime(pt.TIME_DESCRIPTOR))
+        game.full_gametime = gametime
+        game.hometeam = compact_text(hometeam)
+        game.homescore = compact_text(homescore)
+        game.awayteam = compact_text(awayteam)
+        game.awayscore = compact_text(awayscore)
+        game.location = compact_text(location)
+        game.field = compact_text(field)
+        return game
+
+    @classmethod
+    def from_record(cls, record):
+        """Rebuild a game from to_record's list, without re-parsing it"""
+        game = cls.__new__(cls)
+        (date, time, hometeam, homescore, awayteam, awayscore, year,
+         game.final, game.cancelled, location, field, gametime,
+         normalized_date, normalized_time) = record
+        game.year = compact_text(year)
+        game.prevgame = None
+        game._date_text = compact_text(date)
+        game._time_text = compact_text(time)
+        game._date = compact_text(normalized_date)
+        game._time = compact_text(normalized_time)
+        game.full_gametime = datetime.datetime.strptime(
+            gametime, cls.RECORD_GAMETIME_FORMAT)
+        game.hometeam = compact_text(hometeam)
+        game.homescore = compact_text(homescore)
+        game.awayteam = compact_text(awayteam)
+        game.awayscore = compact_text(awayscore)
+        game.location = compact_text(location)
+        game.field = compact_text(field)
+        return game
+
     def __repr__(self):
         """Print this game's most relevant info all together"""
         if self.homescore and self.awayscore:
@@ -2,33 +2,80 @@
 Quick and Dirty ics parser to read a team schedule
 """
 from recleagueparser.schedules.schedule import Schedule
-from recleagueparser.schedules.game import Game, LOCATION_JOINER
+from recleagueparser.schedules import ics_stream
+from recleagueparser.schedules import keyword_filter as kf
+from recleagueparser import instrumentation as ins
+from recleagueparser import response_cache as rc
+from recleagueparser.schedules.game import LOCATION_JOINER
 import recleagueparser.parsetime as pt
-from icalendar import Calendar
+import datetime
 import sys
+import os
+
 
 class ICSSchedule(Schedule):
 
-    def __init__(self, url=None, file=None, opponent_delimiter="vs.", **kwargs):
+    def __init__(self, url=None, file=None, opponent_delimiter="vs.",
+                 streaming=True, **kwargs):
         self.url = url
         self.file = file
         self.opponent_delimiter = opponent_delimiter
+        self.streaming = streaming
+        self.file_stamp = None
         super(ICSSchedule, self).__init__(url, **kwargs)
-        self.html_doc = None
-        self.refresh_schedule()
+
+    @property
+    def schedule_is_stale(self):
+        if self.url:
+            return super(ICSSchedule, self).schedule_is_stale
+        return True  # Checking a local file for changes is just a stat
 
     def get_schedule_url(self, *args, **kwargs):
         return self.url
 
     def retrieve_html_table(self, url):
+        """
+        Get the calendar to parse: the text of the feed at :url:, or the
+        path of the local file (which is only read as it's parsed)
+        """
         if self.schedule_is_stale:
             self._logger.info("Schedule is stale, refreshing")
             if self.url:
                 self.send_get_request(url)
             else:
-                with open(self.file, 'r') as f:
-                    self.html_doc = f.read()
-        return self.html_doc
+                self.check_file(self.file)
+        return self.html_doc if self.url else self.file
+
+    def fetch_document(self):
+        # Getting the calendar never parses any of it
+        self.retrieve_html_table(self.url)
+
+    @ins.timed(ins.FETCH)
+    def check_file(self, path):
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        self.fetch_status = rc.FETCH_REVALIDATED \
+            if stamp == self.file_stamp else rc.FETCH_FULL
+        if self.fetch_status == rc.FETCH_FULL:
+            ins.count(self, ins.BYTES_FETCHED, stat.st_size)
+        else:
+            ins.count(self, ins.CACHE_HITS)
+        self.file_stamp = stamp
+        self.last_refresh = datetime.datetime.now()
+
+    def iter_events(self):
+        """
+        Get the EventFields of every VEVENT in the calendar, either streamed
+        or (when not streaming) parsed with icalendar
+        """
+        if self.streaming:
+            if self.url:
+                return ics_stream.iter_events([self.html_doc])
+            return ics_stream.iter_file_events(self.file)
+        if self.url:
+            return ics_stream.iter_calendar_events(self.html_doc)
+        with open(self.file, 'rb') as f:
+            return ics_stream.iter_calendar_events(f.read())
 
     def parse_table(self):
         """
@@ -38,41 +85,54 @@ class ICSSchedule(Schedule):
             a list of Games in order from first to last
         """
         self._logger.info("Parsing games from ICS file")
-        games = []
-        prevgame = None
-        if self.html_doc:
-            cal = Calendar.from_ical(self.html_doc)
-            for i in cal.walk():
-                if i.name == "VEVENT":
-                    # Parse Teams
-                    ateam, hteam = self.parse_summary(i.get("summary"))
-
-                    # Parse Date
-                    dt = i.get("dtstart").dt
-                    gamedate = dt.strftime(pt.DATE_DESCRIPTOR)
-                    gameyear = dt.year
-                    gametime = dt.strftime(pt.TIME_DESCRIPTOR)
-
-                    # Parse Location
-                    # TODO: assuming BA format of "$LOCATION - $RINK"
-                    full_loc = i.get("location")
-                    location, field = self.parse_location(full_loc)
-
-                    # Parse Score  #TODO: implement
-                    hscore = 0
-                    ascore = 0
-                    final = False
-
-                    # Add game to Schedule
-                    game = Game(gamedate, gametime, hteam, hscore,
-                                ateam, ascore, year=gameyear,
-                                prevgame=prevgame, final=final,
-                                location=location, field=field)
-                    games.append(game)
-                    prevgame = game
-        self._logger.info("Parsed {} Games from Data Table".format(len(games)))  
+        if not self.html_table:
+            return []
+        try:
+            games = self.build_games(self.iter_events(), self.parse_row)
+        except ics_stream.UnsupportedCalendar as err:
+            # Only the tokenizer's errors; a bad row is an error either way
+            if not self.streaming:
+                raise
+            self._logger.warning(
+                "Could not stream calendar ({}), using icalendar".format(err))
+            self.streaming = False
+            games = self.build_games(self.iter_events(), self.parse_row)
+        self._logger.info("Parsed {} Games from Data Table".format(len(games)))
         return games
 
+    def fingerprint_row(self, raw):
+        return raw
+
+    def row_text(self, raw):
+        return '{0}{1}{2}'.format(raw.summary, kf.FIELD_SEPARATOR,
+                                  raw.location or '')
+
+    def parse_row(self, event):
+        """Get the Game keyword arguments for a single VEVENT's fields"""
+        # Parse Teams
+        ateam, hteam = self.parse_summary(event.summary)
+
+        # Parse Date
+        dt = event.dtstart
+        gamedate = dt.strftime(pt.DATE_DESCRIPTOR)
+        gameyear = dt.year
+        gametime = dt.strftime(pt.TIME_DESCRIPTOR)
+
+        # Parse Location
+        # TODO: assuming BA format of "$LOCATION - $RINK"
+        location, field = self.parse_location(event.location)
+
+        # Parse Score  #TODO: implement
+        hscore = 0
+        ascore = 0
+        final = False
+
+        return dict(date=gamedate, time=gametime,
+                    hometeam=hteam, homescore=hscore,
+                    awayteam=ateam, awayscore=ascore,
+                    year=gameyear, final=final,
+                    location=location, field=field)
+
     def parse_location(self, full_location, delim=LOCATION_JOINER):
         if not full_location:
             return None, None
@@ -0,0 +1,167 @@
+"""
+Streaming VEVENT tokenizer for iCalendar feeds, pulling out just the fields
+a schedule needs without building the whole calendar in memory
+"""
+from collections import namedtuple
+import datetime
+import codecs
+import mmap
+import re
+
+# The parts of a VEVENT a Game is built from
+EventFields = namedtuple('EventFields', ['dtstart', 'summary', 'location'])
+
+WANTED = frozenset(['DTSTART', 'SUMMARY', 'LOCATION'])
+DTSTART_REGEX = re.compile(
+    r'^(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2})?Z?)?$')
+ESCAPE_REGEX = re.compile(r'\\([\\;,nN])')
+CHUNK_SIZE = 64 * 1024
+
+
+class UnsupportedCalendar(ValueError):
+    """Markup the tokenizer can't handle, but icalendar may"""
+
+
+def iter_physical_lines(chunks):
+    """
+    Split a stream of text or bytes chunks (split anywhere, ex: a chunked
+    HTTP body) into lines, without ever joining the whole stream
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')('replace')
+    pending = ''
+    for chunk in chunks:
+        if isinstance(chunk, (bytes, bytearray)):
+            chunk = decoder.decode(chunk)
+        if pending:
+            chunk = pending + chunk
+        start = 0
+        end = chunk.find('\n')
+        while end >= 0:
+            yield chunk[start:end].rstrip('\r')
+            start = end + 1
+            end = chunk.find('\n', start)
+        pending = chunk[start:]
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending.rstrip('\r')
+
+
+def iter_lines(chunks):
+    """Get the content lines of a stream, undoing RFC 5545 line folding"""
+    current = None
+    for line in iter_physical_lines(chunks):
+        if line[:1] in (' ', '\t'):
+            if current is not None:
+                current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def split_property(line):
+    """
+    Split a content line like 'DTSTART;TZID="A:B":20200815T194500' into its
+    upper-cased name and its value (colons in quoted parameters are skipped)
+    """
+    quoted = False
+    for i, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ':' and not quoted:
+            return line[:i].split(';', 1)[0].upper(), line[i + 1:]
+    raise UnsupportedCalendar("Malformed content line: {!r}".format(line[:80]))
+
+
+def unescape(value):
+    return ESCAPE_REGEX.sub(
+        lambda match: '\n' if match.group(1) in 'nN' else match.group(1),
+        value)
+
+
+def parse_dtstart(value):
+    """
+    Get the wall-clock time of a DATE or DATE-TIME value, as icalendar shows
+    it: in the event's own time zone (or UTC for '...Z' values)
+    """
+    match = DTSTART_REGEX.match(value.strip())
+    if match is None:
+        raise UnsupportedCalendar("Unsupported DTSTART: {!r}".format(value))
+    return datetime.datetime(*[int(part) for part in match.groups() if part])
+
+
+def iter_events(chunks):
+    """
+    Tokenize an iCalendar stream one VEVENT at a time
+
+    Args:
+        chunks (iterable): str or bytes chunks of the calendar, ex: an
+            open file, a memory map's lines or a response's iter_content
+
+    Yields:
+        an EventFields for each VEVENT that has a start time
+
+    Raises:
+        UnsupportedCalendar: if the stream has markup this tokenizer can't
+            handle, in which case icalendar should be used instead
+    """
+    depth = 0
+    fields = None
+    for line in iter_lines(chunks):
+        name, value = split_property(line)
+        if name == 'BEGIN':
+            if fields is not None:
+                depth += 1  # ex: a VALARM inside the VEVENT
+            elif value.strip().upper() == 'VEVENT':
+                fields = dict()
+        elif fields is None:
+            continue
+        elif name == 'END':
+            if depth:
+                depth -= 1
+                continue
+            if 'DTSTART' in fields:
+                yield EventFields(parse_dtstart(fields['DTSTART']),
+                                  unescape(fields.get('SUMMARY', '')),
+                                  unescape(fields['LOCATION'])
+                                  if 'LOCATION' in fields else None)
+            fields = None
+        elif depth == 0 and name in WANTED:
+            fields[name] = value
+
+
+def iter_file_events(path):
+    """
+    Tokenize an iCalendar file through a memory map, so the file is paged
+    in as it's read rather than loaded all at once
+    """
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files can't be mapped
+            return
+        with mapped:
+            for fields in iter_events(iter(
+                    lambda: mapped.read(CHUNK_SIZE), b'')):
+                yield fields
+
+
+def iter_calendar_events(ical):
+    """
+    Get the same EventFields as iter_events, using icalendar to parse the
+    whole calendar. Slower and holds everything in memory, but handles
+    anything icalendar does
+    """
+    from icalendar import Calendar
+    for event in Calendar.from_ical(ical).walk('VEVENT'):
+        dtstart = event.get('dtstart')
+        if dtstart is None:
+            continue
+        dt = dtstart.dt
+        if not isinstance(dt, datetime.datetime):
+            dt = datetime.datetime(dt.year, dt.month, dt.day)
+        location = event.get('location')
+        yield EventFields(dt, str(event.get('summary', '')),
+                          str(location) if location is not None else None)
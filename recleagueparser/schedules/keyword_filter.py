@@ -0,0 +1,119 @@
+"""
+Compiled include/exclude keyword filtering for schedules, applied as early
+as possible so filtered-out games are never fully built
+"""
+from recleagueparser import parsetime as pt
+import functools
+import datetime
+import re
+
+FIELD_SEPARATOR = '\x1f'  # Keeps a keyword from matching across fields
+
+
+@functools.lru_cache(maxsize=1)
+def all_dates_text():
+    """Every date a Game can show, on every weekday, lowercased"""
+    # Seven consecutive leap years put every day of the year (Feb 29
+    # included) on every weekday
+    start = datetime.date(2000, 1, 1)
+    dates = set()
+    for offset in range(366):
+        day = start + datetime.timedelta(days=offset)
+        for leap_year in range(2000, 2028, 4):
+            dates.add(day.replace(year=leap_year).strftime(
+                pt.DATE_DESCRIPTOR).lower())
+    return '\n'.join(sorted(dates))
+
+
+def compile_keywords(keywords):
+    """Build one regex matching any of :keywords:, ignoring case"""
+    if not keywords:
+        return None
+    keywords = sorted(set(kw.lower() for kw in keywords), key=len,
+                      reverse=True)
+    return re.compile('|'.join(re.escape(kw) for kw in keywords))
+
+
+def could_match_date(keywords):
+    """Whether any of :keywords: could be part of a Game's date"""
+    return any(kw.lower() in all_dates_text() for kw in keywords or [])
+
+
+class KeywordFilter(object):
+    """
+    Decides which games to keep, from a schedule's include and exclude
+    keywords. A game is kept when it matches an include keyword (or there
+    are none), and doesn't match any exclude keyword. Keywords are matched
+    case-insensitively against the teams, location, field and date
+
+    Use compile_filter to get one, so the regexes are only built once
+    """
+
+    def __init__(self, include_keywords=None, exclude_keywords=None):
+        self.include = compile_keywords(include_keywords)
+        self.exclude = compile_keywords(exclude_keywords)
+        self.include_dated = could_match_date(include_keywords)
+        self.dated = self.include_dated or could_match_date(exclude_keywords)
+
+    @property
+    def active(self):
+        return self.include is not None or self.exclude is not None
+
+    def accepts_text(self, text):
+        """Decide on a game from its lowercased searchable text"""
+        if self.exclude is not None and self.exclude.search(text):
+            return False
+        return self.include is None or self.include.search(text) is not None
+
+    def accepts(self, game):
+        # A game's date is only worked out if a keyword could match it
+        date = (game.date or '') if self.dated else ''
+        return self.accepts_text(FIELD_SEPARATOR.join([
+            game.hometeam or '', game.awayteam or '', game.location or '',
+            game.field or '', date]).lower())
+
+    def accepts_row(self, row):
+        """
+        Decide on a game from its Game keyword arguments, before it's built.
+        The date is only normalized when a keyword could match it
+        """
+        if self.dated and 'gametime' in row:
+            # The weekday isn't known until the season's year is, so only
+            # the built Game can be matched on its date
+            return True
+        date = ''
+        if self.dated and row.get('date'):
+            date = pt.normalize_date(row['date'].strip(), includes_day=True)
+        return self.accepts_text(FIELD_SEPARATOR.join([
+            row.get('hometeam') or '', row.get('awayteam') or '',
+            row.get('location') or '', row.get('field') or '',
+            date]).lower())
+
+    def may_accept_raw(self, text):
+        """
+        Decide on a raw table row from its text, before anything is
+        extracted from it. Only rows that can't match any include keyword
+        are rejected here: the raw text holds more than the searched fields,
+        so it can't prove an exclude keyword matches one of them
+
+        Args:
+            text (str): All the text a row's searched fields could come
+                from (ex: its cells, and the schedule's own team name)
+
+        Returns:
+            False if the row can safely be skipped, otherwise True
+        """
+        if self.include is None or self.include_dated:
+            return True
+        return self.include.search(text.lower()) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_filter(include_keywords, exclude_keywords):
+    return KeywordFilter(include_keywords, exclude_keywords)
+
+
+def compile_filter(include_keywords=None, exclude_keywords=None):
+    """Get the (shared) KeywordFilter for a set of keywords"""
+    return _compile_filter(tuple(include_keywords or ()),
+                           tuple(exclude_keywords or ()))
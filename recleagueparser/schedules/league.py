@@ -0,0 +1,150 @@
+"""
+League-wide schedule ingestion: one schedule of every game in a league
+(ex: the league's ICS feed) is fetched and parsed once, and split into a
+schedule per team that all share its Games
+"""
+from recleagueparser.schedules.schedule import Schedule
+from recleagueparser.schedules import schedule_factory
+from recleagueparser.schedules import diff
+from collections import defaultdict
+import threading
+import datetime
+
+
+class LeagueSchedule(object):
+    """
+    Splits the games of a league-wide schedule up by team
+
+    Args:
+        source (Schedule): A schedule of every game in the league, naming
+            both teams of each game (ex: an ICSSchedule of a league feed)
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self._partition = dict()
+        self._partitioned = None  # The source games _partition was made of
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, schedule_type, **kwargs):
+        """Build the league from a ScheduleFactory type and its arguments"""
+        return cls(schedule_factory.ScheduleFactory.create(schedule_type,
+                                                           **kwargs))
+
+    @property
+    def teams(self):
+        """Every team with a game in the league's schedule"""
+        self.partition()
+        return sorted(team for team, games in self._partition.items()
+                      if games)
+
+    def refresh(self):
+        """
+        Refresh the league's schedule (only fetching it if it's stale),
+        however many team schedules are refreshed from it
+
+        Returns:
+            how the league's schedule was refreshed
+        """
+        with self._lock:
+            return self.source.refresh_schedule()
+
+    def partition(self):
+        """Split the league's games up by team, if they changed since the
+        last time they were"""
+        games = self.source.games
+        with self._lock:
+            if games is self._partitioned:
+                return self._partition
+            partition = defaultdict(list)
+            for game in games:
+                partition[game.hometeam].append(game)
+                if game.awayteam != game.hometeam:
+                    partition[game.awayteam].append(game)
+            self._partition = dict(partition)
+            self._partitioned = games
+            return self._partition
+
+    def team_games(self, team):
+        """
+        Get the games :team: plays in. The same list is returned until the
+        league's games change
+        """
+        partition = self.partition()
+        with self._lock:
+            return partition.setdefault(team, list())
+
+    def team_schedule(self, team, **kwargs):
+        """
+        Get the schedule of one team in the league
+
+        Args:
+            team (str): The team's name, as the league's schedule has it
+            kwargs: Any other Schedule arguments (ex: include_keywords)
+        """
+        return TeamSchedule(self, team, **kwargs)
+
+    def team_schedules(self, teams=None, **kwargs):
+        """
+        Get a schedule for each of :teams: (defaults to every team in the
+        league), by team name
+        """
+        if teams is None:
+            teams = self.teams
+        return dict((team, self.team_schedule(team, **kwargs))
+                    for team in teams)
+
+
+class TeamSchedule(Schedule):
+    """
+    One team's view of a LeagueSchedule. Refreshing it refreshes the
+    league's schedule, which only fetches and parses it once for all of
+    its teams; the team's Games are the league's own Game objects
+
+    Args:
+        league (LeagueSchedule): The league the team plays in
+        team (str): The team's name, as the league's schedule has it
+    """
+
+    _local_state = ('league', '_team_games')
+
+    def __init__(self, league, team, **kwargs):
+        self.league = league
+        self._team_games = None
+        super(TeamSchedule, self).__init__(team_id=team, **kwargs)
+
+    @property
+    def schedule_is_stale(self):
+        return self.league.source.schedule_is_stale
+
+    def get_schedule_url(self, team_id, season_id):
+        return self.league.source.url
+
+    def snapshot_key(self):
+        # Every team in the league has the league's URL
+        return repr((super(TeamSchedule, self).snapshot_key(), self.team_id))
+
+    def revalidate(self):
+        """Refresh the league, and take this team's games from it"""
+        with self.refresh_lock:
+            loaded = self._team_games is not None or \
+                self.snapshot_expires is not None
+            self.snapshot_expires = None
+            self.fetch_status = self.league.refresh()
+            self.last_refresh = datetime.datetime.now()
+            self.team_name = self.team_id
+            games = self.league.team_games(self.team_id)
+            if games is self._team_games:
+                self.emit_changes([])
+                return self.fetch_status
+            old_games = self.games
+            self._team_games = games
+            # A copy, so nothing done to this schedule's list reaches the
+            # league's
+            self.games = list(self._filter_games(games, self.include_keywords,
+                                                 self.exclude_keywords))
+            self.save_snapshot()
+            if loaded:
+                self.emit_changes(diff.diff_games(old_games, self.games))
+            return self.fetch_status
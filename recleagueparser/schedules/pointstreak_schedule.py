@@ -3,7 +3,6 @@ Quick and Dirty table parser to read a team schedule
 off of Poinstreak, a team stats-tracking website
 """
 from recleagueparser.schedules.schedule import Schedule
-from recleagueparser.schedules.game import Game
 
 # Default Poinstreak URL info
 PS_URL = 'http://stats.pointstreak.com'
@@ -41,23 +40,24 @@ class PointstreakSchedule(Schedule):
             a list of PoinstreakGames in order from first to last
         """
         self._logger.info("Parsing games from Pointstreak Data Table")
-        games = []
-        if self.html_table:
-            prevgame = None
-            for game_row in self.html_table.find_all('tr'):
-                cells = game_row.find_all('td')
-                gamedate = cells[self.columns['gameday']].string
-                gametime = cells[self.columns['gametime']].string
-                home, hscore = self.parse_team(cells[self.columns['hometeam']])
-                away, ascore = self.parse_team(cells[self.columns['awayteam']])
-                final = self.is_score_final(None)
-                game = Game(gamedate, gametime, home, hscore,
-                            away, ascore, prevgame=prevgame, final=final)
-                games.append(game)
-                prevgame = game
+        rows = self.html_table.find_all('tr') if self.html_table else []
+        games = self.build_games(rows, self.parse_row)
         self._logger.info("Parsed {} games".format(len(games)))
         return games
 
+    def parse_row(self, game_row):
+        """Get the Game keyword arguments for a single schedule row"""
+        cells = game_row.find_all('td')
+        gamedate = cells[self.columns['gameday']].string
+        gametime = cells[self.columns['gametime']].string
+        home, hscore = self.parse_team(cells[self.columns['hometeam']])
+        away, ascore = self.parse_team(cells[self.columns['awayteam']])
+        final = self.is_score_final(None)
+        return dict(date=gamedate, time=gametime,
+                    hometeam=home, homescore=hscore,
+                    awayteam=away, awayscore=ascore,
+                    final=final)
+
     def is_score_final(self, score):
         return False  # TODO: Implement
 
@@ -1,7 +1,16 @@
-from bs4 import BeautifulSoup
-from requests import get
+from recleagueparser.schedules.season import SeasonResolver
+from recleagueparser.schedules.game import Game
+from recleagueparser.schedules import keyword_filter as kf
+from recleagueparser.schedules import diff
+from recleagueparser import instrumentation as ins
+from recleagueparser import background as bg
+from recleagueparser import parse_pool as pp
+from recleagueparser import snapshots as ss
+from recleagueparser import soup as rs
+from recleagueparser.refreshable import Refreshable
 import datetime
 import logging
+import bisect
 
 # Unused for now, may be useful later for run limits in Amazon Lambda
 FREE_REQUESTS = 1000000
@@ -13,16 +22,31 @@ MAX_RESPONSES = FREE_REQUESTS if MAX_RESPONSES > FREE_REQUESTS else \
     MAX_RESPONSES
 
 
-class Schedule(object):
+class Schedule(Refreshable):
 
-    STALE_TIME = 60
     DEFAULT_COLUMNS = {}
+    PAGE_NAME = 'Schedule'
+    TABLES_ATTR = 'html_table'
+    last_changes = ()
+    _listeners = ()
+    _changed = None
+    _rows_unique = False
+    # What was parsed last time, and who's told about changes to it
+    _local_state = ('_games', '_index', '_changed', '_listeners',
+                    'last_changes')
+    # Trees, and Games cached by row, can't be reused by another process
+    _fresh_state = dict(html_table=None, _row_cache=dict())
 
     def __init__(self, team_id, season_id=None, company=None,
                  columns=None, include_keywords=[], exclude_keywords=[],
-                 **kwargs):
+                 parse_mode=None, parser=None, background=False,
+                 refresher=None, snapshots=None, parse_pool=None, **kwargs):
         self._logger = logging.getLogger(self.__class__.__name__)
+        self.parse_mode = parse_mode or self.PARSE_MODE
+        self.parser = parser or self.PARSER
         self.html_doc = None
+        self.html_table = None
+        self.fetch_status = None
         self.team_id = team_id
         self.season_id = season_id
         self.company = company
@@ -30,12 +54,19 @@ class Schedule(object):
         self.include_keywords = include_keywords
         self.exclude_keywords = exclude_keywords
         self.games = list()
-        self.columns = self.DEFAULT_COLUMNS
+        self._row_cache = dict()
+        self.columns = dict(self.DEFAULT_COLUMNS)
         if columns and isinstance(columns, dict):
             self.columns.update(columns)
         self.url = self.get_schedule_url(team_id, season_id)
-        self.refresh_schedule()
-        self.last_refresh = datetime.datetime.now()
+        self.parse_pool = pp.parse_pool(parse_pool)
+        self.snapshots = ss.snapshot_store(snapshots)
+        if self.snapshots is None or not self.snapshots.restore(self):
+            self.refresh_schedule()
+            self.last_refresh = datetime.datetime.now()
+        if background or refresher is not None:
+            self.refresher = refresher or bg.default_refresher()
+            self.refresher.add(self, 'revalidate', self.STALE_TIME)
 
     def __repr__(self):
         """Prints the list of games in order to form a schedule"""
@@ -44,6 +75,15 @@ class Schedule(object):
             res += '{0}\n'.format(game)
         return res
 
+    @property
+    def games(self):
+        return self._games
+
+    @games.setter
+    def games(self, games):
+        self._games = games
+        self.reindex()
+
     @property
     def future_games(self):
         class FutureSchedule(Schedule):
@@ -51,19 +91,18 @@ class Schedule(object):
             def __init__(self, games=[], *args, **kwargs):
                 self.games=games
 
-        fgames = []
-        for g in self.games:
-            if g.future:
-                fgames.append(g)
-        fsched = FutureSchedule(fgames)
+        games, times = self._index
+        start = bisect.bisect_right(times, datetime.datetime.now())
+        fsched = FutureSchedule(games[start:])
         return fsched
 
     @property
     def schedule_is_stale(self):
-        if self.html_doc is None:
-            return True
-        now = datetime.datetime.now()
-        return (now - self.last_refresh).total_seconds() > self.STALE_TIME
+        return super(Schedule, self).is_stale
+
+    @property
+    def is_stale(self):
+        return self.schedule_is_stale
 
     @property
     def length(self):
@@ -71,12 +110,20 @@ class Schedule(object):
 
     @property
     def games_remaining(self):
-        val = 0
-        now = datetime.datetime.now()
-        for game in self.games:
-            if game.full_gametime > now:
-                val += 1
-        return val
+        times = self._index[1]
+        return len(times) - bisect.bisect_right(times,
+                                                datetime.datetime.now())
+
+    def reindex(self):
+        """
+        Rebuild the sorted gametime index backing the time-based lookups.
+        Called whenever the games are replaced, and must be called again by
+        anything that changes a game's time in place
+        """
+        games = sorted(self._games, key=lambda game: game.full_gametime)
+        # Swapped in whole, so a read on another thread never mixes the
+        # games of one refresh with the times of another
+        self._index = (games, [game.full_gametime for game in games])
 
     def get_schedule_url(self, team_id, season_id):
         raise NotImplementedError
@@ -95,9 +142,10 @@ class Schedule(object):
         Returns:
             the next game after :target_datetime:
         """
-        for game in self.games:
-            if game.full_gametime > target_datetime:
-                return game
+        games, times = self._index
+        pos = bisect.bisect_right(times, target_datetime)
+        if pos < len(games):
+            return games[pos]
         return None
 
     def get_last_game_before(self, target_datetime):
@@ -110,11 +158,27 @@ class Schedule(object):
         Returns:
             the last game before :target_datetime:
         """
-        last_game = None
-        for game in self.games:
-            last_game = game if game.full_gametime < target_datetime \
-                else last_game
-        return last_game
+        games, times = self._index
+        pos = bisect.bisect_left(times, target_datetime)
+        if pos > 0:
+            return games[pos - 1]
+        return None
+
+    def get_games_between(self, start_datetime, end_datetime):
+        """
+        Get every game in a window of time
+
+        Args:
+            start_datetime (datetime): The start of the window (inclusive)
+            end_datetime (datetime): The end of the window (exclusive)
+
+        Returns:
+            a list of the games in the window, in order from first to last
+        """
+        games, times = self._index
+        start = bisect.bisect_left(times, start_datetime)
+        end = bisect.bisect_left(times, end_datetime)
+        return games[start:end]
 
     def get_next_game(self):
         """
@@ -137,15 +201,100 @@ class Schedule(object):
     def parse_table(self):
         raise NotImplementedError
 
-    def _game_has_keyword(self, game, keyword):
-        kw = keyword.lower()
-        return any([
-            kw in game.hometeam.lower(),
-            kw in game.awayteam.lower(),
-            kw in game.location.lower() if game.location else False,
-            kw in game.field.lower() if game.field else False,
-            kw in game.date.lower() if game.date else False,
-        ])
+    def build_games(self, rows, parse_row=None):
+        """
+        Build the Games for a schedule table, resolving the season year for
+        the whole table in a single pass
+
+        When :parse_row: is given, :rows: are the raw rows of the table and
+        only the rows that changed since the last build are parsed; the
+        Games for every other row are reused as they are
+
+        Args:
+            rows (iterable): dicts of Game keyword arguments, in table order,
+                or raw rows to be turned into them by :parse_row:
+            parse_row (callable): Turns a raw row into a dict of Game
+                keyword arguments
+
+        Returns:
+            a list of Games in order from first to last
+        """
+        resolver = SeasonResolver()
+        self._changed = None
+        if parse_row is None:
+            for row in rows:
+                with ins.span(self, ins.CONSTRUCT):
+                    resolver.add_row(row)
+            ins.count(self, ins.GAMES_CONSTRUCTED, len(resolver.games))
+            return resolver.games
+        keyword_filter = self.keyword_filter
+        row_cache = dict()
+        # The old Games whose rows changed or went away, and the Games built
+        # in their place, so a refresh only has to diff those
+        dropped = list()
+        built = list()
+        rebuilt = bool(self._row_cache) and self._rows_unique
+        duplicated = False
+        parsed = 0
+        reused = 0
+        skipped = 0
+        for raw in rows:
+            # Rows that can't match the keywords are dropped before anything
+            # is extracted from them, and rows that don't match once
+            # extracted are dropped before their Game is built
+            if keyword_filter.active and \
+                    not keyword_filter.may_accept_raw(self.row_text(raw)):
+                skipped += 1
+                continue
+            key = self.fingerprint_row(raw)
+            resolved = self._row_cache.pop(key, None)
+            if resolved is not None and resolver.reuse(resolved):
+                reused += 1
+            else:
+                if resolved is not None:
+                    dropped.append(resolved.game)
+                row = parse_row(raw)
+                parsed += 1
+                if keyword_filter.active and \
+                        not keyword_filter.accepts_row(row):
+                    skipped += 1
+                    continue
+                with ins.span(self, ins.CONSTRUCT):
+                    resolved = resolver.add_row(row)
+                built.append(resolved.game)
+            duplicated = duplicated or key in row_cache
+            row_cache[key] = resolved
+        dropped.extend(resolved.game for resolved in self._row_cache.values())
+        # Identical rows share a key, so only one of them can be matched up
+        # between builds
+        if rebuilt and not duplicated:
+            self._changed = (dropped, built)
+        self._row_cache = row_cache
+        self._rows_unique = not duplicated
+        self._logger.debug("Reused {} of {} Games, filtered out {}".format(
+            reused, len(resolver.games), skipped))
+        ins.count(self, ins.ROWS_PARSED, parsed)
+        ins.count(self, ins.ROWS_REUSED, reused)
+        ins.count(self, ins.GAMES_CONSTRUCTED,
+                  len(resolver.games) - reused)
+        return resolver.games
+
+    def fingerprint_row(self, raw):
+        """Get the key that tells whether a raw table row has changed"""
+        return rs.fingerprint(raw)
+
+    def row_text(self, raw):
+        """
+        Get all the text a raw table row's teams, location, field and date
+        could come from, for filtering rows before they're parsed
+        """
+        return '{0}{1}{2}'.format(raw.get_text(), kf.FIELD_SEPARATOR,
+                                  self.team_name or '')
+
+    @property
+    def keyword_filter(self):
+        """The compiled filter for this schedule's include/exclude keywords"""
+        return kf.compile_filter(self.include_keywords, self.exclude_keywords)
 
     def _filter_games(self, games, include_keywords, exclude_keywords):
         """
@@ -158,33 +307,111 @@ class Schedule(object):
         Returns:
             A list of filtered games
         """
-        filtered_games = []
-        for game in games:
-            include_game = False if self.include_keywords else True
-            for keyword in include_keywords:
-                if self._game_has_keyword(game, keyword):
-                    include_game = True
-                    break
-            for keyword in exclude_keywords:
-                if self._game_has_keyword(game, keyword):
-                    include_game = False
-                    break
-            if include_game:
-                filtered_games.append(game)
-
-        return filtered_games
+        keyword_filter = kf.compile_filter(include_keywords, exclude_keywords)
+        if not keyword_filter.active:
+            return games
+        return [game for game in games if keyword_filter.accepts(game)]
 
     def refresh_schedule(self):
-        """Reload the schedule from pointstreak"""
-        self._logger.info("Refreshing Schedule")
-        self.html_table = self.retrieve_html_table(self.url)
+        """
+        Reload the schedule from pointstreak. A schedule restored from a
+        snapshot isn't reloaded until the snapshot expires. When refreshed
+        in the background, the games already parsed are kept as they are,
+        and a stale schedule is only queued to be revalidated
+
+        Returns:
+            how the page was refreshed: FETCH_HIT, FETCH_REVALIDATED or
+            FETCH_FULL
+        """
+        return self.refresh()
+
+    def revalidate(self):
+        """Reload the schedule now, if it's stale, and report what changed"""
+        with self.refresh_lock:
+            # Only a schedule that already had games has changes to report
+            loaded = self.html_table is not None or self._pool_parsed or \
+                self.snapshot_expires is not None
+            old_games = self.games
+            status = super(Schedule, self).revalidate()
+            if self.games is old_games:
+                self.emit_changes([])
+            elif loaded:
+                self.emit_changes(self.find_changes(old_games))
+            return status
+
+    def retrieve_tables(self):
+        return self.retrieve_html_table(self.url)
+
+    def extract(self):
         games = self.parse_table()
-        self.games = self._filter_games(games, self.include_keywords, self.exclude_keywords)
+        self.games = self._filter_games(games, self.include_keywords,
+                                        self.exclude_keywords)
+
+    def find_changes(self, old_games):
+        """
+        Get what changed in the games since :old_games:. When the last build
+        could tell which rows changed, only their Games are compared
+
+        Returns:
+            a list of GameChanges in order from first to last game
+        """
+        if self._changed is None:
+            return diff.diff_games(old_games, self.games)
+        dropped, built = self._changed
+        keyword_filter = self.keyword_filter
+        if keyword_filter.active:
+            accepts = keyword_filter.accepts
+            dropped = [game for game in dropped if accepts(game)]
+            built = [game for game in built if accepts(game)]
+        return diff.diff_games(dropped, built)
+
+    def add_listener(self, callback):
+        """
+        Get told about every change a refresh finds in the games
 
-    def send_get_request(self, url):
-        self._logger.info("Retrieving Schedule")
-        self.html_doc = get(url).text
-        self.last_refresh = datetime.datetime.now()
+        Args:
+            callback (callable): Called with the schedule and a list of its
+                GameChanges after each refresh that changed anything. A
+                schedule refreshed in the background calls it from the
+                background thread
+        """
+        self._listeners = self._listeners + (callback,)
+
+    def remove_listener(self, callback):
+        self._listeners = tuple(listener for listener in self._listeners
+                                if listener != callback)
+
+    def emit_changes(self, changes):
+        """Record what the last refresh changed, and pass it on to the
+        listeners if it changed anything"""
+        self.last_changes = changes
+        if not changes:
+            return
+        for listener in self._listeners:
+            try:
+                listener(self, changes)
+            except Exception:
+                self._logger.exception("Schedule change listener failed")
+
+    def snapshot_key(self):
+        """What a snapshot must have been taken of to be restored here"""
+        return repr((self.url, sorted(self.columns.items()),
+                     list(self.include_keywords or []),
+                     list(self.exclude_keywords or [])))
+
+    def snapshot_fields(self):
+        return list(Game.RECORD_FIELDS)
+
+    def snapshot_data(self):
+        return dict(team_name=self.team_name,
+                    games=[game.to_record() for game in self.games])
+
+    def restore_snapshot(self, data):
+        # The restored Games replace these, so none can be reused
+        self._row_cache = dict()
+        self._changed = None
+        self.team_name = data['team_name']
+        self.games = [Game.from_record(record) for record in data['games']]
 
     def retrieve_html_table_with_class(self, url, table_class):
         """
@@ -200,7 +427,9 @@ class Schedule(object):
         if self.schedule_is_stale:
             self._logger.info("Schedule data is stale, refreshing")
             self.send_get_request(url)
-        soup = BeautifulSoup(self.html_doc, 'html.parser')
+        if not self.document_changed:
+            return self.html_table
+        soup = self.parse_html("table", {'class': table_class})
         table = soup.find("table", {'class': table_class})
         if table.tbody:
             return table.tbody
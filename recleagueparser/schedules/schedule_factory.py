@@ -1,42 +1,81 @@
-from recleagueparser.schedules.pointstreak_schedule import (
-    PointstreakSchedule)
-from recleagueparser.schedules.sportsengine_schedule import (
-    SportsEngineSchedule)
-from recleagueparser.schedules.dashplatform_schedule import (
-    DashPlatformSchedule)
-from recleagueparser.schedules.ics_schedule import (
-    ICSSchedule
-)
-from recleagueparser.schedules.debug_schedule import (
-    DebugSchedule, ScoreUpdateDebugSchedule, TimeUpdateDebugSchedule,
-    GameAddDebugSchedule, GameRemoveDebugSchedule, GameFinalizedDebugSchedule)
+from recleagueparser import lazy
+from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
+import logging
+
+DEFAULT_MAX_WORKERS = 16
+
+# The outcome of building one schedule in a batch: either the schedule, or
+# the error raised while building it
+ScheduleResult = namedtuple('ScheduleResult', ['spec', 'schedule', 'error'])
+
+# Each schedule type's class, only imported once a schedule of that type is
+# created
+SCHEDULE_TYPES = {
+    'pointstreak': 'recleagueparser.schedules.pointstreak_schedule.'
+                   'PointstreakSchedule',
+    'sportsengine': 'recleagueparser.schedules.sportsengine_schedule.'
+                    'SportsEngineSchedule',
+    'dash': 'recleagueparser.schedules.dashplatform_schedule.'
+            'DashPlatformSchedule',
+    'ics': 'recleagueparser.schedules.ics_schedule.ICSSchedule',
+    'debug': 'recleagueparser.schedules.debug_schedule.DebugSchedule',
+    'debug_scoreupdate': 'recleagueparser.schedules.debug_schedule.'
+                         'ScoreUpdateDebugSchedule',
+    'debug_timeupdate': 'recleagueparser.schedules.debug_schedule.'
+                        'TimeUpdateDebugSchedule',
+    'debug_gameadd': 'recleagueparser.schedules.debug_schedule.'
+                     'GameAddDebugSchedule',
+    'debug_gameremove': 'recleagueparser.schedules.debug_schedule.'
+                        'GameRemoveDebugSchedule',
+    'debug_gamefinal': 'recleagueparser.schedules.debug_schedule.'
+                       'GameFinalizedDebugSchedule',
+}
 
 
 class ScheduleFactory(object):
 
     def create(schedule_type, **kwargs):
-        if schedule_type == 'pointstreak':
-            return PointstreakSchedule(**kwargs)
-        elif schedule_type == 'sportsengine':
-            return SportsEngineSchedule(**kwargs)
-        elif schedule_type == 'dash':
-            return DashPlatformSchedule(**kwargs)
-        elif schedule_type == 'ics':
-            return ICSSchedule(**kwargs)
-        elif schedule_type == 'debug':
-            return DebugSchedule(**kwargs)
-        elif schedule_type == 'debug_scoreupdate':
-            return ScoreUpdateDebugSchedule(**kwargs)
-        elif schedule_type == 'debug_timeupdate':
-            return TimeUpdateDebugSchedule(**kwargs)
-        elif schedule_type == 'debug_gameadd':
-            return GameAddDebugSchedule(**kwargs)
-        elif schedule_type == 'debug_gameremove':
-            return GameRemoveDebugSchedule(**kwargs)
-        elif schedule_type == 'debug_gamefinal':
-            return GameFinalizedDebugSchedule(**kwargs)
-        else:
+        if schedule_type not in SCHEDULE_TYPES:
             raise ValueError("Schedule Type '{0}' not found"
                              .format(schedule_type))
+        return lazy.load(SCHEDULE_TYPES[schedule_type])(**kwargs)
 
     create = staticmethod(create)
+
+    def create_many(specs, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Build many schedules at once, fetching and parsing them concurrently
+
+        Args:
+            specs (iterable): dicts of the arguments to create, each with a
+                'schedule_type' and that type's keyword arguments
+            max_workers (int): The most schedules to build at the same time
+
+        Returns:
+            a ScheduleResult for each spec, in the same order as :specs:. A
+            schedule that failed to build has its error set instead of
+            raising, so one bad team doesn't stop the rest from loading
+        """
+        specs = list(specs)
+        logger = logging.getLogger(ScheduleFactory.__name__)
+
+        def build(spec):
+            kwargs = dict(spec)
+            schedule_type = kwargs.pop('schedule_type', None)
+            try:
+                return ScheduleResult(
+                    spec, ScheduleFactory.create(schedule_type, **kwargs),
+                    None)
+            except Exception as err:
+                logger.warning("Could not create {0} schedule: {1}".format(
+                    schedule_type, err))
+                return ScheduleResult(spec, None, err)
+
+        if not specs:
+            return []
+        workers = max(1, min(max_workers, len(specs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(build, specs))
+
+    create_many = staticmethod(create_many)
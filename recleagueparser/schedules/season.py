@@ -0,0 +1,125 @@
+"""
+Season-wide year resolution for a parsed schedule table
+"""
+from recleagueparser import parsetime as pt
+from recleagueparser.schedules.game import Game
+from collections import namedtuple
+
+# A Game as resolved from one row, with what's needed to check later whether
+# it can be reused as-is when the same row shows up in a later refresh
+ResolvedRow = namedtuple('ResolvedRow', ['game', 'row_year', 'start_year',
+                                         'base_time', 'rolled_over'])
+
+
+class SeasonResolver(object):
+    """
+    Resolves the season year for a schedule table one row at a time,
+    carrying it forward across any December -> January rollover
+
+    Args:
+        year (str): The year the season starts in (defaults to this year)
+    """
+
+    def __init__(self, year=None):
+        self.season_year = int(pt.determine_year(year))
+        self.prevgame = None
+        self.games = []
+
+    def rolls_over(self, gametime):
+        return self.prevgame is not None and \
+            self.prevgame.full_gametime > gametime
+
+    def add_row(self, row):
+        """
+        Build and add the Game for a row
+
+        Args:
+            row (dict): Game keyword arguments (at least 'date' and 'time').
+                A row may carry its own 'year', which is then trusted as-is.
+                A row may instead carry a 'gametime' datetime already
+                parsed from it, which is only moved to the season's year
+
+        Returns:
+            the ResolvedRow for the new Game
+        """
+        row = dict(row)
+        row_year = row.pop('year', None)
+        if row_year is not None:
+            self.season_year = int(row_year)
+        start_year = self.season_year
+        game = self.build(row, start_year)
+        base_time = game.full_gametime
+        # Dates going backwards means the season rolled into a new year.
+        # Only this game is re-parsed; every game after it already
+        # starts from the new year.
+        rolled_over = row_year is None and self.rolls_over(base_time)
+        if rolled_over:
+            self.season_year += 1
+            if 'gametime' in row:
+                game = self.build(row, self.season_year)
+            else:
+                game.year = str(self.season_year)
+                game.parse_date(row['date'], row['time'], game.year)
+        self._append(game)
+        return ResolvedRow(game, row_year, start_year, base_time, rolled_over)
+
+    def build(self, row, year):
+        """Build the Game for a row in :year:"""
+        gametime = row.get('gametime')
+        if gametime is None:
+            return Game(year=year, **row)
+        fields = dict(row)
+        del fields['gametime']
+        try:
+            return Game.from_gametime(gametime.replace(year=int(year)),
+                                      **fields)
+        except ValueError:
+            # Feb 29 outside a leap year: read it the way a date string is
+            return Game(gametime.strftime(pt.DATE_DESCRIPTOR),
+                        gametime.strftime(pt.TIME_DESCRIPTOR), year=year,
+                        **fields)
+
+    def reuse(self, resolved):
+        """
+        Add a Game resolved in an earlier pass, if it would still resolve
+        to the same year here
+
+        Returns:
+            True if the Game was added, False if the row needs rebuilding
+        """
+        if resolved.row_year is not None:
+            self.season_year = int(resolved.row_year)
+        elif resolved.start_year != self.season_year or \
+                self.rolls_over(resolved.base_time) != resolved.rolled_over:
+            return False
+        if resolved.rolled_over:
+            self.season_year += 1
+        self._append(resolved.game)
+        return True
+
+    def _append(self, game):
+        # Games aren't linked to the one before them, so holding on to one
+        # game doesn't keep the rest of its season alive
+        self.games.append(game)
+        self.prevgame = game
+
+
+def resolve_season(rows, year=None):
+    """
+    Build the Games for a whole schedule table in a single pass, carrying
+    the season year forward across any December -> January rollover
+
+    Args:
+        rows (iterable): dicts of Game keyword arguments (at least 'date'
+            and 'time'), in the order they appear on the schedule. A row
+            may carry its own 'year', which is then trusted as-is
+        year (str): The year the season starts in (defaults to this year)
+
+    Returns:
+        a list of Games in order from first to last, each parsed with its
+        final year
+    """
+    resolver = SeasonResolver(year)
+    for row in rows:
+        resolver.add_row(row)
+    return resolver.games
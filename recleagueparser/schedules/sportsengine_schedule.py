@@ -2,9 +2,8 @@
 Quick and Dirty table parser to read a team schedule
 off of SportsEngine, a team stats-tracking website
 """
-from bs4 import BeautifulSoup
 from recleagueparser.schedules.schedule import Schedule
-from recleagueparser.schedules.game import Game
+from recleagueparser import soup as rs
 import logging
 import sys
 
@@ -27,14 +26,14 @@ class SportsEngineSchedule(Schedule):
         'location': 3
     }
     CANCELLED_TEXT = "cancelled"
+    PARSE_MODE = rs.PARSE_SLICED
 
     def __init__(self, team_id, season_id, **kwargs):
         super(SportsEngineSchedule, self).__init__(
             team_id=team_id, season_id=season_id, **kwargs)
-        self.team_name = self.parse_team_name()
 
     def parse_team_name(self):
-        soup = BeautifulSoup(self.html_doc, 'html.parser')
+        soup = self.parse_html('h2')
         return soup.h2.a.text
 
     def get_schedule_url(self, team_id, season_id):
@@ -43,32 +42,39 @@ class SportsEngineSchedule(Schedule):
         return '{0}/{1}/{2}'.format(SE_URL, SE_SCHED_EXT, sched_params)
 
     def retrieve_html_table(self, url):
-        return self.retrieve_html_table_with_class(
+        table = self.retrieve_html_table_with_class(
             url, 'statTable sortable noSortImages')
+        if self.document_changed:
+            team_name = self.parse_team_name()
+            if team_name != self.team_name:
+                # Every row embeds the team name, none can be reused
+                self._row_cache.clear()
+            self.team_name = team_name
+        return table
 
     def parse_table(self):
         self._logger.info("Parsing Games from SportsEngine Data Table")
-        games = []
-        prevgame = None
-        for game_row in self.html_table.find_all('tr'):
-            cells = game_row.find_all('td')
-            gamedate = cells[self.columns['gameday']].text
-            gametime = self.get_game_time(cells[self.columns['gametime']])
-            cancelled = self.is_game_cancelled(gametime)
-            hometeam, awayteam = self.parse_teams(
-                cells[self.columns['awayteam']])
-            homescore, awayscore = self.parse_score(
-                cells[self.columns['result']],
-                cells[self.columns['awayteam']])
-            final = self.is_score_final(cells[self.columns['result']])
-            game = Game(gamedate, gametime, hometeam, homescore, awayteam,
-                        awayscore, prevgame=prevgame, final=final,
-                        cancelled=cancelled)
-            games.append(game)
-            prevgame = game
+        games = self.build_games(self.html_table.find_all('tr'),
+                                 self.parse_row)
         self._logger.info("Parsed {} Games from Table".format(len(games)))
         return games
 
+    def parse_row(self, game_row):
+        """Get the Game keyword arguments for a single schedule row"""
+        cells = game_row.find_all('td')
+        gamedate = cells[self.columns['gameday']].text
+        gametime = self.get_game_time(cells[self.columns['gametime']])
+        cancelled = self.is_game_cancelled(gametime)
+        hometeam, awayteam = self.parse_teams(cells[self.columns['awayteam']])
+        homescore, awayscore = self.parse_score(
+            cells[self.columns['result']],
+            cells[self.columns['awayteam']])
+        final = self.is_score_final(cells[self.columns['result']])
+        return dict(date=gamedate, time=gametime,
+                    hometeam=hometeam, homescore=homescore,
+                    awayteam=awayteam, awayscore=awayscore,
+                    final=final, cancelled=cancelled)
+
     def is_home_team(self, opponent):
         return True if opponent.div.text.strip()[:1] == '@' else False
 
@@ -0,0 +1,165 @@
+"""
+Shared, pooled HTTP sessions, so repeated fetches from the same host reuse
+kept-alive connections instead of opening a new one every time. Requests to
+each host are also rate limited, however many sessions they're sent from
+"""
+from recleagueparser import rate_limit
+from urllib.parse import urlsplit
+import threading
+import logging
+
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) secs
+DEFAULT_POOL_SIZE = 16  # Kept-alive connections per host
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5  # secs, doubled on each retry
+
+_logger = logging.getLogger(__name__)
+
+
+def host_of(url):
+    """Get the 'scheme://host[:port]' a URL is served from"""
+    parts = urlsplit(url)
+    return '{0}://{1}'.format(parts.scheme, parts.netloc).lower()
+
+
+class SessionPool(object):
+    """
+    Hands out requests Sessions keyed by host. Every session for a host
+    shares that host's adapter, and with it the host's pool of kept-alive
+    connections, its retry policy, its default timeout and its rate limiter
+
+    Args:
+        pool_size (int): Connections to keep alive per host
+        retries (int): Times to retry a failed idempotent request
+        backoff (float): Base delay between retries, in secs
+        timeout (float/tuple): Default timeout for requests made without
+            one, as for requests
+        rate (float): Most requests per sec to each host, backed off from
+            when a host throttles or slows down. None to not limit them
+        burst (int): Requests to each host sent at once before the rate
+            applies
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, retries=DEFAULT_RETRIES,
+                 backoff=DEFAULT_BACKOFF, timeout=DEFAULT_TIMEOUT,
+                 rate=rate_limit.DEFAULT_RATE,
+                 burst=rate_limit.DEFAULT_BURST):
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.rate = rate
+        self.burst = burst
+        self._adapters = dict()
+        self._limiters = dict()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def adapter(self, url):
+        """Get the shared adapter for the host serving :url:"""
+        host = host_of(url)
+        with self._lock:
+            adapter = self._adapters.get(host)
+            if adapter is None:
+                from recleagueparser import adapters
+                _logger.debug("Creating connection pool for {}".format(host))
+                adapter = adapters.pooled_adapter(
+                    self.pool_size, self.retries, self.backoff, self.timeout,
+                    self._limiter(host))
+                self._adapters[host] = adapter
+        return adapter
+
+    def _limiter(self, host):
+        # Kept when the adapters are closed, so a host's backoff and stats
+        # outlive its connections
+        if self.rate is None:
+            return None
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = self._limiters[host] = rate_limit.HostLimiter(
+                self.rate, self.burst)
+        return limiter
+
+    def limiter(self, url):
+        """Get the rate limiter for the host serving :url:, if it has one"""
+        with self._lock:
+            return self._limiter(host_of(url))
+
+    def stats(self):
+        """
+        Get how each host's requests have been rate limited
+
+        Returns:
+            a dict of LimiterStats (ex: the secs queued for a token) by host
+        """
+        with self._lock:
+            limiters = dict(self._limiters)
+        return dict((host, limiter.stats())
+                    for host, limiter in limiters.items())
+
+    def new_session(self, url):
+        """
+        Get a new Session of its own (ex: for logging in, so cookies aren't
+        shared), whose requests to :url:'s host still go through the
+        shared connection pool
+        """
+        import requests  # Deferred, it's slow to import
+        session = requests.Session()
+        session.mount(host_of(url), self.adapter(url))
+        return session
+
+    def session(self, url):
+        """
+        Get the shared Session for :url:'s host. Sessions aren't safe to
+        share between threads, so each thread gets its own, all backed by
+        the same connection pool
+        """
+        host = host_of(url)
+        sessions = getattr(self._local, 'sessions', None)
+        if sessions is None:
+            sessions = self._local.sessions = dict()
+        session = sessions.get(host)
+        if session is None:
+            session = sessions[host] = self.new_session(url)
+        return session
+
+    def get(self, url, **kwargs):
+        return self.session(url).get(url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            adapters, self._adapters = self._adapters, dict()
+        for adapter in adapters.values():
+            adapter.close()
+
+
+DEFAULT_POOL = SessionPool()
+
+
+def configure(**kwargs):
+    """
+    Replace the shared session pool
+
+    Args:
+        kwargs: pool_size, retries, backoff, timeout, rate and/or burst, as
+            for SessionPool
+    """
+    global DEFAULT_POOL
+    DEFAULT_POOL.close()
+    DEFAULT_POOL = SessionPool(**kwargs)
+    return DEFAULT_POOL
+
+
+def get(url, **kwargs):
+    """GET :url: through the shared session pool"""
+    return DEFAULT_POOL.get(url, **kwargs)
+
+
+def new_session(url):
+    """Get a new Session backed by the shared pool for :url:'s host"""
+    return DEFAULT_POOL.new_session(url)
+
+
+def stats():
+    """Get how each host's requests through the shared pool were limited"""
+    return DEFAULT_POOL.stats()
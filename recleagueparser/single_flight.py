@@ -0,0 +1,61 @@
+"""
+Coalescing of identical work: when several threads ask for the same thing
+at once (ex: schedules with different keywords all fetching one team page),
+only the first does the work and the rest wait for and share its result
+"""
+import threading
+
+
+class _Flight(object):
+
+    __slots__ = ['done', 'result', 'error']
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Runs a function once for all the callers asking for the same key while
+    it's running. Nothing is kept once it returns: a later call with the
+    same key runs it again
+    """
+
+    def __init__(self):
+        self._flights = dict()
+        self._lock = threading.Lock()
+
+    def run(self, key, function):
+        """
+        Call :function:, or wait for the call already running for :key:
+
+        Returns:
+            a tuple of the result, and whether it came from another
+            caller's call. If that call raised, so does this one
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+        try:
+            flight.result = function()
+        except Exception as err:
+            flight.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result, False
+
+    def running(self, key):
+        with self._lock:
+            return key in self._flights
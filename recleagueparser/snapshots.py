@@ -0,0 +1,143 @@
+"""
+On-disk snapshots of parsed schedules and stats, so a cold start (ex: a new
+Lambda container) can pick up where the last one left off instead of
+fetching and parsing every page again
+
+A snapshot is a small JSON file holding the parsed objects as positional
+records, the fields those records hold, and when the data was fetched
+"""
+import datetime
+import tempfile
+import hashlib
+import logging
+import json
+import time
+import os
+
+SNAPSHOT_VERSION = 2  # 2: Gametimes always recorded with microseconds
+
+_logger = logging.getLogger(__name__)
+
+
+def to_record(obj):
+    """Get a Player or Team as a list of its fields, in __slots__ order"""
+    return [getattr(obj, field) for field in obj.__slots__]
+
+
+def from_record(cls, record):
+    """Rebuild a Player or Team from to_record's list (its __init__ takes
+    its fields in __slots__ order)"""
+    return cls(*record)
+
+
+class SnapshotStore(object):
+    """
+    Saves and loads snapshots in a directory
+
+    Args:
+        directory (str): Where to keep the snapshot files
+        max_age (float): How long a snapshot is served for after its data
+            was fetched, in secs. Defaults to each object's STALE_TIME
+    """
+
+    def __init__(self, directory, max_age=None):
+        self.directory = directory
+        self.max_age = max_age
+
+    def path(self, obj):
+        key = hashlib.sha1(obj.snapshot_key().encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, '{0}-{1}.json'.format(
+            type(obj).__name__, key[:20]))
+
+    def expiry(self, obj, fetched):
+        max_age = self.max_age if self.max_age is not None else obj.STALE_TIME
+        return fetched + max_age
+
+    def save(self, obj):
+        """
+        Write :obj:'s parsed data, replacing any older snapshot
+
+        Returns:
+            True if the snapshot was written. Failing to write one is only
+            logged, since the object itself is still fine
+        """
+        snapshot = dict(version=SNAPSHOT_VERSION, type=type(obj).__name__,
+                        key=obj.snapshot_key(),
+                        fields=obj.snapshot_fields(),
+                        fetched=obj.last_refresh.timestamp(),
+                        data=obj.snapshot_data())
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Written aside and moved into place, so a reader never sees
+            # half of it
+            handle, temp_path = tempfile.mkstemp(dir=self.directory,
+                                                 suffix='.tmp')
+        except OSError as err:
+            _logger.warning("Could not save snapshot: {}".format(err))
+            return False
+        try:
+            with os.fdopen(handle, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, separators=(',', ':'))
+            os.replace(temp_path, self.path(obj))
+        except OSError as err:
+            _logger.warning("Could not save snapshot: {}".format(err))
+            os.remove(temp_path)
+            return False
+        return True
+
+    def load(self, obj):
+        """
+        Get the data of :obj:'s snapshot, if there's one that's current,
+        unexpired and from this version of the format
+
+        Returns:
+            a tuple of the snapshot's data and when it was fetched (epoch
+            secs), or None
+        """
+        try:
+            with open(self.path(obj), encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            _logger.warning("Unreadable snapshot for {}: {}".format(
+                type(obj).__name__, err))
+            return None
+        if snapshot.get('version') != SNAPSHOT_VERSION or \
+                snapshot.get('type') != type(obj).__name__ or \
+                snapshot.get('key') != obj.snapshot_key() or \
+                snapshot.get('fields') != obj.snapshot_fields():
+            return None
+        if self.expiry(obj, snapshot['fetched']) <= time.time():
+            return None
+        return snapshot['data'], snapshot['fetched']
+
+    def restore(self, obj):
+        """
+        Hydrate :obj: from its snapshot, and hold off refreshing it until
+        the snapshot expires
+
+        Returns:
+            True if :obj: was restored, False if it needs a full refresh
+        """
+        loaded = self.load(obj)
+        if loaded is None:
+            return False
+        data, fetched = loaded
+        try:
+            obj.restore_snapshot(data)
+        except (KeyError, IndexError, TypeError, ValueError) as err:
+            _logger.warning("Bad snapshot for {}: {}".format(
+                type(obj).__name__, err))
+            return False
+        obj.last_refresh = datetime.datetime.fromtimestamp(fetched)
+        obj.snapshot_expires = datetime.datetime.fromtimestamp(
+            self.expiry(obj, fetched))
+        return True
+
+
+def snapshot_store(snapshots):
+    """Get a SnapshotStore from a store or a directory path (or None)"""
+    if snapshots is None or isinstance(snapshots, SnapshotStore):
+        return snapshots
+    return SnapshotStore(snapshots)
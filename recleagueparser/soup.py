@@ -0,0 +1,215 @@
+"""
+BeautifulSoup helpers for parsing only the part of a page a provider needs
+
+The trees built for the last few documents are kept and shared, so objects
+reading the same fetched page (ex: schedules with different keywords for
+one team) parse it once between them. Nothing here changes a tree once
+it's built, so it's safe to read from several threads
+"""
+from recleagueparser.single_flight import SingleFlight
+from collections import OrderedDict
+import threading
+import logging
+import re
+
+# How much of a document to build a tree for
+PARSE_FULL = 'full'  # The whole page, as BeautifulSoup normally would
+PARSE_STRAINED = 'strained'  # Tokenize everything, only build the targets
+PARSE_SLICED = 'sliced'  # Cut the targets' markup out first, parse only that
+
+DEFAULT_FEATURES = 'html.parser'
+FAST_FEATURES = 'lxml'
+
+ATTR_REGEX = re.compile(
+    r'''([^\s=/>]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?''')
+
+DOCUMENTS_KEPT = 8  # How many parsed trees are kept for sharing
+
+_logger = logging.getLogger(__name__)
+_trees = OrderedDict()  # key -> (document, tree), least recently used first
+_trees_lock = threading.Lock()
+_flights = SingleFlight()
+
+
+def shared_tree(html_doc, key, build):
+    """
+    Get the tree :build: makes for :html_doc:, building it only if no one
+    has (or is) for this same document object and :key:
+    """
+    # The document is kept alongside its tree, so its id can't be reused
+    # by another document while the entry is around
+    key = (id(html_doc),) + key
+    with _trees_lock:
+        kept = _trees.get(key)
+        if kept is not None:
+            _trees.move_to_end(key)
+            return kept[1]
+    tree, _ = _flights.run(key, build)
+    with _trees_lock:
+        _trees[key] = (html_doc, tree)
+        while len(_trees) > DOCUMENTS_KEPT:
+            _trees.popitem(last=False)
+    return tree
+
+
+def cache_clear():
+    """Drop every kept tree, so the next parse of a document starts over"""
+    with _trees_lock:
+        _trees.clear()
+
+
+def resolve_features(features=None):
+    """
+    Get the parser backend to hand to BeautifulSoup, falling back to the
+    builtin html.parser when an optional one (like lxml) isn't installed
+    """
+    if features is None or features == DEFAULT_FEATURES:
+        return DEFAULT_FEATURES
+    try:
+        __import__(features)
+    except ImportError:
+        _logger.debug("Parser '{}' not installed, using {}".format(
+            features, DEFAULT_FEATURES))
+        return DEFAULT_FEATURES
+    return features
+
+
+def class_matcher(target):
+    """
+    Match a class attribute the way BeautifulSoup's find does: either the
+    whole attribute is :target:, or one of its classes is
+    """
+    def matches(value):
+        if value is None:
+            return False
+        if not isinstance(value, str):
+            value = ' '.join(value)
+        return value == target or target in value.split()
+    return matches
+
+
+def strainer_attrs(attrs):
+    if not attrs:
+        return {}
+    strained = dict(attrs)
+    if isinstance(strained.get('class'), str):
+        strained['class'] = class_matcher(strained['class'])
+    return strained
+
+
+def start_tag_matches(start_tag, attrs):
+    """Check the attributes of a raw start tag like '<table class="x">'"""
+    if not attrs:
+        return True
+    found = dict()
+    inner = start_tag[1:-1].split(None, 1)
+    for match in ATTR_REGEX.finditer(inner[1] if len(inner) > 1 else ''):
+        value = [v for v in match.group(2, 3, 4) if v is not None]
+        found[match.group(1).lower()] = value[0] if value else ''
+    for key, expected in attrs.items():
+        value = found.get(key)
+        if key == 'class':
+            if not class_matcher(expected)(value):
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+def slice_elements(html_doc, name, attrs=None):
+    """
+    Cut the markup of every outermost :name: element matching :attrs: out
+    of a raw document, without building a tree
+
+    Returns:
+        a list of markup strings, or None if the markup couldn't be cut
+        cleanly (ex: an unclosed element)
+    """
+    open_regex = re.compile(r'<{0}\b[^>]*>'.format(name), re.IGNORECASE)
+    tag_regex = re.compile(r'<(/?){0}\b[^>]*>'.format(name), re.IGNORECASE)
+    slices = []
+    pos = 0
+    while True:
+        start = open_regex.search(html_doc, pos)
+        if start is None:
+            return slices
+        if not start_tag_matches(start.group(0), attrs):
+            pos = start.end()
+            continue
+        end = start.end()
+        depth = 0 if start.group(0).endswith('/>') else 1
+        for tag in tag_regex.finditer(html_doc, start.end()):
+            if depth == 0:
+                break
+            if tag.group(0).endswith('/>'):
+                continue
+            depth += -1 if tag.group(1) else 1
+            end = tag.end()
+        if depth != 0:
+            return None
+        slices.append(html_doc[start.start():end])
+        pos = end
+
+
+def parse_elements(html_doc, name, attrs=None, mode=PARSE_FULL,
+                   features=None):
+    """
+    Parse a document, building a tree for only as much of it as needed to
+    find the :name:/:attrs: elements
+
+    Args:
+        html_doc (str): The raw document
+        name (str): The tag name of the target elements (ex: 'table')
+        attrs (dict): Attributes the target elements have, as for find
+        mode (str): PARSE_FULL, PARSE_STRAINED or PARSE_SLICED
+        features (str): The BeautifulSoup parser to use, defaults to
+            html.parser
+
+    Returns:
+        a BeautifulSoup tree, on which find/find_all for the target
+        elements work exactly as they would on the full document. It's
+        shared with anything else parsing the same elements of :html_doc:
+    """
+    features = resolve_features(features)
+    if mode == PARSE_FULL:
+        return parse_document(html_doc, features)
+    key = (name, repr(sorted((attrs or {}).items())), mode, features)
+    return shared_tree(html_doc, key, lambda: _parse_elements(
+        html_doc, name, attrs, mode, features))
+
+
+def _parse_elements(html_doc, name, attrs, mode, features):
+    # Deferred, it's slow to import
+    from bs4 import BeautifulSoup, SoupStrainer
+    if mode == PARSE_SLICED:
+        slices = slice_elements(html_doc, name, attrs)
+        if slices is not None:
+            return BeautifulSoup(''.join(slices), features)
+        _logger.debug("Could not slice <{}>, straining instead".format(name))
+        mode = PARSE_STRAINED
+    if mode == PARSE_STRAINED and features != 'html5lib':
+        return BeautifulSoup(html_doc, features, parse_only=SoupStrainer(
+            name, strainer_attrs(attrs)))
+    return parse_document(html_doc, features)
+
+
+def parse_document(html_doc, features=None):
+    """
+    Parse a whole document. Its tree is kept and shared, so looking up
+    several elements in the same page only parses it once
+    """
+    from bs4 import BeautifulSoup  # Deferred, it's slow to import
+    features = resolve_features(features)
+    return shared_tree(html_doc, (features,),
+                       lambda: BeautifulSoup(html_doc, features))
+
+
+def fingerprint(tag):
+    """
+    Get a cheap key identifying an element's content, for spotting which
+    rows of a table changed without extracting anything from them. Covers
+    the text and the tag structure, so markup-only changes (ex: a status
+    div appearing) still count as changes
+    """
+    return (tag.get_text('\x1f'),
+            tuple(child.name for child in tag.find_all(True)))
@@ -1,3 +1,10 @@
-from .sportsengine_team_stats import SportsEngineTeamStats
-from .dashplatform_team_stats import DashPlatformTeamStats
-from .team_stats_factory import TeamStatsFactory
+# Providers are only imported when they're first used, see recleagueparser.lazy
+from recleagueparser import lazy
+
+_EXPORTS = {
+    'SportsEngineTeamStats': '.sportsengine_team_stats',
+    'DashPlatformTeamStats': '.dashplatform_team_stats',
+    'TeamStatsFactory': '.team_stats_factory',
+}
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = lazy.exports(__name__, _EXPORTS)
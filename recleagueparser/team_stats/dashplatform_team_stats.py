@@ -4,6 +4,7 @@ off of SportsEngine, a team stats-tracking website
 """
 from recleagueparser.team_stats.team_stats import TeamStats
 from recleagueparser.team_stats.team import Team
+from recleagueparser import soup as rs
 
 
 DASH_URL = 'https://apps.dashplatform.com'
@@ -24,10 +25,11 @@ class DashPlatformTeamStats(TeamStats):
         'goals_for': 6,
         'goals_against': 7
     }
+    PARSE_MODE = rs.PARSE_SLICED
 
     def __init__(self, team_id, company_id, **kwargs):
         super(DashPlatformTeamStats, self).__init__(
-            league_id=team_id, season_id=company_id)
+            league_id=team_id, season_id=company_id, **kwargs)
 
     def get_stats_url(self, league_id, season_id):
         params = 'teamid={0}&company={1}'.format(league_id, season_id)
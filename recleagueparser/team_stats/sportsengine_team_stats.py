@@ -4,6 +4,7 @@ off of SportsEngine, a team stats-tracking website
 """
 from recleagueparser.team_stats.team_stats import TeamStats
 from recleagueparser.team_stats.team import Team
+from recleagueparser import soup as rs
 
 
 SE_URL = 'http://www.pahl.org'
@@ -25,6 +26,7 @@ class SportsEngineTeamStats(TeamStats):
         'goals_against': 8,
         'division': 9
     }
+    PARSE_MODE = rs.PARSE_SLICED
 
     def get_stats_url(self, league_id, season_id):
         params = '{0}?subseason={1}'.format(league_id, season_id)
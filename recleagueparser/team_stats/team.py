@@ -1,5 +1,8 @@
 class Team(object):
 
+    __slots__ = ('name', 'points', 'games_played', 'wins', 'losses', 'ties',
+                 'goals_for', 'goals_against', 'division')
+
     def __init__(self, name, points=0, games_played=0, wins=0, losses=0,
                  ties=0, goals_for=0, goals_against=0, division='0-0-0'):
         self.name = name
@@ -1,22 +1,40 @@
-from bs4 import BeautifulSoup
-from requests import get
+from recleagueparser.team_stats.team import Team
+from recleagueparser import instrumentation as ins
+from recleagueparser import background as bg
+from recleagueparser import parse_pool as pp
+from recleagueparser import snapshots as ss
+from recleagueparser.refreshable import Refreshable
 import datetime
 import logging
 
 
-class TeamStats(object):
+class TeamStats(Refreshable):
 
-    STALE_TIME = 60
+    PAGE_NAME = 'TeamStats'
+    _local_state = ('teams',)
+    _fresh_state = dict(html_tables=None)
 
-    def __init__(self, league_id, season_id, **kwargs):
+    def __init__(self, league_id, season_id, parse_mode=None, parser=None,
+                 background=False, refresher=None, snapshots=None,
+                 parse_pool=None, **kwargs):
         self._logger = logging.getLogger(self.__class__.__name__)
+        self.parse_mode = parse_mode or self.PARSE_MODE
+        self.parser = parser or self.PARSER
         self.html_doc = None
+        self.html_tables = None
+        self.fetch_status = None
         self.teams = list()
         self.last_refresh = datetime.datetime.now()
         self.url = self.get_stats_url(league_id, season_id)
         self.league_id = league_id
         self.season_id = season_id
-        self.refresh_stats()
+        self.parse_pool = pp.parse_pool(parse_pool)
+        self.snapshots = ss.snapshot_store(snapshots)
+        if self.snapshots is None or not self.snapshots.restore(self):
+            self.refresh_stats()
+        if background or refresher is not None:
+            self.refresher = refresher or bg.default_refresher()
+            self.refresher.add(self, 'revalidate', self.STALE_TIME)
 
     def __repr__(self):
         """Prints the list of games in order to form a schedule"""
@@ -34,13 +52,6 @@ class TeamStats(object):
     def full_table(self):
         return self._get_string_representation(short=False)
 
-    @property
-    def is_stale(self):
-        if self.html_doc is None:
-            return True
-        now = datetime.datetime.now()
-        return (now - self.last_refresh).total_seconds() > self.STALE_TIME
-
     def _get_string_representation(self, short=False):
         res = ''
         for team in self.standings:
@@ -67,15 +78,36 @@ class TeamStats(object):
         return str(self)
 
     def refresh_stats(self):
-        """Reload the stats"""
-        self._logger.info("Refreshing TeamStats")
-        self.html_tables = self.retrieve_html_tables(self.url)
+        """
+        Reload the stats. Stats restored from a snapshot aren't reloaded
+        until the snapshot expires. When refreshed in the background, the
+        stats already parsed are kept as they are, and stale stats are only
+        queued to be revalidated
+
+        Returns:
+            how the page was refreshed: FETCH_HIT, FETCH_REVALIDATED or
+            FETCH_FULL
+        """
+        return self.refresh()
+
+    def retrieve_tables(self):
+        return self.retrieve_html_tables(self.url)
+
+    def extract(self):
         self.teams = self.parse_table()
 
-    def send_get_request(self, url):
-        self._logger.info("Retreiving TeamStats from Website")
-        self.html_doc = get(url).text
-        self.last_refresh = datetime.datetime.now()
+    def count_parsed(self):
+        ins.count(self, ins.ROWS_PARSED, len(self.teams or []))
+
+    def snapshot_fields(self):
+        return list(Team.__slots__)
+
+    def snapshot_data(self):
+        return dict(teams=[ss.to_record(team) for team in self.teams or []])
+
+    def restore_snapshot(self, data):
+        self.teams = [ss.from_record(Team, record)
+                      for record in data['teams']]
 
     def retrieve_html_tables(self, url):
         raise NotImplementedError
@@ -94,7 +126,9 @@ class TeamStats(object):
         if self.is_stale:
             self._logger.info("Team Stats are stale, must refresh")
             self.send_get_request(url)
-        soup = BeautifulSoup(self.html_doc, 'html.parser')
+        if not self.document_changed:
+            return self.html_tables
+        soup = self.parse_html("table", {'class': table_class})
         tables = soup.find_all("table", {'class': table_class})
         processed = list()
         for table in tables:
@@ -1,18 +1,20 @@
-from recleagueparser.team_stats.sportsengine_team_stats import (
-    SportsEngineTeamStats)
-from recleagueparser.team_stats.dashplatform_team_stats import (
-    DashPlatformTeamStats)
+from recleagueparser import lazy
+
+# Each stats type's class, only imported once stats of that type are created
+STATS_TYPES = {
+    'sportsengine': 'recleagueparser.team_stats.sportsengine_team_stats.'
+                    'SportsEngineTeamStats',
+    'dash': 'recleagueparser.team_stats.dashplatform_team_stats.'
+            'DashPlatformTeamStats',
+}
 
 
 class TeamStatsFactory(object):
 
     def create(stats_type, **kwargs):
-        if stats_type == 'sportsengine':
-            return SportsEngineTeamStats(**kwargs)
-        elif stats_type == 'dash':
-            return DashPlatformTeamStats(**kwargs)
-        else:
+        if stats_type not in STATS_TYPES:
             raise ValueError("Stats Tool Type '{0}' not found"
                              .format(stats_type))
+        return lazy.load(STATS_TYPES[stats_type])(**kwargs)
 
     create = staticmethod(create)
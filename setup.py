@@ -14,11 +14,15 @@ setup(
     url='https://github.com/gmfrasca/recleagueparser',
     author='Giulio Frasca',
     packages=find_packages(),
-    python_requires='>=3.6, <4',
+    python_requires='>=3.7, <4',
     install_requires=[
         'bs4',
         'parsedatetime',
         'requests',
         'google-api-python-client',
-    ]
+    ],
+    extras_require={
+        'lxml': ['lxml'],
+        'icalendar': ['icalendar'],
+    }
 )
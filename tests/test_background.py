@@ -0,0 +1,109 @@
+from recleagueparser.background import BackgroundRefresher
+from recleagueparser.schedules import PointstreakSchedule
+from recleagueparser import response_cache as rc
+from tests.test_schedule import mocked_get
+import threading
+import datetime
+import unittest
+import time
+import gc
+import mock
+
+
+class Counter(object):
+
+    def __init__(self):
+        self.calls = 0
+        self.called = threading.Event()
+
+    def revalidate(self):
+        self.calls += 1
+        self.called.set()
+
+
+class TestBackgroundRefresher(unittest.TestCase):
+
+    def setUp(self):
+        self.refresher = BackgroundRefresher(jitter=0.5, seed=1)
+
+    def tearDown(self):
+        self.refresher.stop()
+
+    def test_jitter_spreads_refreshes(self):
+        delays = [self.refresher.delay(60) for _ in range(100)]
+        self.assertTrue(all(60 < delay <= 90 for delay in delays))
+        self.assertGreater(len(set(delays)), 90)
+
+    def test_refreshes_repeatedly(self):
+        counter = Counter()
+        self.refresher.add(counter, 'revalidate', 0.01)
+        deadline = time.monotonic() + 5
+        while counter.calls < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertGreaterEqual(counter.calls, 3)
+
+    def test_request_runs_early_and_drops_dead_objects(self):
+        counter = Counter()
+        self.refresher.add(counter, 'revalidate', 3600)
+        self.refresher.request(counter)
+        self.assertTrue(counter.called.wait(5))
+        del counter
+        gc.collect()
+        self.assertEqual(self.refresher._entries, {})
+
+
+class TestBackgroundSchedule(unittest.TestCase):
+
+    def test_stale_read_returns_snapshot(self):
+        refresher = BackgroundRefresher()
+        self.addCleanup(refresher.stop)
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get) as mocked_resp:
+            schedule = PointstreakSchedule(17, 17, refresher=refresher)
+            games = schedule.games
+            self.assertEqual(mocked_resp.call_count, 1)
+            revalidated = threading.Event()
+            revalidate = schedule.revalidate
+            schedule.revalidate = lambda: (revalidate(), revalidated.set())
+            schedule.last_refresh -= datetime.timedelta(
+                seconds=schedule.STALE_TIME + 1)
+
+            self.assertEqual(schedule.refresh_schedule(), rc.FETCH_HIT)
+            self.assertIs(schedule.games, games)
+            self.assertTrue(revalidated.wait(5))
+            self.assertEqual(mocked_resp.call_count, 2)
+        self.assertFalse(schedule.schedule_is_stale)
+
+    def test_revalidations_dont_overlap(self):
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get):
+            schedule = PointstreakSchedule(26, 26)
+        schedule.last_refresh -= datetime.timedelta(
+            seconds=schedule.STALE_TIME + 1)
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            fetching.set()
+            release.wait(5)
+            return mocked_get()
+
+        statuses = []
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=slow_get) as get:
+            background = threading.Thread(
+                target=lambda: statuses.append(schedule.revalidate()))
+            background.start()
+            self.assertTrue(fetching.wait(5))
+            foreground = threading.Thread(
+                target=lambda: statuses.append(schedule.revalidate()))
+            foreground.start()
+            time.sleep(0.1)
+            # Held back until the background revalidation is done with
+            # the schedule, by which time it's no longer stale
+            self.assertTrue(foreground.is_alive())
+            release.set()
+            background.join(5)
+            foreground.join(5)
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(statuses, [rc.FETCH_REVALIDATED, rc.FETCH_HIT])
@@ -0,0 +1,65 @@
+from recleagueparser.schedules import diff
+from recleagueparser.schedules.compare import ScheduleComparer
+from recleagueparser.schedules.game import Game
+import unittest
+import mock
+
+
+def game(date, time='7:00 PM', home='home', away='away', **kwargs):
+    return Game(date, time, home, kwargs.pop('homescore', None), away,
+                kwargs.pop('awayscore', None), year='2020', **kwargs)
+
+
+class TestDiff(unittest.TestCase):
+
+    def setUp(self):
+        self.old = [game('Sat Aug 15'), game('Sat Aug 22'),
+                    game('Sat Aug 29'), game('Sat Sep 5', away='other')]
+
+    def kinds(self, new):
+        return [(c.kind, c.old, c.new)
+                for c in diff.diff_games(self.old, new)]
+
+    def test_unchanged(self):
+        new = [game('Sat Aug 15'), game('Sat Aug 22'),
+               game('Sat Aug 29'), game('Sat Sep 5', away='other')]
+        self.assertEqual(diff.diff_games(self.old, new), [])
+        self.assertEqual(diff.render_diff(diff.match_games(self.old, new)),
+                         [])
+
+    def test_change_kinds(self):
+        new = [game('Sat Aug 15', homescore='3', awayscore='2', final=True),
+               game('Sat Aug 22', '9:00 PM'),
+               game('Sun Aug 30', cancelled=True),
+               game('Sat Sep 12', away='new')]
+        self.assertEqual(self.kinds(new), [
+            (diff.SCORE_CHANGED, self.old[0], new[0]),
+            (diff.FINALIZED, self.old[0], new[0]),
+            (diff.RESCHEDULED, self.old[1], new[1]),
+            (diff.RESCHEDULED, self.old[2], new[2]),
+            (diff.CANCELLED, self.old[2], new[2]),
+            (diff.REMOVED, self.old[3], None),
+            (diff.ADDED, None, new[3]),
+        ])
+
+    def test_outside_tolerance_is_remove_and_add(self):
+        new = self.old[:2] + [game('Sat Oct 31'), self.old[3]]
+        self.assertEqual(self.kinds(new), [
+            (diff.REMOVED, self.old[2], None),
+            (diff.ADDED, None, new[2]),
+        ])
+
+    def test_sched_diff_text(self):
+        moved = game('Sat Aug 22', '9:00 PM')
+        schedule1 = mock.MagicMock(games=self.old[:2])
+        schedule2 = mock.MagicMock(games=[self.old[0], moved])
+        comparer = ScheduleComparer(schedule1, schedule2)
+        self.assertEqual(
+            comparer.sched_diff(only_future_games=False),
+            '- {0}\n+ {1}\n'.format(self.old[1], moved))
+        self.assertEqual(
+            comparer.sched_diff(only_future_games=False, long_diff=True),
+            '  {0}\n- {1}\n+ {2}\n'.format(self.old[0], self.old[1], moved))
+        self.assertEqual(comparer.sched_diff(
+            only_future_games=False, exclude_keywords=['09:00']),
+            '- {0}\n'.format(self.old[1]))
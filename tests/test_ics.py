@@ -0,0 +1,91 @@
+from recleagueparser.schedules import ics_stream
+from recleagueparser.schedules.ics_schedule import ICSSchedule
+from recleagueparser import response_cache as rc
+import unittest
+import tempfile
+import datetime
+import shutil
+import mock
+import os
+
+MOCK_ICS = (
+    'BEGIN:VCALENDAR\r\n'
+    'VERSION:2.0\r\n'
+    'BEGIN:VEVENT\r\n'
+    'SUMMARY:Bears vs. Wolves\\, Jr.\r\n'
+    'DTSTART;TZID="America/New_York":20201220T210000\r\n'
+    'LOCATION:Ice Rink - Sheet A\r\n'
+    'BEGIN:VALARM\r\n'
+    'SUMMARY:Reminder\r\n'
+    'END:VALARM\r\n'
+    'END:VEVENT\r\n'
+    'BEGIN:VEVENT\r\n'
+    'SUMMARY:Bears vs. Hawks with a very long summary that gets folded acr\r\n'
+    ' oss two lines\r\n'
+    'DTSTART:20210103T193000Z\r\n'
+    'END:VEVENT\r\n'
+    'BEGIN:VEVENT\r\n'
+    'SUMMARY:Bears vs. Owls\r\n'
+    'DTSTART;VALUE=DATE:20210110\r\n'
+    'END:VEVENT\r\n'
+    'END:VCALENDAR\r\n')
+
+
+class TestICSStream(unittest.TestCase):
+
+    def test_matches_icalendar(self):
+        streamed = list(ics_stream.iter_events([MOCK_ICS]))
+        parsed = list(ics_stream.iter_calendar_events(MOCK_ICS))
+        self.assertEqual(len(streamed), 3)
+        self.assertEqual(streamed[0], ics_stream.EventFields(
+            datetime.datetime(2020, 12, 20, 21, 0),
+            'Bears vs. Wolves, Jr.', 'Ice Rink - Sheet A'))
+        for mine, theirs in zip(streamed, parsed):
+            self.assertEqual(mine.dtstart, theirs.dtstart.replace(tzinfo=None))
+            self.assertEqual(mine[1:], theirs[1:])
+
+    def test_chunks_split_anywhere(self):
+        data = MOCK_ICS.encode('utf-8')
+        chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+        self.assertEqual(list(ics_stream.iter_events(chunks)),
+                         list(ics_stream.iter_events([MOCK_ICS])))
+
+    def test_malformed_raises(self):
+        with self.assertRaises(ics_stream.UnsupportedCalendar):
+            list(ics_stream.iter_events(['BEGIN:VEVENT\r\n', 'garbage\r\n']))
+
+
+class TestICSSchedule(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'schedule.ics')
+        with open(self.path, 'w', newline='') as f:
+            f.write(MOCK_ICS)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_file_schedule(self):
+        schedule = ICSSchedule(file=self.path)
+        fallback = ICSSchedule(file=self.path, streaming=False)
+        self.assertEqual(str(schedule), str(fallback))
+        self.assertEqual(schedule.games[0].hometeam, 'Wolves, Jr.')
+        self.assertEqual(schedule.games[0].field, 'Sheet A')
+        self.assertEqual(schedule.refresh_schedule(), rc.FETCH_REVALIDATED)
+
+    def test_bad_row_keeps_streaming(self):
+        schedule = ICSSchedule(file=self.path)
+        schedule._row_cache.clear()
+        with mock.patch.object(schedule, 'parse_row',
+                               side_effect=ValueError('bad row')):
+            with self.assertRaises(ValueError):
+                schedule.parse_table()
+        self.assertTrue(schedule.streaming)
+
+    @mock.patch('recleagueparser.schedules.ics_stream.parse_dtstart',
+                side_effect=ics_stream.UnsupportedCalendar('DTSTART'))
+    def test_unsupported_markup_stops_streaming(self, mocked_parse):
+        schedule = ICSSchedule(file=self.path)
+        self.assertFalse(schedule.streaming)
+        self.assertEqual(len(schedule.games), 3)
@@ -0,0 +1,70 @@
+from recleagueparser import instrumentation as ins
+from recleagueparser.schedules import PointstreakSchedule
+from tests.test_schedule import mocked_get
+import datetime
+import unittest
+import mock
+
+
+class RecordingObserver(ins.Observer):
+
+    def __init__(self):
+        self.spans = list()
+        self.counts = list()
+
+    def on_span(self, provider, phase, seconds):
+        self.spans.append((provider, phase))
+
+    def on_count(self, provider, counter, amount):
+        self.counts.append((provider, counter, amount))
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_disabled_is_a_no_op(self):
+        self.assertFalse(ins.enabled())
+        self.assertIs(ins.span('Provider', ins.FETCH),
+                      ins.span('Other', ins.PARSE))
+        with ins.observing(RecordingObserver()) as observer:
+            self.assertTrue(ins.enabled())
+        self.assertFalse(ins.enabled())
+        ins.count('Provider', ins.ROWS_PARSED)
+        with ins.span('Provider', ins.FETCH):
+            pass
+        self.assertEqual(observer.spans, [])
+        self.assertEqual(observer.counts, [])
+
+    @mock.patch('recleagueparser.refreshable.get',
+                side_effect=mocked_get)
+    def test_schedule_refresh_phases(self, mocked_resp):
+        with ins.observing(ins.Collector()) as collector:
+            schedule = PointstreakSchedule(16, 16)
+            schedule.last_refresh -= datetime.timedelta(
+                seconds=schedule.STALE_TIME + 1)
+            schedule.refresh_schedule()
+        name = 'PointstreakSchedule'
+        games = len(schedule.games)
+        self.assertEqual(collector.providers, [name])
+        for phase in ins.PHASES:
+            calls = sum(calls for _, calls in
+                        collector.histogram(name, phase))
+            expected = dict(fetch=2, construct=games).get(phase, 1)
+            self.assertEqual(calls, expected, phase)
+        self.assertEqual(collector.counter(name, ins.CACHE_HITS), 1)
+        self.assertEqual(collector.counter(name, ins.ROWS_PARSED), games)
+        self.assertEqual(collector.counter(name, ins.GAMES_CONSTRUCTED),
+                         games)
+        self.assertGreater(collector.counter(name, ins.BYTES_FETCHED), 0)
+        report = collector.report()
+        self.assertIn(name, report)
+        self.assertIn('construct  calls={}'.format(games), report)
+
+    def test_collector_histogram(self):
+        collector = ins.Collector(buckets=[0.01, 0.1])
+        for seconds in [0.001, 0.002, 0.05, 2]:
+            collector.on_span('Provider', ins.PARSE, seconds)
+        self.assertEqual(collector.histogram('Provider', ins.PARSE),
+                         [(0.01, 2), (0.1, 1), (None, 1)])
+        self.assertIn('>100.0ms', collector.report())
+        collector.clear()
+        self.assertEqual(collector.providers, [])
@@ -0,0 +1,52 @@
+from recleagueparser.schedules import keyword_filter as kf
+from recleagueparser.schedules import PointstreakSchedule
+from recleagueparser.schedules.game import Game
+from tests.test_schedule import mocked_get
+import unittest
+import mock
+
+
+class TestKeywordFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game('Sat Aug 15', '8:45 PM', 'Bears', None, 'Wolves',
+                         None, location='Ice Rink', field='Sheet A')
+
+    def test_accepts(self):
+        self.assertTrue(kf.compile_filter().accepts(self.game))
+        self.assertTrue(kf.compile_filter(['wolves']).accepts(self.game))
+        self.assertTrue(kf.compile_filter(['AUG 15']).accepts(self.game))
+        self.assertFalse(kf.compile_filter(['hawks']).accepts(self.game))
+        self.assertFalse(kf.compile_filter(['bears'], ['sheet']).accepts(
+            self.game))
+        self.assertFalse(kf.compile_filter(None, ['sheet a']).accepts(
+            self.game))
+
+    def test_accepts_row_matches_game(self):
+        row = dict(date='Sat Aug 15', time='8:45 PM', hometeam='Bears',
+                   awayteam='Wolves', location='Ice Rink', field='Sheet A')
+        for include, exclude in [(['wolves'], None), (['aug 15'], None),
+                                 (['hawks'], None), (None, ['rink'])]:
+            keyword_filter = kf.compile_filter(include, exclude)
+            self.assertEqual(keyword_filter.accepts_row(row),
+                             keyword_filter.accepts(self.game))
+
+    def test_raw_pushdown_is_date_safe(self):
+        # The raw date is 'Sat Aug 15', but the game's date is 'Sat, Aug 15'
+        self.assertTrue(kf.compile_filter(['sat, aug']).may_accept_raw(
+            'Bears Wolves Sat Aug 15'))
+        self.assertFalse(kf.compile_filter(['hawks']).may_accept_raw(
+            'Bears Wolves Sat Aug 15'))
+        self.assertTrue(kf.compile_filter(None, ['wolves']).may_accept_raw(
+            'Bears Wolves Sat Aug 15'))
+
+    @mock.patch('recleagueparser.refreshable.get',
+                side_effect=mocked_get)
+    def test_filtered_rows_not_parsed(self, mocked_resp):
+        with mock.patch.object(PointstreakSchedule, 'parse_row',
+                               autospec=True,
+                               side_effect=PointstreakSchedule.parse_row) \
+                as parse_row:
+            schedule = PointstreakSchedule(4, 4, include_keywords=['nobody'])
+        self.assertEqual(schedule.games, [])
+        parse_row.assert_not_called()
@@ -0,0 +1,39 @@
+from recleagueparser.schedules import ScheduleFactory
+from recleagueparser.team_stats import TeamStatsFactory
+from recleagueparser import lazy
+import recleagueparser.schedules
+import subprocess
+import unittest
+import sys
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_exports_resolve(self):
+        from recleagueparser.schedules import ICSSchedule
+        from recleagueparser.schedules.ics_schedule import (
+            ICSSchedule as Imported)
+        self.assertIs(ICSSchedule, Imported)
+        self.assertIn('ICSSchedule', dir(recleagueparser.schedules))
+        with self.assertRaises(AttributeError):
+            recleagueparser.schedules.NotASchedule
+        self.assertIs(lazy.load('recleagueparser.schedules.game.Game'),
+                      recleagueparser.schedules.game.Game)
+
+    def test_unknown_types(self):
+        with self.assertRaises(ValueError):
+            ScheduleFactory.create('nope')
+        with self.assertRaises(ValueError):
+            TeamStatsFactory.create('nope')
+
+    def test_entry_points_skip_heavy_imports(self):
+        # Run in a fresh interpreter, where nothing is imported yet
+        loaded = subprocess.check_output([sys.executable, '-c', (
+            'import sys\n'
+            'from recleagueparser.schedules import ScheduleFactory\n'
+            'from recleagueparser.schedules import ICSSchedule\n'
+            'from recleagueparser.rsvp_tools import RsvpToolFactory\n'
+            'from recleagueparser.player_stats import PlayerStatsFactory\n'
+            'print(" ".join(m for m in ["bs4", "requests", "parsedatetime",'
+            ' "icalendar", "googleapiclient"] if m in sys.modules))')])
+        self.assertEqual(loaded.decode().strip(), '')
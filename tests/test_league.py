@@ -0,0 +1,71 @@
+from recleagueparser.schedules import LeagueSchedule, ICSSchedule
+from recleagueparser.schedules import diff
+import unittest
+import tempfile
+import shutil
+import mock
+import os
+
+LEAGUE_ICS = (
+    'BEGIN:VCALENDAR\r\n'
+    'VERSION:2.0\r\n'
+    'BEGIN:VEVENT\r\n'
+    'SUMMARY:Bears vs. Wolves\r\n'
+    'DTSTART:20201220T210000\r\n'
+    'END:VEVENT\r\n'
+    'BEGIN:VEVENT\r\n'
+    'SUMMARY:Hawks vs. Owls\r\n'
+    'DTSTART:20201220T223000\r\n'
+    'END:VEVENT\r\n'
+    'BEGIN:VEVENT\r\n'
+    'SUMMARY:Owls vs. Bears\r\n'
+    'DTSTART:20210103T193000\r\n'
+    'END:VEVENT\r\n'
+    'END:VCALENDAR\r\n')
+
+
+class TestLeagueSchedule(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.path = os.path.join(self.tmpdir, 'league.ics')
+        self.write(LEAGUE_ICS)
+        self.league = LeagueSchedule(ICSSchedule(file=self.path))
+
+    def write(self, text):
+        with open(self.path, 'w', newline='') as f:
+            f.write(text)
+
+    def test_teams_share_the_league_games(self):
+        self.assertEqual(self.league.teams, ['Bears', 'Hawks', 'Owls',
+                                             'Wolves'])
+        schedules = self.league.team_schedules()
+        bears = schedules['Bears']
+        self.assertEqual(bears.team_name, 'Bears')
+        self.assertEqual(len(bears.games), 2)
+        self.assertIs(bears.games[0], schedules['Wolves'].games[0])
+        self.assertIs(bears.games[1], schedules['Owls'].games[1])
+        self.assertEqual(len(self.league.team_schedule('Nobody').games), 0)
+
+    def test_league_parsed_once_for_every_team(self):
+        schedules = self.league.team_schedules()
+        with mock.patch.object(ICSSchedule, 'parse_table',
+                               autospec=True) as parse_table:
+            for schedule in schedules.values():
+                schedule.refresh_schedule()
+        parse_table.assert_not_called()
+        self.assertEqual([schedule.last_changes
+                          for schedule in schedules.values()], [[]] * 4)
+
+    def test_league_changes_reach_teams(self):
+        schedules = self.league.team_schedules()
+        owls = schedules['Owls']
+        self.write(LEAGUE_ICS.replace('20210103T193000', '20210103T203000'))
+        os.utime(self.path, ns=(1, 1))
+        owls.refresh_schedule()
+        self.assertEqual([change.kind for change in owls.last_changes],
+                         [diff.RESCHEDULED])
+        self.assertIs(owls.games[1], self.league.source.games[2])
+        schedules['Hawks'].refresh_schedule()
+        self.assertEqual(schedules['Hawks'].last_changes, [])
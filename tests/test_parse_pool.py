@@ -0,0 +1,117 @@
+from recleagueparser.schedules import PointstreakSchedule
+from recleagueparser.schedules import DashPlatformSchedule
+from recleagueparser.schedules.game import Game
+from recleagueparser.schedules.league import TeamSchedule
+from recleagueparser.player_stats import DashPlatformPlayerStats
+from recleagueparser.parse_pool import ParsePool
+from recleagueparser import parse_pool as pp
+from recleagueparser.schedules import diff
+from recleagueparser import response_cache as rc
+from tests.test_schedule import mocked_get, MOCK_HTML
+import datetime
+import unittest
+import json
+import mock
+
+DASH_ROW = (
+    '<div class="list-group-item">'
+    '<div class="event__date"><div><div>{date}</div>'
+    '<div>Mon 8:45 PM</div></div></div>'
+    '<div class="event__details">'
+    '<div><div><a href="/team/2">Bruins</a></div><div>-</div></div>'
+    '<div><div><a href="/team/1">Whalers</a></div><div>-</div></div>'
+    '<div><div><small>Ice Center</small></div></div>'
+    '<div><div><small>Rink 1</small></div></div>'
+    '</div></div>')
+# Its games roll over into the next year
+DASH_HTML = ('<html><body><h2>Team Whalers</h2><div class="list-group">'
+             '{0}</div></body></html>').format(
+                 ''.join(DASH_ROW.format(date=date)
+                         for date in ['Mon Dec 07', 'Mon Jan 18']))
+
+
+def mocked_dash_get(*args, **kwargs):
+    response = mocked_get()
+    response.text = DASH_HTML
+    return response
+
+
+class TestShippedState(unittest.TestCase):
+
+    def test_declared_by_each_class(self):
+        local = pp.local_state(TeamSchedule)
+        for name in ['league', '_games', '_refresh_lock']:
+            self.assertIn(name, local)
+        local = pp.local_state(DashPlatformPlayerStats)
+        for name in ['session', 'players', 'response_cache']:
+            self.assertIn(name, local)
+        self.assertNotIn('_games', local)
+        self.assertEqual(pp.fresh_state(DashPlatformPlayerStats),
+                         dict(html_tables=None))
+        self.assertEqual(pp.fresh_state(PointstreakSchedule),
+                         dict(html_table=None, _row_cache=dict()))
+
+
+class TestParsePool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ParsePool(max_workers=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_parsed_in_worker(self):
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get):
+            local = PointstreakSchedule(23, 23)
+            pooled = PointstreakSchedule(23, 23, parse_pool=self.pool)
+        self.assertEqual(repr(pooled), repr(local))
+        self.assertEqual(pooled.team_name, local.team_name)
+        self.assertIsNone(pooled.html_table)
+        self.assertNotIn('html_doc', pp.local_state(PointstreakSchedule))
+        self.assertNotIn('parse_pool', pp.shipped_state(pooled))
+
+    def test_unchanged_page_not_shipped(self):
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get):
+            schedule = PointstreakSchedule(24, 24, parse_pool=self.pool)
+        games = schedule.games
+        schedule.last_refresh -= datetime.timedelta(
+            seconds=schedule.STALE_TIME + 1)
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get), \
+                mock.patch.object(self.pool, 'parse') as parse:
+            self.assertEqual(schedule.refresh_schedule(),
+                             rc.FETCH_REVALIDATED)
+        parse.assert_not_called()
+        self.assertIs(schedule.games, games)
+
+        schedule.last_refresh -= datetime.timedelta(
+            seconds=schedule.STALE_TIME + 1)
+        changed = mocked_get()
+        changed.text = MOCK_HTML.replace('<b> 0</b>', '<b> 1</b>')
+        with mock.patch('recleagueparser.refreshable.get',
+                        return_value=changed):
+            self.assertEqual(schedule.refresh_schedule(), rc.FETCH_FULL)
+        self.assertEqual(schedule.games[0].awayscore, '1')
+        self.assertEqual([change.kind for change in schedule.last_changes],
+                         [diff.SCORE_CHANGED])
+
+    def test_rollover_dates_survive_records_and_pool(self):
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_dash_get):
+            local = DashPlatformSchedule(25, 'x')
+            pooled = DashPlatformSchedule(25, 'x', parse_pool=self.pool)
+        rolled = local.games[1]
+        self.assertEqual(rolled.full_gametime.year,
+                         local.games[0].full_gametime.year + 1)
+        self.assertEqual(rolled.date,
+                         rolled.full_gametime.strftime('%a, %b %d'))
+        restored = Game.from_record(json.loads(json.dumps(
+            rolled.to_record())))
+        self.assertEqual((restored.date, restored.time),
+                         (rolled.date, rolled.time))
+        self.assertEqual([(game.date, game.time) for game in pooled.games],
+                         [(game.date, game.time) for game in local.games])
@@ -0,0 +1,95 @@
+from recleagueparser import parsetime as pt
+import parsedatetime as pdt
+import unittest
+import datetime
+import threading
+import mock
+
+
+class TestParseEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = pt.ParseEngine(maxsize=2)
+
+    def test_matches_parsedatetime(self):
+        text = 'Aug 5 2017 8:45 PM'
+        expected, _ = pdt.Calendar(
+            version=pdt.VERSION_CONTEXT_STYLE).parseDT(text)
+        self.assertEqual(self.engine.parse(text), expected)
+        self.assertEqual(self.engine.parse(text), expected)
+
+    def test_hit_miss_counters(self):
+        self.engine.parse('8:45 PM')
+        self.engine.parse('8:45 PM')
+        self.engine.parse('Aug 5 2017')
+        info = self.engine.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.currsize, 2)
+
+    def test_bounded(self):
+        for text in ['1:00 PM', '2:00 PM', '3:00 PM']:
+            self.engine.parse(text)
+        self.assertEqual(self.engine.cache_info().currsize, 2)
+        self.engine.parse('1:00 PM')
+        self.assertEqual(self.engine.cache_info().misses, 4)
+
+    def test_time_only_uses_today(self):
+        self.engine.parse('8:45 PM')
+        parsed = self.engine.parse('8:45 PM')
+        today = datetime.date.today()
+        self.assertEqual(parsed, datetime.datetime.combine(
+            today, datetime.time(20, 45)))
+
+    def test_calendar_per_thread(self):
+        calendars = []
+        thread = threading.Thread(
+            target=lambda: calendars.append(self.engine.calendar))
+        thread.start()
+        thread.join()
+        self.assertIs(self.engine.calendar, self.engine.calendar)
+        self.assertIsNot(calendars[0], self.engine.calendar)
+
+    def test_assemble_full_datetime(self):
+        parsed = pt.assemble_full_datetime('Wed, Aug 5', '8:45 PM', 2017)
+        self.assertEqual(parsed, datetime.datetime(2017, 8, 5, 20, 45))
+
+    def test_learned_format_fast_path(self):
+        engine = pt.ParseEngine()
+        calendar = pdt.Calendar(version=pdt.VERSION_CONTEXT_STYLE)
+        first, path = engine.parse_with_path('Aug 5 2017 8:45 PM EST')
+        self.assertEqual(path, pt.PATH_FALLBACK)
+        for text in ['Sep 12 2017 7:15 pm', 'Dec 31 2017 12:01 AM EST']:
+            parsed, path = engine.parse_with_path(text)
+            self.assertEqual(path, pt.PATH_FORMAT)
+            self.assertEqual(parsed, calendar.parseDT(text)[0])
+        self.assertEqual(engine.learned_formats(),
+                         {'a 9 9 9:9 a': '%b %d %Y %I:%M %p'})
+
+    def test_unreadable_sample_still_learns(self):
+        engine = pt.ParseEngine()
+        self.assertEqual(engine.parse_with_path('Sept 5 2017 8:45 PM')[1],
+                         pt.PATH_FALLBACK)
+        engine.parse('Aug 12 2017 8:45 PM')
+        self.assertEqual(engine.parse_with_path('Oct 3 2017 8:45 PM')[1],
+                         pt.PATH_FORMAT)
+        self.assertEqual(engine.learned_formats(),
+                         {'a 9 9 9:9 a': '%b %d %Y %I:%M %p'})
+
+    def test_unlearnable_shape_given_up(self):
+        engine = pt.ParseEngine()
+        with mock.patch.object(engine, '_learn_format',
+                               wraps=engine._learn_format) as learn:
+            for day in range(1, pt.LEARN_ATTEMPTS + 3):
+                engine.parse('Sept {} 2017 8:45 PM'.format(day))
+        self.assertEqual(learn.call_count, pt.LEARN_ATTEMPTS)
+        self.assertEqual(engine.learned_formats(), {})
+
+    def test_unreadable_falls_back(self):
+        engine = pt.ParseEngine()
+        engine.parse('Aug 5 2017')
+        parsed, path = engine.parse_with_path('Feb 30 2017')
+        self.assertEqual(path, pt.PATH_FALLBACK)
+        self.assertEqual(engine.path_info(), {pt.PATH_MEMO: 0,
+                                              pt.PATH_FORMAT: 0,
+                                              pt.PATH_FALLBACK: 2})
@@ -0,0 +1,66 @@
+from recleagueparser import rate_limit
+import unittest
+import mock
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, secs):
+        self.now += secs
+
+
+class TestHostLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('recleagueparser.rate_limit.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.limiter = rate_limit.HostLimiter(rate=2.0, burst=3)
+
+    def test_burst_then_rate(self):
+        waits = [self.limiter.acquire() for _ in range(5)]
+        self.assertEqual(waits, [0, 0, 0, 0.5, 0.5])
+        stats = self.limiter.stats()
+        self.assertEqual((stats.requests, stats.waited, stats.waiting),
+                         (5, 2, 0))
+        self.assertEqual((stats.wait_total, stats.wait_max), (1.0, 0.5))
+
+    def test_queued_requests_wait_their_turn(self):
+        for _ in range(3):
+            self.limiter.reserve()
+        self.assertEqual([self.limiter.reserve() for _ in range(3)],
+                         [0.5, 1.0, 1.5])
+        self.assertEqual(self.limiter.stats().waiting, 3)
+
+    def test_backoff_and_recovery(self):
+        self.limiter.record(429, 0.1, pause=10)
+        self.assertEqual(self.limiter.rate, 1.0)
+        self.assertEqual(self.limiter.reserve(), 10)
+        self.limiter.record(503, 0.1)
+        self.assertEqual(self.limiter.rate, 0.5)
+        for _ in range(rate_limit.RECOVERY_REQUESTS):
+            self.limiter.record(200, 0.1)
+        self.assertEqual(self.limiter.rate, 2.0)
+        self.assertEqual(self.limiter.stats().throttled, 2)
+
+    def test_latency_spike_slows_down(self):
+        for _ in range(5):
+            self.limiter.record(200, 0.5)
+        self.limiter.record(200, 0.9)  # Slower, but not a spike
+        self.assertEqual(self.limiter.rate, 2.0)
+        self.limiter.record(200, 5.0)
+        self.assertAlmostEqual(self.limiter.rate,
+                               2.0 * rate_limit.SLOWDOWN_FACTOR)
+        self.assertEqual(self.limiter.stats().slowed, 1)
+
+    def test_rate_never_below_minimum(self):
+        for _ in range(20):
+            self.limiter.record(None)
+        self.assertEqual(self.limiter.rate, rate_limit.MIN_RATE)
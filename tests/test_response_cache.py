@@ -0,0 +1,168 @@
+from recleagueparser.player_stats import DashPlatformPlayerStats
+from recleagueparser import response_cache as rc
+import threading
+import unittest
+import tempfile
+import shutil
+import time
+import mock
+
+
+class MockResponse(object):
+    def __init__(self, text, status_code=200, headers=None):
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = rc.ResponseCache(self.tmpdir)
+        self.requests = []
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def get(self, response):
+        def _get(url, headers=None, **kwargs):
+            self.requests.append(headers)
+            return response
+        return _get
+
+    def test_full_then_unchanged_body(self):
+        result = self.cache.fetch('http://a', self.get(MockResponse('page')))
+        self.assertEqual(result, rc.FetchResult('page', rc.FETCH_FULL))
+        result = self.cache.fetch('http://a', self.get(MockResponse('page')))
+        self.assertEqual(result.status, rc.FETCH_REVALIDATED)
+        result = self.cache.fetch('http://a', self.get(MockResponse('new')))
+        self.assertEqual(result, rc.FetchResult('new', rc.FETCH_FULL))
+
+    def test_not_modified(self):
+        headers = {'ETag': '"v1"', 'Last-Modified': 'Sat, 15 Aug 2020'}
+        self.cache.fetch('http://a', self.get(MockResponse('page', 200,
+                                                           headers)))
+        result = self.cache.fetch('http://a', self.get(MockResponse('', 304)))
+        self.assertEqual(result, rc.FetchResult('page', rc.FETCH_REVALIDATED))
+        self.assertEqual(self.requests[1], {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Sat, 15 Aug 2020'})
+
+    def test_persisted_to_disk(self):
+        headers = {'ETag': '"v1"'}
+        self.cache.fetch('http://a', self.get(MockResponse('page', 200,
+                                                           headers)))
+        reloaded = rc.ResponseCache(self.tmpdir)
+        result = reloaded.fetch('http://a', self.get(MockResponse('', 304)))
+        self.assertEqual(result, rc.FetchResult('page', rc.FETCH_REVALIDATED))
+
+    def test_errors_not_cached(self):
+        headers = {'ETag': '"v1"'}
+        self.cache.fetch('http://a', self.get(MockResponse('page', 200,
+                                                           headers)))
+        error = MockResponse('oops', 503, {'ETag': '"error"'})
+        result = self.cache.fetch('http://a', self.get(error))
+        self.assertEqual(result, rc.FetchResult('oops', rc.FETCH_FULL))
+        self.cache.fetch('http://a', self.get(MockResponse('', 304)))
+        self.assertEqual(self.requests[2], {'If-None-Match': '"v1"'})
+        self.assertIsNone(self.cache.load('http://b'))
+        self.cache.fetch('http://b', self.get(MockResponse('missing', 404)))
+        self.assertIsNone(self.cache.load('http://b'))
+
+    def test_entries_kept_in_memory_bounded(self):
+        cache = rc.ResponseCache(max_entries=2)
+        for url in ['http://a', 'http://b', 'http://a', 'http://c']:
+            cache.fetch(url, self.get(MockResponse(url)))
+        self.assertIsNotNone(cache.load('http://a'))
+        self.assertIsNone(cache.load('http://b'))
+        self.assertIsNotNone(cache.load('http://c'))
+        # Entries dropped from memory are read back from disk
+        cache = rc.ResponseCache(self.tmpdir, max_entries=1)
+        for url in ['http://a', 'http://b']:
+            cache.fetch(url, self.get(MockResponse(url)))
+        self.assertEqual(cache.load('http://a')['body'], 'http://a')
+
+
+class TestSharedFetches(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = rc.ResponseCache(share_window=60)
+        self.calls = 0
+
+    def get(self, url, headers=None, **kwargs):
+        self.calls += 1
+        return MockResponse('page {}'.format(self.calls))
+
+    def test_concurrent_fetches_share_one_download(self):
+        self.cache.share_window = 0
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_get(url, headers=None, **kwargs):
+            started.set()
+            release.wait(5)
+            return self.get(url)
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(
+            self.cache.fetch('http://a', slow_get)))
+        leader.start()
+        self.assertTrue(started.wait(5))
+        followers = [threading.Thread(target=lambda: results.append(
+            self.cache.fetch('http://a', self.get)))
+            for _ in range(3)]
+        for follower in followers:
+            follower.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join(5)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(set(id(result.text) for result in results)), 1)
+
+    def test_recent_download_shared_with_new_readers(self):
+        first = self.cache.fetch('http://a', self.get)
+        self.assertIs(self.cache.fetch('http://a', self.get).text, first.text)
+        self.assertEqual(self.calls, 1)
+
+        # Asking again for the text already held always fetches
+        again = self.cache.fetch('http://a', self.get, previous=first.text)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(again, rc.FetchResult('page 2', rc.FETCH_FULL))
+
+        # Statuses are relative to what each caller already has
+        shared = self.cache.fetch('http://a', self.get, previous=first.text)
+        self.assertEqual(shared, rc.FetchResult('page 2', rc.FETCH_FULL))
+        self.assertEqual(self.cache.fetch(
+            'http://a', self.get, previous='page 2').status,
+            rc.FETCH_REVALIDATED)
+
+
+class TestAuthenticatedFetches(unittest.TestCase):
+
+    STATS_PAGE = ('<html><body><div id="teamStats"><table>'
+                  '<tr><td>{0}</td><td>1</td><td>2</td><td>0</td><td>0</td>'
+                  '<td>0</td><td>0</td><td>5</td></tr></table></div>'
+                  '</body></html>')
+
+    def login(self, username):
+        page = MockResponse(self.STATS_PAGE.format(username), 200,
+                            {'ETag': '"{}"'.format(username)})
+        session = mock.Mock()
+        session.get.return_value = page
+        with mock.patch('recleagueparser.sessions.new_session',
+                        return_value=session):
+            return DashPlatformPlayerStats(team_id=7, company_id='x',
+                                           username=username,
+                                           password='password')
+
+    def test_logins_dont_share_entries(self):
+        first = self.login('first')
+        second = self.login('second')
+        self.assertEqual(list(first.players['players']), ['first'])
+        self.assertEqual(list(second.players['players']), ['second'])
+        url = first.get_stats_url()
+        self.assertIsNone(rc.DEFAULT_CACHE.load(url))
+        self.assertEqual(first.response_cache.load(url)['etag'], '"first"')
+        self.assertEqual(second.response_cache.load(url)['etag'], '"second"')
@@ -1,5 +1,11 @@
-from recleagueparser.schedules import PointstreakSchedule
+from recleagueparser.schedules import PointstreakSchedule, DebugSchedule
+from recleagueparser.schedules import ScheduleFactory
+from recleagueparser.schedules import ScoreUpdateDebugSchedule
+from recleagueparser.schedules import diff
 from recleagueparser.schedules.game import Game
+from recleagueparser.schedules.season import resolve_season
+from recleagueparser import response_cache as rc
+from recleagueparser import parsetime as pt
 import unittest
 import mock
 import datetime
@@ -117,10 +123,97 @@ class TestGame(unittest.TestCase):
         self.assertEqual(str(self.done_game),
                          "home [6] : [5] away on {0}".format(date_str))
 
+    def test_date_parsed_on_access(self):
+        with mock.patch('recleagueparser.parsetime.normalize_date') as norm:
+            game = Game(self.test_date, self.hour_time, 'home', None, 'away',
+                        None, year=2017)
+            self.assertEqual(str(game), str(self.game))
+            norm.assert_not_called()
+        self.assertEqual(game.date, 'Thu, Aug 31')
+        self.assertEqual(game.time, '07:22 PM')
+
+
+class TestSeason(unittest.TestCase):
+
+    def test_resolve_season_rollover(self):
+        rows = [dict(date='Sat, Dec 20', time='8:45 PM', hometeam='home',
+                     homescore=None, awayteam='away', awayscore=None),
+                dict(date='Sat, Jan 3', time='8:45 PM', hometeam='home',
+                     homescore=None, awayteam='away', awayscore=None),
+                dict(date='Sat, Jan 10', time='7:00 PM', hometeam='home',
+                     homescore=None, awayteam='away', awayscore=None)]
+        games = resolve_season(rows, year=2019)
+        self.assertEqual([g.full_gametime for g in games],
+                         [datetime.datetime(2019, 12, 20, 20, 45),
+                          datetime.datetime(2020, 1, 3, 20, 45),
+                          datetime.datetime(2020, 1, 10, 19, 0)])
+        self.assertEqual([g.year for g in games], ['2019', '2020', '2020'])
+        self.assertIsNone(games[2].prevgame)
+
+    def test_prior_season_weekdays(self):
+        rows = [dict(date='Fri, Dec 20', time='8:45 PM', hometeam='home',
+                     homescore=None, awayteam='away', awayscore=None),
+                dict(date='Fri, Jan 3', time='8:45 PM', hometeam='home',
+                     homescore=None, awayteam='away', awayscore=None)]
+        games = resolve_season(rows, year=2019)
+        # The weekdays of 2019-20, whatever year they're read in
+        self.assertEqual([g.date for g in games],
+                         ['Fri, Dec 20', 'Fri, Jan 03'])
+        self.assertEqual([g.date for g in games],
+                         [g.full_gametime.strftime(pt.DATE_DESCRIPTOR)
+                          for g in games])
+
+    def test_resolve_parsed_gametimes(self):
+        def row(month, day):
+            gametime = datetime.datetime(pt.PLACEHOLDER_YEAR, month, day,
+                                         20, 45)
+            return dict(gametime=gametime, hometeam='home', homescore=None,
+                        awayteam='away', awayscore=None)
+        with mock.patch('recleagueparser.parsetime.normalize_date') as norm:
+            games = resolve_season([row(12, 26), row(2, 28), row(3, 7)],
+                                   year=2022)
+            norm.assert_not_called()
+        self.assertEqual([g.full_gametime for g in games],
+                         [datetime.datetime(2022, 12, 26, 20, 45),
+                          datetime.datetime(2023, 2, 28, 20, 45),
+                          datetime.datetime(2023, 3, 7, 20, 45)])
+        self.assertEqual([g.year for g in games], ['2022', '2023', '2023'])
+        # Weekdays are those of the season's year, not the placeholder's
+        self.assertEqual(games[0].date, 'Mon, Dec 26')
+        self.assertEqual(games[2].date, 'Tue, Mar 07')
+
+
+class TestScheduleIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = DebugSchedule()
+        self.now = self.schedule.now
+
+    def test_time_lookups(self):
+        games = self.schedule.games
+        self.assertIs(self.schedule.get_next_game_after(self.now), games[2])
+        self.assertIs(self.schedule.get_last_game_before(self.now), games[1])
+        self.assertEqual(self.schedule.games_remaining, 3)
+        self.assertEqual(self.schedule.future_games.games, games[2:])
+
+    def test_get_games_between(self):
+        games = self.schedule.games
+        window = self.schedule.get_games_between(
+            self.now - datetime.timedelta(days=2),
+            self.now + datetime.timedelta(days=2))
+        self.assertEqual(window, games[1:4])
+        self.assertEqual(self.schedule.get_games_between(
+            self.now, self.now), [])
+
+    def test_reindex_on_replace(self):
+        self.schedule.games = self.schedule.games[:2]
+        self.assertIsNone(self.schedule.get_next_game_after(self.now))
+        self.assertEqual(self.schedule.games_remaining, 0)
+
 
 class TestPointstreakSchedule(unittest.TestCase):
 
-    @mock.patch('recleagueparser.schedules.schedule.get', side_effect=mocked_get)
+    @mock.patch('recleagueparser.refreshable.get', side_effect=mocked_get)
     def setUp(self, mocked_resp):
         with mock.patch('recleagueparser.schedules.schedule.datetime.datetime') as mck_dt:
             # TODO mock now instead of using real time (i.e. get this to work)
@@ -154,7 +247,7 @@ class TestPointstreakSchedule(unittest.TestCase):
     def tearDown(self):
         pass
 
-    @mock.patch('recleagueparser.schedules.schedule.get', side_effect=mocked_get)
+    @mock.patch('recleagueparser.refreshable.get', side_effect=mocked_get)
     def test_retrieve_html_table(self, mocked_resp):
         tbody = self.schedule.retrieve_html_table('http://fakeurl.com')
         mocked_resp.assert_not_called()
@@ -264,3 +357,120 @@ home vs away at \w\w\w, Aug 25 08:45 PM
         self.assertEqual(next_game.awayteam, 'away')
         self.assertIsNone(next_game.homescore)
         self.assertIsNone(next_game.awayscore)
+
+
+class TestScheduleRefresh(unittest.TestCase):
+
+    @mock.patch('recleagueparser.refreshable.get', side_effect=mocked_get)
+    def test_unchanged_page_skips_parse(self, mocked_resp):
+        schedule = PointstreakSchedule(1, 1)
+        games = schedule.games
+        schedule.last_refresh -= datetime.timedelta(
+            seconds=schedule.STALE_TIME + 1)
+        self.assertEqual(schedule.refresh_schedule(), rc.FETCH_REVALIDATED)
+        self.assertIs(schedule.games, games)
+        self.assertEqual(schedule.refresh_schedule(), rc.FETCH_HIT)
+        self.assertIs(schedule.games, games)
+
+    def test_changed_page_reparses_changed_rows(self):
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get):
+            schedule = PointstreakSchedule(2, 2)
+        games = schedule.games
+        schedule.last_refresh -= datetime.timedelta(
+            seconds=schedule.STALE_TIME + 1)
+        changed = mocked_get()
+        changed.text = MOCK_HTML.replace('<b> 0</b>', '<b> 1</b>')
+        with mock.patch('recleagueparser.refreshable.get',
+                        return_value=changed):
+            self.assertEqual(schedule.refresh_schedule(), rc.FETCH_FULL)
+        self.assertEqual(schedule.games[0].awayscore, '1')
+        self.assertIsNot(schedule.games[0], games[0])
+        self.assertIs(schedule.games[1], games[1])
+        self.assertIsNone(schedule.games[1].prevgame)
+
+
+    def test_same_page_fetched_and_parsed_once(self):
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get) as mocked_resp:
+            everything = PointstreakSchedule(22, 22)
+            filtered = PointstreakSchedule(22, 22, exclude_keywords=['Aug 25'])
+        self.assertEqual(mocked_resp.call_count, 1)
+        self.assertIs(filtered.html_table, everything.html_table)
+        self.assertEqual(len(everything.games), 2)
+        self.assertEqual(len(filtered.games), 1)
+
+
+class TestScheduleChanges(unittest.TestCase):
+
+    def test_changed_row_emits_only_its_change(self):
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get):
+            schedule = PointstreakSchedule(20, 20)
+        self.assertEqual(schedule.last_changes, ())
+        received = []
+        schedule.add_listener(lambda sched, changes: received.append(changes))
+        old_game = schedule.games[0]
+        schedule.last_refresh -= datetime.timedelta(
+            seconds=schedule.STALE_TIME + 1)
+        changed = mocked_get()
+        changed.text = MOCK_HTML.replace('<b> 0</b>', '<b> 1</b>')
+        with mock.patch('recleagueparser.refreshable.get',
+                        return_value=changed):
+            schedule.refresh_schedule()
+        self.assertEqual(schedule._changed, ([old_game], [schedule.games[0]]))
+        expected = [(diff.SCORE_CHANGED, old_game, schedule.games[0])]
+        self.assertEqual(schedule.last_changes, expected)
+        self.assertEqual(received, [expected])
+
+        # An unchanged page changes nothing, and isn't passed on
+        schedule.last_refresh -= datetime.timedelta(
+            seconds=schedule.STALE_TIME + 1)
+        with mock.patch('recleagueparser.refreshable.get',
+                        return_value=changed):
+            self.assertEqual(schedule.refresh_schedule(),
+                             rc.FETCH_REVALIDATED)
+        self.assertEqual(schedule.last_changes, [])
+        self.assertEqual(len(received), 1)
+
+    def test_duplicate_rows_diff_every_game(self):
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get):
+            schedule = PointstreakSchedule(21, 21)
+        rows = [schedule.html_table.find_all('tr')[1]] * 2
+        schedule.build_games(rows, schedule.parse_row)
+        self.assertIsNone(schedule._changed)
+
+    def test_debug_schedule_emits_updates(self):
+        schedule = ScoreUpdateDebugSchedule()
+        received = []
+        schedule.add_listener(lambda sched, changes: received.append(changes))
+        for _ in range(4):
+            schedule.refresh_schedule()
+        self.assertEqual(received, [])
+        schedule.refresh_schedule()
+        self.assertEqual([change.kind for change in received[0]],
+                         [diff.SCORE_CHANGED])
+        self.assertEqual(received[0][0].new.homescore, 7)
+
+
+class TestScheduleFactory(unittest.TestCase):
+
+    @mock.patch('recleagueparser.refreshable.get', side_effect=mocked_get)
+    def test_create_many(self, mocked_resp):
+        specs = [dict(schedule_type='pointstreak', team_id=t, season_id=3)
+                 for t in range(3)]
+        specs.append(dict(schedule_type='unknown', team_id=0))
+        results = ScheduleFactory.create_many(specs, max_workers=2)
+        self.assertEqual([r.spec for r in results], specs)
+        for result in results[:3]:
+            self.assertIsNone(result.error)
+            self.assertEqual(len(result.schedule.games), 2)
+        self.assertIsNone(results[3].schedule)
+        self.assertIsInstance(results[3].error, ValueError)
+        self.assertEqual(mocked_resp.call_count, 3)
+
+    @mock.patch('recleagueparser.refreshable.get', side_effect=mocked_get)
+    def test_create_fetches_once(self, mocked_resp):
+        ScheduleFactory.create('ics', url='http://fakeurl.com/cal.ics')
+        self.assertEqual(mocked_resp.call_count, 1)
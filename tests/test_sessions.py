@@ -0,0 +1,89 @@
+from recleagueparser import sessions
+from requests.adapters import HTTPAdapter
+from tests.test_rate_limit import FakeClock
+import threading
+import unittest
+import mock
+
+
+class TestSessionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = sessions.SessionPool(timeout=7)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_sessions_share_host_adapter(self):
+        url = 'https://www.pahl.org/schedule/team_instance/1'
+        shared = self.pool.session(url)
+        private = self.pool.new_session('https://WWW.pahl.org')
+        self.assertIs(self.pool.session('https://www.pahl.org/other'), shared)
+        self.assertIsNot(private, shared)
+        self.assertIs(shared.get_adapter(url), private.get_adapter(url))
+        self.assertIsNot(shared.get_adapter(url),
+                         shared.get_adapter('https://apps.dashplatform.com'))
+
+    def test_session_per_thread(self):
+        url = 'https://www.pahl.org'
+        found = []
+        thread = threading.Thread(
+            target=lambda: found.append(self.pool.session(url)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(found[0], self.pool.session(url))
+        self.assertIs(found[0].get_adapter(url),
+                      self.pool.session(url).get_adapter(url))
+
+    @mock.patch.object(HTTPAdapter, 'send')
+    def test_default_timeout(self, mocked_send):
+        adapter = self.pool.adapter('https://www.pahl.org')
+        adapter.send(None)
+        self.assertEqual(mocked_send.call_args[1]['timeout'], 7)
+        adapter.send(None, timeout=1)
+        self.assertEqual(mocked_send.call_args[1]['timeout'], 1)
+
+    @mock.patch.object(HTTPAdapter, 'send')
+    def test_throttled_host_backed_off(self, mocked_send):
+        mocked_send.return_value = mock.Mock(status_code=429,
+                                             headers={'Retry-After': '2'})
+        self.pool.adapter('https://www.pahl.org').send(None)
+        pahl = self.pool.stats()['https://www.pahl.org']
+        self.assertEqual((pahl.requests, pahl.throttled), (1, 1))
+        self.assertLess(pahl.rate, self.pool.rate)
+        # Other hosts keep their own rate
+        mocked_send.return_value = mock.Mock(status_code=200)
+        self.pool.adapter('https://apps.dashplatform.com').send(None)
+        self.assertEqual(
+            self.pool.stats()['https://apps.dashplatform.com'].rate,
+            self.pool.rate)
+        self.assertGreater(self.pool.limiter('https://www.pahl.org').reserve(),
+                           1)
+
+    def test_unlimited(self):
+        pool = sessions.SessionPool(rate=None)
+        self.assertIsNone(pool.adapter('https://www.pahl.org').limiter)
+        self.assertEqual(pool.stats(), dict())
+
+    @mock.patch.object(HTTPAdapter, 'send')
+    def test_throttled_response_retried_after_pause(self, mocked_send):
+        clock = FakeClock()
+        throttled = mock.Mock(status_code=429, headers={'Retry-After': '2'})
+        ok = mock.Mock(status_code=200, headers={})
+        sent = []
+        mocked_send.side_effect = lambda *args, **kwargs: (
+            sent.append(clock.now) or [throttled, ok][len(sent) - 1])
+        with mock.patch('recleagueparser.rate_limit.time', clock):
+            pool = sessions.SessionPool()
+            adapter = pool.adapter('https://www.pahl.org')
+            response = adapter.send(mock.Mock(method='GET'))
+        self.assertIs(response, ok)
+        self.assertEqual(len(sent), 2)
+        self.assertGreaterEqual(sent[1] - sent[0], 2)
+        throttled.close.assert_called_once_with()
+        stats = pool.stats()['https://www.pahl.org']
+        self.assertEqual((stats.requests, stats.waited, stats.throttled),
+                         (2, 1, 1))
+        # urllib3 no longer retries statuses behind the limiter's back
+        self.assertFalse(adapter.max_retries.status_forcelist)
+        pool.close()
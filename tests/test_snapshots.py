@@ -0,0 +1,82 @@
+from recleagueparser.schedules import PointstreakSchedule
+from recleagueparser.schedules.game import Game
+from recleagueparser.player_stats.player import Player
+from recleagueparser.team_stats.team import Team
+from recleagueparser import snapshots as ss
+from recleagueparser import response_cache as rc
+from tests.test_schedule import mocked_get
+import datetime
+import tempfile
+import unittest
+import shutil
+import json
+import mock
+import os
+
+
+class TestSnapshots(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.store = ss.SnapshotStore(self.directory, max_age=3600)
+
+    def build(self, team_id=18):
+        return PointstreakSchedule(team_id, team_id, snapshots=self.store)
+
+    def test_records_round_trip(self):
+        game = Game('Sat Aug 15', '8:45 PM', 'Bears', '3', 'Wolves', '1',
+                    year='2020', location='Ice Rink', final=True)
+        restored = Game.from_record(json.loads(json.dumps(game.to_record())))
+        self.assertEqual(repr(restored), repr(game))
+        self.assertEqual(restored.date, game.date)
+        self.assertEqual(restored.full_gametime, game.full_gametime)
+        gametime = datetime.datetime(2020, 8, 15, 20, 45, 0, 1234)
+        game = Game.from_gametime(gametime, 'Bears', None, 'Wolves', None)
+        restored = Game.from_record(json.loads(json.dumps(game.to_record())))
+        self.assertEqual(restored.full_gametime, gametime)
+        player = Player('Jo', 9, 10, 5, 4, 1, 2)
+        team = Team('Bears', 10, 8, 5, 3)
+        self.assertEqual(ss.to_record(ss.from_record(Player, ss.to_record(
+            player))), ss.to_record(player))
+        self.assertEqual(ss.to_record(ss.from_record(Team, ss.to_record(
+            team))), ss.to_record(team))
+
+    def test_schedule_restored_without_fetching(self):
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get):
+            schedule = self.build()
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        rc.DEFAULT_CACHE.clear()
+
+        with mock.patch('recleagueparser.refreshable.get') as get:
+            restored = self.build()
+            self.assertEqual(restored.refresh_schedule(), rc.FETCH_HIT)
+        get.assert_not_called()
+        self.assertEqual(repr(restored), repr(schedule))
+        self.assertEqual(restored.last_refresh.replace(microsecond=0),
+                         schedule.last_refresh.replace(microsecond=0))
+
+        # Once the snapshot expires, the schedule is fetched again
+        restored.snapshot_expires = datetime.datetime.now()
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get) as get:
+            self.assertEqual(restored.refresh_schedule(), rc.FETCH_FULL)
+        get.assert_called_once()
+        self.assertIsNone(restored.snapshot_expires)
+        self.assertEqual(repr(restored), repr(schedule))
+
+    def test_other_versions_ignored(self):
+        with mock.patch('recleagueparser.refreshable.get',
+                        side_effect=mocked_get):
+            schedule = self.build(19)
+        path = self.store.path(schedule)
+        with open(path) as f:
+            snapshot = json.load(f)
+        snapshot['version'] = ss.SNAPSHOT_VERSION + 1
+        with open(path, 'w') as f:
+            json.dump(snapshot, f)
+        self.assertIsNone(self.store.load(schedule))
+        with open(path, 'w') as f:
+            f.write('{"truncated')
+        self.assertIsNone(self.store.load(schedule))
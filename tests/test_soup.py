@@ -0,0 +1,71 @@
+from recleagueparser import soup as rs
+import threading
+import unittest
+
+MOCK_HTML = '''
+<html>
+  <body>
+    <h2><a href="/team">home</a></h2>
+    <div class="nav"><table class="layout"><tr><td>nav</td></tr></table></div>
+    <table class="statTable sortable">
+      <tbody>
+        <tr><td>1</td>
+          <td><table class="inner"><tr><td>x</td></tr></table></td></tr>
+        <tr><td>2</td><td/></tr>
+      </tbody>
+    </table>
+    <table class="statTable"><tr><td>3</td></tr></table>
+  </body>
+</html>
+'''
+
+
+class TestPartialParse(unittest.TestCase):
+
+    def test_modes_find_the_same_tables(self):
+        target = ('table', {'class': 'statTable'})
+        expected = [str(t) for t in rs.parse_document(MOCK_HTML).find_all(
+            *target)]
+        for mode in [rs.PARSE_STRAINED, rs.PARSE_SLICED]:
+            soup = rs.parse_elements(MOCK_HTML, *target, mode=mode)
+            self.assertEqual([str(t) for t in soup.find_all(*target)],
+                             expected)
+
+    def test_slice_nested_elements(self):
+        slices = rs.slice_elements(MOCK_HTML, 'table',
+                                   {'class': 'statTable sortable'})
+        self.assertEqual(len(slices), 1)
+        self.assertIn('class="inner"', slices[0])
+        self.assertTrue(slices[0].endswith('</table>'))
+
+    def test_unclosed_falls_back(self):
+        broken = '<div class="list-group"><div>1</div>'
+        self.assertIsNone(rs.slice_elements(broken, 'div',
+                                            {'class': 'list-group'}))
+        soup = rs.parse_elements(broken, 'div', {'class': 'list-group'},
+                                 mode=rs.PARSE_SLICED)
+        self.assertIsNotNone(soup.find('div', {'class': 'list-group'}))
+
+    def test_missing_parser_falls_back(self):
+        self.assertEqual(rs.resolve_features('not-a-parser'),
+                         rs.DEFAULT_FEATURES)
+
+    def test_full_parse_reused(self):
+        self.assertIs(rs.parse_document(MOCK_HTML),
+                      rs.parse_document(MOCK_HTML))
+
+    def test_parsed_tree_shared_across_threads(self):
+        html_doc = MOCK_HTML + ' '
+        target = ('table', {'class': 'statTable'})
+        trees = []
+        threads = [threading.Thread(target=lambda: trees.append(
+            rs.parse_elements(html_doc, *target, mode=rs.PARSE_STRAINED)))
+            for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(set(id(tree) for tree in trees)), 1)
+        rs.cache_clear()
+        self.assertIsNot(rs.parse_elements(html_doc, *target,
+                                           mode=rs.PARSE_STRAINED), trees[0])